@@ -0,0 +1,38 @@
+"""
+Times dumping a large synthetic world, the one measured by bench_memory, in
+each of the dumper's formats, writing to a null device.
+
+    python -m benchmarks.bench_dumper [--places N] [--format NAME ...]
+"""
+
+import argparse
+import os
+from time import perf_counter
+
+from benchmarks.bench_memory import build_world
+from engine.dumper import FORMATS
+from engine.game import Game
+from engine.view import NullView
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, default=1_000_000)
+    parser.add_argument("--events-per-place", type=int, default=3)
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS))
+    args = parser.parse_args()
+
+    Game("Health", None, NullView())  # Sets the default attribute for events
+    started = perf_counter()
+    places, event_count = build_world(args.places, args.events_per_place)
+    print(f"{len(places)} places, {event_count} events built in {perf_counter() - started:.1f} s")
+
+    with open(os.devnull, "w", encoding="utf-8", buffering=1 << 20) as out:
+        for name in args.format:
+            started = perf_counter()
+            FORMATS[name](places[0], out)
+            print(f"{name:>6}: {perf_counter() - started:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
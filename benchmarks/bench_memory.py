@@ -0,0 +1,86 @@
+"""
+Measures the memory taken by a large synthetic world: a ring of places,
+each with a few events, the first of which has a chained and an “else”
+event, and an item in every tenth place. The defaults make 1M places and
+5M events.
+
+    python -m benchmarks.bench_memory [--places N] [--events-per-place N]
+"""
+
+import argparse
+import gc
+import resource
+import tracemalloc
+from time import perf_counter
+
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.transition import Transition
+from engine.view import NullView
+
+ATTRIBUTES = ("Health", "Luck", "Gold")
+
+
+def build_world(place_count: int, events_per_place: int) -> tuple[list[Place], int]:
+    "Returns the places and the number of events made."
+    places = []
+    event_count = 0
+    for n in range(place_count):
+        events = []
+        for e in range(events_per_place):
+            event = Event(0.1, f"Event {e} in place {n}.", {ATTRIBUTES[e % 3]: e - 2})
+            if e == 0:
+                event.chain(Event(0.5, f"Chained in place {n}.", 1))
+                event.add_else_events(Event(0.5, f"Else in place {n}.", -1))
+                event_count += 2
+            events.append(event)
+        event_count += len(events)
+        items = [InventoryItem(f"Item {n}", "Something to carry.")] if n % 10 == 0 else None
+        places.append(Place(f"Place {n}", events=events, inventory_items=items))
+    directions = ("north", "east")
+    for n, place in enumerate(places):
+        place.add_transitions(
+            Transition(places[(n + 1) % place_count], direction=directions[n % 2]), reverse=True
+        )
+    return places, event_count
+
+
+def max_rss_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, default=1_000_000)
+    parser.add_argument("--events-per-place", type=int, default=3,
+                        help="top-level events; two more hang off the first")
+    parser.add_argument("--trace", action="store_true",
+                        help="count allocations exactly with tracemalloc (slower)")
+    args = parser.parse_args()
+
+    Game("Health", None, NullView())  # Sets the default attribute for events
+    gc.collect()
+    rss_before = max_rss_bytes()
+    if args.trace:
+        tracemalloc.start()
+    started = perf_counter()
+    places, event_count = build_world(args.places, args.events_per_place)
+    elapsed = perf_counter() - started
+    if args.trace:
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        used = max_rss_bytes() - rss_before
+
+    objects = len(places) + event_count
+    print(f"{len(places)} places, {event_count} events built in {elapsed:.1f} s")
+    print(f"Memory: {used / 2**20:.1f} MiB ({'traced' if args.trace else 'peak RSS growth'})")
+    print(f"        {used / len(places):.0f} bytes per place, events included")
+    print(f"        {used / objects:.0f} bytes per place or event")
+    print(f"Peak RSS: {max_rss_bytes() / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the compiled event programs used by Place.process_events with
+processing each event recursively through Event.process, and with programs
+that roll for every event rather than scheduling the unlikely ones.
+
+    python -m benchmarks.bench_process_events [--events N] [--turns N] [--rarity P]
+"""
+
+import argparse
+import random
+from timeit import repeat
+
+from engine import event_program
+from engine.command import Command
+from engine.event import Event
+from engine.game import Game
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.view import NullView
+
+
+def make_game() -> Game:
+    game = Game("Health", None, NullView())
+    game.attributes = PlayerAttributes({"Health": 100})
+    return game
+
+
+def make_event_heavy_place(event_count: int, seed: int = 0, rarity: float = 0.2) -> Place:
+    """
+    A room with many events, each less likely than `rarity`, a quarter of
+    which have chained and “else” events.
+    """
+    rnd = random.Random(seed)
+    place = Place("Busy Room")
+    for i in range(event_count):
+        event = Event(rnd.random() * rarity, f"Event {i}", rnd.randint(-5, 5), max_occurrences=10**9)
+        if i % 4 == 0:
+            event.chain(Event(0.5, f"Chained {i}", {"Luck": 1}, max_occurrences=10**9))
+            event.add_else_events(Event(0.1, f"Else {i}", -1, max_occurrences=10**9))
+        place.add_events(event)
+    return place
+
+
+def best_time(run, turns: int) -> float:
+    "The quickest of five timings of `turns` turns, as seconds per turn."
+    return min(repeat(run, number=turns, repeat=5)) / turns
+
+
+def process_recursively(place: Place, game: Game):
+    "How Place.process_events worked before events were compiled."
+    for event in place.events:
+        if isinstance(event, Command):
+            continue
+        game.attributes += event.process(game)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=500, help="turns in each of five timings")
+    parser.add_argument("--rarity", type=float, default=0.2, help="the events' highest probability")
+    args = parser.parse_args()
+
+    game = make_game()
+    place = make_event_heavy_place(args.events, rarity=args.rarity)
+    place.process_events(game)  # Compile outside the timing
+
+    recursive = best_time(lambda: process_recursively(place, game), args.turns)
+    compiled = best_time(lambda: place.process_events(game), args.turns)
+
+    # The same place again, with a program that schedules nothing
+    schedule_below, event_program.SCHEDULE_BELOW = event_program.SCHEDULE_BELOW, 0
+    try:
+        unscheduled_place = make_event_heavy_place(args.events, rarity=args.rarity)
+        unscheduled_place.process_events(game)
+    finally:
+        event_program.SCHEDULE_BELOW = schedule_below
+    unscheduled = best_time(lambda: unscheduled_place.process_events(game), args.turns)
+
+    print(f"{args.events} events per place, each less likely than {args.rarity}, {args.turns} turns")
+    print(f"Event.process recursion: {recursive * 1e6:8.1f} µs/turn")
+    print(f"Every event rolled for:  {unscheduled * 1e6:8.1f} µs/turn")
+    print(f"Compiled program:        {compiled * 1e6:8.1f} µs/turn")
+    print(f"Speedup:                 {recursive / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures how the engine scales with the size of the world: for generated
+worlds of growing size, the time to build one, the suite's large-world
+benchmarks, and the time per turn of simulated play. Prints CSV, one row
+for each size, for plotting.
+
+    python -m benchmarks.bench_scaling [--places N ...] [--branching N] [--runs N]
+"""
+
+import argparse
+import csv
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+
+from benchmarks import suite
+from engine.simulator import simulate
+from engine.world_generator import WorldSpec, generate_world, generated_game
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, nargs="+", default=[1000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--branching", type=int, default=WorldSpec.branching)
+    parser.add_argument("--events-per-place", type=int, default=WorldSpec.events_per_place)
+    parser.add_argument("--runs", type=int, default=20, help="simulated playthroughs in each world")
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--trace", action="store_true",
+                        help="count the world's memory exactly with tracemalloc (slower)")
+    args = parser.parse_args()
+
+    names = [name for name in suite.BENCHMARKS if name.endswith("[large]") and not name.startswith("world.")]
+    out = csv.writer(sys.stdout)
+    out.writerow(["places", "build_s", "bytes_per_place", *(f"{name}_us" for name in names), "turn_us"])
+    for count in args.places:
+        spec = WorldSpec(places=count, branching=args.branching, events_per_place=args.events_per_place)
+        gc.collect()
+        if args.trace:
+            tracemalloc.start()
+        started = perf_counter()
+        places = generate_world(spec)
+        built = perf_counter() - started
+        if args.trace:
+            per_place = tracemalloc.get_traced_memory()[0] / count
+            tracemalloc.stop()
+        else:
+            per_place = float("nan")
+
+        game_class = suite.GAMES["large"] = generated_game(spec)
+        game_class._world = places[0]  # Rather than building it again
+        timings = suite.run(names, repeat=5, seconds=0.05)
+
+        started = perf_counter()
+        result = simulate(game_class, args.runs, max_turns=args.max_turns, workers=1, seed=1)
+        turns = sum(turns * runs for turns, runs in result.turns.items())
+        per_turn = (perf_counter() - started) / max(turns, 1)
+
+        out.writerow([
+            count, f"{built:.3f}", f"{per_place:.0f}",
+            *(f"{timings[name]:.2f}" for name in names), f"{per_turn * 1e6:.1f}",
+        ])
+        sys.stdout.flush()
+        del places, game_class._world
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Times saving and restoring session snapshots in a large world, after a
+player has wandered through part of it.
+
+    python -m benchmarks.bench_snapshot [--places N] [--turns N]
+"""
+
+import argparse
+from timeit import timeit
+
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.rng import Rng
+from engine.snapshot import catalog_for, load_snapshot, save_snapshot
+from engine.strategies import RandomInputStrategy
+from engine.view import NullView
+
+
+class LargeGame(Game):
+    "A ring of places, each with a few one-off events and an item or two."
+    place_count = 10_000
+
+    def __init__(self, input_strategy=None, view=None, rng=None):
+        super().__init__("Health", input_strategy, view or NullView(), rng)
+        self.attributes = PlayerAttributes({"Health": 10**9})
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        places = []
+        for n in range(self.place_count):
+            place = Place(f"Room {n}", events=[
+                Event(0.5, f"Something happens in room {n}.", -1, max_occurrences=3)
+                for _ in range(5)
+            ])
+            for i in range(n % 3):
+                place.add_item(InventoryItem(f"Thing {n}.{i}", "A thing."))
+            places.append(place)
+        for here, there in zip(places, places[1:] + places[:1]):
+            here.add_transitions(there, reverse=True)
+        return places[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, default=10_000)
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    LargeGame.place_count = args.places
+    game = LargeGame(RandomInputStrategy(), rng=Rng(1))
+    catalog_for(game)  # Number the world outside the timing
+    strategy = game.input_strategy
+    for _ in range(args.turns):
+        game.location.process_events(game)
+        command = strategy.get_action(game, game.view)
+        if command:
+            command.execute(game)
+
+    delta = save_snapshot(game)
+    full = save_snapshot(game, delta=False)
+    save = timeit(lambda: save_snapshot(game), number=args.repeat) / args.repeat
+    load = timeit(lambda: load_snapshot(LargeGame(), delta), number=args.repeat) / args.repeat
+
+    print(f"{args.places} places, {len(catalog_for(game).events)} events, {args.turns} turns played")
+    print(f"Changed: {len(game.state.items)} places' items, {len(game.state.remaining)} events")
+    print(f"Delta snapshot: {len(delta):8} bytes, save {save * 1e6:7.1f} µs, load {load * 1e6:7.1f} µs")
+    print(f"Full snapshot:  {len(full):8} bytes")
+
+
+if __name__ == "__main__":
+    main()
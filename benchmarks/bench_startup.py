@@ -0,0 +1,68 @@
+"""
+Times a cold start of the ship game: a new interpreter importing it and
+rendering the first scene. Also lists the slowest modules it imports, as
+reported by python -X importtime.
+
+    python -m benchmarks.bench_startup [--repeat N] [--top N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+FIRST_SCENE = """
+import io
+from engine.strategies import CliInputStrategy
+from engine.view import CliView
+from ship_game import ShipGame
+view = CliView(io.StringIO())
+game = ShipGame(CliInputStrategy(), view)
+game._render_full_scene()
+view.flush()
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    "The self and cumulative microseconds of each module imported by importing `module`, with its name."
+    times = []
+    for line in run("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self" not in line:
+            own, cumulative, name = line.removeprefix("import time:").split("|")
+            times.append((int(own), int(cumulative), name.strip()))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10, help="the number of slowest modules to list")
+    args = parser.parse_args()
+
+    bare, first_scene = [], []
+    for _ in range(args.repeat):
+        started = perf_counter()
+        run("-c", "pass")
+        bare.append(perf_counter() - started)
+        started = perf_counter()
+        run("-c", FIRST_SCENE)
+        first_scene.append(perf_counter() - started)
+    print(f"Interpreter alone:      {min(bare) * 1e3:6.1f} ms")
+    print(f"To the first scene:     {min(first_scene) * 1e3:6.1f} ms")
+    print(f"Of which the game:      {(min(first_scene) - min(bare)) * 1e3:6.1f} ms")
+
+    times = import_times("ship_game")
+    print(f"\n{len(times)} modules imported by ship_game; the slowest, by their own import time:")
+    for own, cumulative, name in sorted(times, reverse=True)[:args.top]:
+        print(f"{own / 1e3:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Times finding routes in a large ring of places: building a route table for
+a destination, then looking up the exits to take once it is built.
+
+    python -m benchmarks.bench_travel [--places N] [--steps N]
+"""
+
+import argparse
+from time import perf_counter
+from timeit import timeit
+
+from benchmarks.bench_snapshot import LargeGame
+from engine.routes import routes_for
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, default=100_000)
+    parser.add_argument("--steps", type=int, default=10, help="how far away the destination is")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    LargeGame.place_count = args.places
+    game = LargeGame()
+    routes = routes_for(game)
+    started = perf_counter()
+    destination = routes.find(f"Room {args.steps}")
+    numbered = perf_counter() - started
+    started = perf_counter()
+    route = routes.route(game, destination)
+    first = perf_counter() - started
+    lookup = timeit(lambda: routes.next_exits(game, destination), number=args.repeat) / args.repeat
+    whole = timeit(lambda: routes.route(game, destination), number=args.repeat) / args.repeat
+
+    print(f"{args.places} places numbered in {numbered * 1e3:.0f} ms")
+    print(f"First route, {len(route)} steps, building its table: {first * 1e3:.1f} ms")
+    print(f"Cached table lookup: {lookup * 1e6:.2f} µs")
+    print(f"Cached route of {len(route)} steps: {whole * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures the output of each view while a random player plays the ship game:
+the writes and bytes per turn, the time per turn, and the time to render a
+full scene. ScreenView draws an 80 by 24 screen.
+
+    python -m benchmarks.bench_views [--turns N]
+"""
+
+import argparse
+import io
+from time import perf_counter
+
+from engine.rng import Rng
+from engine.screen import ScreenView
+from engine.strategies import RandomInputStrategy
+from engine.view import CliView, ColoramaView, MenuView, NullView
+from ship_game import ShipGame
+
+
+class CountingSink(io.TextIOBase):
+    "A stream that counts what is written to it, and keeps none of it."
+
+    def __init__(self):
+        self.writes = 0
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        self.bytes += len(text.encode())
+        return len(text)
+
+
+def measure(view_class, turns: int) -> tuple[float, float, float, float]:
+    "Returns the writes and bytes per turn, and the µs per turn and per full render."
+    sink = CountingSink()
+    if view_class is NullView:
+        view = NullView()
+    elif view_class is ScreenView:
+        view = ScreenView(sink, size=(80, 24))
+    else:
+        view = view_class(sink)
+    game = ShipGame(RandomInputStrategy(), view, rng=Rng(1))
+    game.attributes.attribs["Health"] = 10**9  # Play on for every turn
+    started = perf_counter()
+    for _ in range(turns):
+        game._process_events()
+        command = game.input_strategy.get_action(game, view)
+        view.flush()
+        game._apply(command)
+    per_turn = (perf_counter() - started) / turns
+    writes, written = sink.writes / turns, sink.bytes / turns
+
+    started = perf_counter()
+    for _ in range(turns):
+        game._render_full_scene()
+        view.flush()
+    per_render = (perf_counter() - started) / turns
+    return writes, written, per_turn * 1e6, per_render * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'':14}{'writes/turn':>12}{'bytes/turn':>12}{'µs/turn':>10}{'µs/render':>11}")
+    for view_class in (CliView, MenuView, ColoramaView, ScreenView, NullView):
+        writes, written, per_turn, per_render = measure(view_class, args.turns)
+        print(f"{view_class.__name__:14}{writes:12.1f}{written:12.1f}{per_turn:10.1f}{per_render:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares starting a worker on a large world built in Python with starting
+it on the same world compiled to an image: the time to open it, to reach a
+few hundred places, and the private memory each worker process takes.
+
+    python -m benchmarks.bench_world_image [--places N] [--workers N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from benchmarks.bench_memory import build_world
+from engine.game import Game
+from engine.view import NullView
+from engine.world_image import compile_world, open_world
+
+WORKER = """
+import sys
+from time import perf_counter
+from benchmarks.bench_memory import build_world
+from engine.game import Game
+from engine.view import NullView
+from engine.world_image import open_world
+
+def private_memory():
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) * 1024 for line in status if line.startswith("RssAnon"))
+
+Game("Health", None, NullView())
+before = private_memory()
+started = perf_counter()
+if sys.argv[1] == "image":
+    place = open_world(sys.argv[2])
+else:
+    place = build_world(int(sys.argv[2]), 3)[0][0]
+opened = perf_counter()
+for _ in range(int(sys.argv[3])):
+    place.events
+    place = place.transitions[0].place
+walked = perf_counter()
+print(opened - started, walked - opened, private_memory() - before)
+"""
+
+
+def run_workers(count: int, *args) -> list[tuple[float, float, int]]:
+    "Starts `count` worker processes at once, returning each one's timings and memory."
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    workers = [
+        subprocess.Popen([sys.executable, "-c", WORKER, *map(str, args)], stdout=subprocess.PIPE, env=env, text=True)
+        for _ in range(count)
+    ]
+    results = []
+    for worker in workers:
+        opened, walked, grown = worker.communicate()[0].split()
+        results.append((float(opened), float(walked), int(grown)))
+    return results
+
+
+def report(label: str, results: list[tuple[float, float, int]]):
+    opened = max(r[0] for r in results)
+    walked = max(r[1] for r in results)
+    grown = sum(r[2] for r in results) / len(results)
+    print(f"{label:>7}: open {opened * 1e3:9.2f} ms, walk {walked * 1e3:7.2f} ms, "
+          f"{grown / 2**20:7.1f} MiB private memory per worker")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--places", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--walk", type=int, default=500, help="places each worker reaches")
+    args = parser.parse_args()
+
+    Game("Health", None, NullView())  # Sets the default attribute for events
+    places, _ = build_world(args.places, 3)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "world.img")
+        started = perf_counter()
+        compile_world(places[0], path)
+        compiled = perf_counter() - started
+        del places
+
+        print(f"{args.places} places compiled in {compiled:.1f} s to {os.path.getsize(path) / 2**20:.1f} MiB")
+        started = perf_counter()
+        open_world(path)
+        print(f"Opened in this process in {(perf_counter() - started) * 1e6:.0f} µs")
+        report("Python", run_workers(args.workers, "python", args.places, args.walk))
+        report("Image", run_workers(args.workers, "image", path, args.walk))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Times the engine's hot paths in the ship game, in Young Sheldon and in a
+large world from the world generator, and compares each timing with the baseline saved
+for it, failing if one has become slower than the threshold allows.
+
+The benchmarks time:
+- parsing typed commands with CliInputStrategy.get_action;
+- building menus with MenuInputStrategy, and asking for a cached one;
+- Place.process_events in every place of the world, and the recursive
+  Event.process it replaced;
+- Game._render_full_scene with each view, flushed into a sink;
+- generating the large world, linking its places with add_transition.
+
+Each is timed several times, and the quickest timing is kept, as the others
+are slowed by whatever else the machine was doing. Baselines are only
+comparable on the machine they were saved on, so save them again after
+moving to another one, or after making something faster on purpose:
+
+    python -m benchmarks.suite [--save] [--threshold FRACTION] [--only TEXT ...]
+
+The exit status is 1 if any benchmark is slower than its baseline by more
+than the threshold, so the suite can gate a merge.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+from collections.abc import Callable
+from itertools import cycle
+from time import perf_counter
+
+from benchmarks.bench_process_events import process_recursively
+from benchmarks.bench_views import CountingSink
+from engine.game import Game
+from engine.place import Place
+from engine.rng import Rng
+from engine.screen import ScreenView
+from engine.snapshot import catalog_for
+from engine.strategies import CliInputStrategy, MenuInputStrategy
+from engine.view import CliView, ColoramaView, MenuView, NullView
+from engine.world_generator import WorldSpec, generate_world, generated_game
+from ship_game import ShipGame
+from young_sheldon_game import YoungSheldon
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# How much slower than its baseline a benchmark may be before it fails
+THRESHOLD = 0.25
+
+# Places in the large world
+LARGE_PLACES = 10_000
+
+GAMES: dict[str, type[Game]] = {
+    "ship": ShipGame,
+    "sheldon": YoungSheldon,
+    "large": generated_game(WorldSpec(places=LARGE_PLACES)),
+}
+
+# Each benchmark's setup, which returns the operation to time
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    "Registers a benchmark's setup under `name`."
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+class LineView(NullView):
+    "A view the player types the same few lines into, over and over."
+    def __init__(self, lines: list[str]):
+        self.lines = cycle(lines)
+
+    def get_raw_command(self) -> str:
+        return next(self.lines)
+
+
+class FirstChoiceView(NullView):
+    "A view the player always picks the first command of the menu in."
+    def get_menu_choice(self, choices):
+        return choices[0]
+
+
+def make_game(name: str, view=None) -> Game:
+    game = GAMES[name](None, view or NullView(), rng=Rng(1))
+    game.attributes.attribs[game._attribute_name_for_suspense] = 10**9  # Never lost while timed
+    return game
+
+
+def typed_lines(game: Game) -> list[str]:
+    "Lines that name the exits, items and commands of the game's starting place, and some that name nothing."
+    location = game.location
+    lines = ["look", "inventory", "quit", "take the moon", "dance"]
+    lines += [f"go {transition.place.name.lower()}" for transition in location.transitions]
+    lines += [transition.direction for transition in location.transitions if transition.direction]
+    lines += [f"take {item.name}" for item in game.state.items_in(location)]
+    lines += [command.description.lower() for command in location.get_selectable_commands()]
+    return lines
+
+
+def every_place(game: Game) -> list[Place]:
+    return catalog_for(game).places
+
+
+for _name in GAMES:
+    @benchmark(f"cli.get_action[{_name}]")
+    def _cli(name=_name):
+        game = make_game(name)
+        view = LineView(typed_lines(game))
+        strategy = CliInputStrategy()
+        return lambda: strategy.get_action(game, view)
+
+    @benchmark(f"menu.build[{_name}]")
+    def _menu_build(name=_name):
+        game = make_game(name)
+        strategy = MenuInputStrategy()
+        places = cycle(every_place(game))
+        inventory = game.inventory
+
+        def build():
+            place = next(places)
+            strategy._build_menu(place, game.state.items_in(place), inventory)
+        return build
+
+    @benchmark(f"menu.get_action[{_name}]")
+    def _menu_cached(name=_name):
+        game = make_game(name)
+        view = FirstChoiceView()
+        strategy = MenuInputStrategy()
+        return lambda: strategy.get_action(game, view)
+
+    @benchmark(f"events.process_events[{_name}]")
+    def _events(name=_name):
+        game = make_game(name)
+        places = every_place(game)
+        for place in places:  # Compiles their programs outside the timing
+            place.process_events(game)
+        places = cycle(places)
+        return lambda: next(places).process_events(game)
+
+    @benchmark(f"events.recursive[{_name}]")
+    def _events_recursive(name=_name):
+        game = make_game(name)
+        places = cycle(every_place(game))
+        return lambda: process_recursively(next(places), game)
+
+for _view_class in (CliView, MenuView, ColoramaView, ScreenView):
+    @benchmark(f"render[{_view_class.__name__}]")
+    def _render(view_class=_view_class):
+        sink = CountingSink()
+        view = ScreenView(sink, size=(80, 24)) if view_class is ScreenView else view_class(sink)
+        game = make_game("ship", view)
+
+        def render():
+            game._render_full_scene()
+            view.flush()
+        return render
+
+
+@benchmark("world.build[large]")
+def _world_build():
+    spec = GAMES["large"].spec
+    return lambda: generate_world(spec)
+
+
+def best_time(operation: Callable[[], object], repeat: int, seconds: float) -> float:
+    """
+    The quickest of `repeat` timings of `operation`, in seconds per call.
+    Each timing calls it as many times as take about `seconds`. As with
+    timeit, the garbage collector is off while timing, as its passes take
+    longer the more the benchmarks before this one left alive.
+    """
+    gc.collect()
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _best_time(operation, repeat, seconds)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _best_time(operation: Callable[[], object], repeat: int, seconds: float) -> float:
+    number = 1
+    while True:
+        started = perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = perf_counter() - started
+        if elapsed >= seconds / 4:
+            break
+        number *= 4
+    number = max(1, round(number * seconds / elapsed))
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        for _ in range(number):
+            operation()
+        timings.append((perf_counter() - started) / number)
+    return min(timings)
+
+
+def run(names: list[str], repeat: int, seconds: float) -> dict[str, float]:
+    "Times the named benchmarks, returning the microseconds each call took."
+    timings = {}
+    for name in names:
+        operation = BENCHMARKS[name]()
+        operation()  # Builds anything cached outside the timing
+        timings[name] = best_time(operation, repeat, seconds) * 1e6
+    return timings
+
+
+def regressions(timings: dict[str, float], baselines: dict[str, float], threshold: float) -> list[str]:
+    "The names of the benchmarks slower than their baselines by more than `threshold`. New ones have none."
+    return [
+        name for name, now in timings.items()
+        if name in baselines and now > baselines[name] * (1 + threshold)
+    ]
+
+
+def report(timings: dict[str, float], baselines: dict[str, float], slower: list[str]):
+    print(f"{'':34}{'baseline µs':>12}{'now µs':>12}{'change':>9}")
+    for name, now in timings.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:34}{'-':>12}{now:12.2f}{'new':>9}")
+        else:
+            flag = "  SLOWER" if name in slower else ""
+            print(f"{name:34}{baseline:12.2f}{now:12.2f}{now / baseline - 1:+9.0%}{flag}")
+
+
+def load_baselines(path: str) -> dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baselines(path: str, timings: dict[str, float]):
+    "Adds the timings to the baselines in `path`, replacing those with the same names."
+    baselines = load_baselines(path)
+    baselines.update({name: round(now, 3) for name, now in timings.items()})
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(baselines.items())), file, indent=2)
+        file.write("\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="save the timings as the new baselines")
+    parser.add_argument("--baselines", default=BASELINES, help="the baselines file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="how much slower than its baseline a benchmark may be, as a fraction")
+    parser.add_argument("--only", nargs="+", metavar="TEXT", help="run the benchmarks whose names contain TEXT")
+    parser.add_argument("--repeat", type=int, default=5, help="timings of each benchmark")
+    parser.add_argument("--seconds", type=float, default=0.05, help="the length of each timing")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="times to time a benchmark again, when it seems slower, before failing")
+    parser.add_argument("--places", type=int, default=LARGE_PLACES, help="places in the large world")
+    args = parser.parse_args(argv)
+
+    GAMES["large"] = generated_game(WorldSpec(places=args.places))
+    names = [
+        name for name in BENCHMARKS
+        if not args.only or any(text in name for text in args.only)
+    ]
+    timings = run(names, args.repeat, args.seconds)
+    if args.save:
+        save_baselines(args.baselines, timings)
+        print(f"Saved {len(timings)} baselines to {args.baselines}")
+        return 0
+
+    baselines = load_baselines(args.baselines)
+    slower = regressions(timings, baselines, args.threshold)
+    for _ in range(args.retries):
+        if not slower:
+            break
+        # A busy machine slows a timing more often than a change does
+        for name, now in run(slower, args.repeat, args.seconds).items():
+            timings[name] = min(timings[name], now)
+        slower = regressions(timings, baselines, args.threshold)
+    report(timings, baselines, slower)
+    if slower:
+        print(f"{len(slower)} slower than their baselines by more than {args.threshold:.0%}: {', '.join(slower)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
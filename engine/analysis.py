@@ -0,0 +1,325 @@
+"""
+Checks a world's map for places players can't reach, can't leave and keys
+they can never find.
+
+``analyze`` walks every exit once and returns a ``WorldReport`` with:
+- the places reachable from the start along any exits, and those reachable
+  in play, collecting the keys found on the way;
+- the strongly connected components of the map;
+- one-way exits, which have no exit leading straight back, as made
+  without ``reverse=True``;
+- trapping places, reached in play but with no way back to the start;
+- for each key, the region that can only be entered with it, including
+  regions behind other keys within it;
+- keys that no player can obtain, from a place or an event.
+
+Exits with conditions are taken to be open, since conditions can't be
+checked without playing. From the command line, for use in CI::
+
+    python -m engine.analysis worlds/ship.json
+    python -m engine.analysis ship_game:ShipGame --json
+
+The command exits with status 1 if any place is unreachable in play or any
+key can't be obtained.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from .event import Event
+
+if TYPE_CHECKING:
+    from .inventory_item import InventoryItem
+    from .place import Place
+
+
+class WorldGraph:
+    """
+    A world's places, numbered in the order they are reached from the start,
+    which is 0, and its exits as lists of ``(place, key)`` pairs. Keys are
+    numbered separately, and exits without one have the key ``None``.
+
+    :param start: the place where players start
+    :param others: places that may not be linked to the rest, such as every
+        place in a world file
+    """
+
+    def __init__(self, start: Place, others: Iterable[Place] = ()):
+        self.places: list[Place] = []
+        self.exits: list[list[tuple[int, int | None]]] = []
+        self.keys: list[InventoryItem] = []
+        # Keyed by id(), as items compare by value
+        self.key_ids: dict[int, int] = {}
+        self.numbers: dict[int, int] = {}
+        # The items to be found in each place, in it or from its events
+        self.items: list[list[InventoryItem]] = []
+
+        for root in [start, *others]:
+            self._number(root)
+            while len(self.exits) < len(self.places):  # Places are added as they are reached
+                self._add(self.places[len(self.exits)])
+
+    def _number(self, place: Place) -> int:
+        number = self.numbers.get(id(place))
+        if number is None:
+            number = self.numbers[id(place)] = len(self.places)
+            self.places.append(place)
+        return number
+
+    def _add(self, place: Place):
+        exits = []
+        for transition in place.transitions:
+            key = None
+            if transition.key is not None:
+                key = self.key_ids.get(id(transition.key))
+                if key is None:
+                    key = self.key_ids[id(transition.key)] = len(self.keys)
+                    self.keys.append(transition.key)
+            exits.append((self._number(transition.place), key))
+        self.exits.append(exits)
+
+        items = list(place.inventory_items)
+        stack = [e for e in place.events if isinstance(e, Event)]
+        while stack:
+            event = stack.pop()
+            if event.inventory_items:
+                items.extend(event.inventory_items)
+            if event.chained_events:
+                stack.extend(event.chained_events)
+            if event.else_events:
+                stack.extend(event.else_events)
+        self.items.append(items)
+
+    def reachable(self, keys: Iterable[int] | None = None) -> set[int]:
+        """
+        The places reachable from the start.
+
+        :param keys: if given, exits needing a key are only taken if it is one of these
+        """
+        keys = None if keys is None else set(keys)
+        seen = {0}
+        queue = deque([0])
+        while queue:
+            for target, key in self.exits[queue.popleft()]:
+                if target not in seen and (key is None or keys is None or key in keys):
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def playable(self) -> tuple[set[int], set[int]]:
+        """
+        The places a player can reach from the start, picking up every item
+        they find, and the keys they find on the way. Each locked exit is
+        set aside until its key is found.
+        """
+        seen = {0}
+        queue = deque([0])
+        found: set[int] = set()
+        waiting: dict[int, list[int]] = {}  # Places behind each key not yet found
+        while queue:
+            place = queue.popleft()
+            for item in self.items[place]:
+                key = self.key_ids.get(id(item))
+                if key is not None and key not in found:
+                    found.add(key)
+                    for target in waiting.pop(key, ()):
+                        if target not in seen:
+                            seen.add(target)
+                            queue.append(target)
+            for target, key in self.exits[place]:
+                if target in seen:
+                    continue
+                if key is None or key in found:
+                    seen.add(target)
+                    queue.append(target)
+                else:
+                    waiting.setdefault(key, []).append(target)
+        return seen, found
+
+    def components(self) -> list[list[int]]:
+        "The strongly connected components, by Tarjan's algorithm without recursion."
+        index = [-1] * len(self.places)
+        low = [0] * len(self.places)
+        on_stack = [False] * len(self.places)
+        stack: list[int] = []
+        components = []
+        counter = 0
+        for root in range(len(self.places)):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]  # Each place being visited and the next of its exits to follow
+            while work:
+                place, next_exit = work.pop()
+                if next_exit == 0:
+                    index[place] = low[place] = counter
+                    counter += 1
+                    stack.append(place)
+                    on_stack[place] = True
+                exits = self.exits[place]
+                while next_exit < len(exits):
+                    target = exits[next_exit][0]
+                    next_exit += 1
+                    if index[target] == -1:
+                        work.append((place, next_exit))
+                        work.append((target, 0))
+                        break
+                    if on_stack[target]:
+                        low[place] = min(low[place], index[target])
+                else:
+                    if low[place] == index[place]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == place:
+                                break
+                        components.append(component)
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[place])
+        return components
+
+    def gated_regions(self) -> dict[int, list[int]]:
+        """
+        The places behind each key: those that can't be reached from the
+        start without passing through an exit needing it.
+
+        Places reachable with no keys at all are found once. For each key,
+        only the rest of the map is walked again, from the locked exits out
+        of that free part, so in a map where most places are free this takes
+        little more than one walk in all.
+        """
+        free = self.reachable(keys=())
+        frontier: list[tuple[int, int]] = []  # Locked exits out of the free part, to other places
+        for place in free:
+            frontier.extend((target, key) for target, key in self.exits[place] if target not in free)
+        locked = self.reachable() - free
+        regions = {}
+        for key in range(len(self.keys)):
+            seen = {target for target, k in frontier if k != key}
+            queue = deque(seen)
+            while queue:
+                for target, k in self.exits[queue.popleft()]:
+                    if k != key and target not in seen and target not in free:
+                        seen.add(target)
+                        queue.append(target)
+            region = locked - seen
+            if region:
+                regions[key] = sorted(region)
+        return regions
+
+    def leading_to_start(self) -> set[int]:
+        "The places from which the start can be reached."
+        entrances: list[list[int]] = [[] for _ in self.places]
+        for place, exits in enumerate(self.exits):
+            for target, _ in exits:
+                entrances[target].append(place)
+        seen = {0}
+        queue = deque([0])
+        while queue:
+            for source in entrances[queue.popleft()]:
+                if source not in seen:
+                    seen.add(source)
+                    queue.append(source)
+        return seen
+
+
+@dataclass
+class WorldReport:
+    "What ``analyze`` found, with places and keys given by name."
+
+    places: int
+    unreachable: list[str] = field(default_factory=list)
+    unreachable_in_play: list[str] = field(default_factory=list)
+    components: int = 0
+    largest_component: int = 0
+    one_way_exits: list[tuple[str, str]] = field(default_factory=list)
+    trapping: list[str] = field(default_factory=list)
+    gated_regions: dict[str, list[str]] = field(default_factory=dict)
+    unobtainable_keys: list[str] = field(default_factory=list)
+
+    @property
+    def problems(self) -> list[str]:
+        "Findings that make a world unfinishable: places no player can reach and keys none can get."
+        return (
+            [f"Place {name!r} can't be reached" for name in self.unreachable_in_play]
+            + [f"Key {name!r} can't be obtained" for name in self.unobtainable_keys]
+        )
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.places} places, {self.components} strongly connected components"
+            f" (the largest has {self.largest_component} places)",
+            f"Unreachable: {len(self.unreachable)}; unreachable in play: {len(self.unreachable_in_play)}",
+            f"One-way exits: {len(self.one_way_exits)}; trapping places: {len(self.trapping)}",
+        ]
+        lines += [f"Behind {key}: {len(region)} places" for key, region in self.gated_regions.items()]
+        lines += self.problems
+        return "\n".join(lines)
+
+
+def analyze(start: Place, others: Iterable[Place] = ()) -> WorldReport:
+    """
+    Analyzes the world reachable from `start`, along with any `others`, which
+    may not be reachable.
+    """
+    graph = WorldGraph(start, others)
+    names = [place.name for place in graph.places]
+    reachable = graph.reachable()
+    playable, found = graph.playable()
+
+    one_way = []
+    exits_from = [{target for target, _ in exits} for exits in graph.exits]
+    for place, targets in enumerate(exits_from):
+        one_way += [(names[place], names[t]) for t in targets if place not in exits_from[t] and t != place]
+
+    regions = {
+        graph.keys[key].name: sorted(names[p] for p in region) for key, region in graph.gated_regions().items()
+    }
+
+    components = graph.components()
+    back = graph.leading_to_start()
+    return WorldReport(
+        places=len(names),
+        unreachable=[names[p] for p in range(len(names)) if p not in reachable],
+        unreachable_in_play=[names[p] for p in range(len(names)) if p not in playable],
+        components=len(components),
+        largest_component=max(map(len, components)),
+        one_way_exits=one_way,
+        trapping=[names[p] for p in sorted(playable - back)],
+        gated_regions=regions,
+        unobtainable_keys=[item.name for key, item in enumerate(graph.keys) if key not in found],
+    )
+
+
+def main(argv: list[str] | None = None):
+    from .simulator import load_game_class
+    from .view import NullView
+    from .world_file import WorldLoader
+
+    parser = argparse.ArgumentParser(description="Check a world for unreachable places and missing keys.")
+    parser.add_argument("world", help="a world file, or a Game subclass as module:ClassName")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.world):
+        with open(args.world, encoding="utf-8") as file:
+            loader = WorldLoader(json.load(file))
+        report = analyze(loader.start, [loader.place(name) for name in loader.place_names])
+    else:
+        report = analyze(load_game_class(args.world)(None, NullView()).shared_world())
+
+    print(json.dumps(report.__dict__, indent=2) if args.json else report)
+    sys.exit(1 if report.problems else 0)
+
+
+if __name__ == "__main__":
+    main()
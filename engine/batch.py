@@ -0,0 +1,184 @@
+"""
+Vectorized evaluation of a place's events for a whole batch of sessions.
+
+A place's events, including chained and “else” events, are compiled once
+into arrays. Each turn then draws all the random numbers for the batch at
+once and decides which events occur in every session with array operations,
+following the same rules as ``Event.process``. The sessions' attributes
+are kept as one array, laid out by the game's attribute schema, and a turn's
+changes are added to it with one vector add. Requires NumPy.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from .command import Command
+from .event import Event
+from .place import Place
+from .player_attributes import AttributeSchema, PlayerAttributes
+
+
+class BatchEvents:
+    """
+    A place's event tree in array form.
+
+    Events are numbered in the order ``Event.process`` would consider them:
+    each event is followed by its chained events, then its “else” events.
+
+    :param events: the top-level events; commands are ignored
+    :param schema: the attribute schema to lay the changes out by, such as
+        the game's ``attribute_schema``; one of the batch's own if not given
+    """
+
+    def __init__(self, events: Iterable[Event | Command], schema: AttributeSchema | None = None):
+        self.events: list[Event] = []  # One per node of the tree
+        parents: list[int] = []
+        is_else: list[bool] = []
+
+        stack = [(event, -1, False) for event in reversed(list(events))
+                 if not isinstance(event, Command)]
+        while stack:
+            event, parent, else_branch = stack.pop()
+            node = len(self.events)
+            self.events.append(event)
+            parents.append(parent)
+            is_else.append(else_branch)
+            # Pushed in reverse so chained events come off the stack first
+            stack.extend((e, node, True) for e in reversed(event.else_events))
+            stack.extend((e, node, False) for e in reversed(event.chained_events))
+
+        # The same event may appear in several branches; they share its occurrences.
+        # Events compare by value, so they are told apart by identity.
+        by_id = {id(event): event for event in self.events}
+        self.unique_events: list[Event] = list(by_id.values())
+        slot_of = {event_id: slot for slot, event_id in enumerate(by_id)}
+        self.slots = np.array([slot_of[id(e)] for e in self.events], dtype=np.intp)
+
+        self.parents = np.array(parents, dtype=np.intp)
+        self.is_else = np.array(is_else, dtype=bool)
+        self.probabilities = np.array([e.probability for e in self.events], dtype=float)
+
+        self.schema = AttributeSchema() if schema is None else schema
+        layouts = [e.condition_change.layout(self.schema) for e in self.events]
+        self.attribute_names: list[str] = list(self.schema.names)
+        self.deltas = np.zeros((len(self.events), len(self.attribute_names)))
+        for node, layout in enumerate(layouts):
+            for slot, value in layout:
+                self.deltas[node, slot] += value
+
+    @classmethod
+    def from_place(cls, place: Place, schema: AttributeSchema | None = None) -> BatchEvents:
+        return cls(place.events, schema)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def new_remaining(self, sessions: int) -> np.ndarray:
+        """
+        Makes the per-session occurrence counters, starting from each
+        event's current ``remaining_occurrences``.
+
+        :return: an array of shape (sessions, unique events)
+        """
+        remaining = [e.remaining_occurrences for e in self.unique_events]
+        return np.tile(np.array(remaining, dtype=np.int64), (sessions, 1))
+
+    def process(
+        self,
+        remaining: np.ndarray,
+        rng: np.random.Generator | None = None,
+        draws: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Processes one turn of the events for every session in the batch.
+
+        :param remaining: the occurrence counters from ``new_remaining``,
+            which are updated in place
+        :param rng: the generator for the random draws
+        :param draws: alternatively, uniform draws of shape (sessions, events)
+        :return: the attribute changes, of shape (sessions, attributes) with
+            columns named by ``attribute_names``, and a (sessions, events)
+            mask of the events that occurred
+        """
+        sessions = remaining.shape[0]
+        if draws is None:
+            draws = (rng or np.random.default_rng()).random((sessions, len(self)))
+        reached = np.zeros((sessions, len(self)), dtype=bool)
+        fired = np.zeros((sessions, len(self)), dtype=bool)
+
+        for node in range(len(self)):
+            parent = self.parents[node]
+            if parent < 0:
+                reached[:, node] = True
+            elif self.is_else[node]:
+                reached[:, node] = reached[:, parent] & ~fired[:, parent]
+            else:
+                reached[:, node] = fired[:, parent]
+
+            slot = self.slots[node]
+            occurs = reached[:, node] & (remaining[:, slot] > 0)
+            occurs &= draws[:, node] < self.probabilities[node]
+            fired[:, node] = occurs
+            remaining[:, slot] -= occurs
+
+        return fired @ self.deltas, fired
+
+    def granted_items(self, fired: np.ndarray, session: int) -> list:
+        "The inventory items the events that occurred gave to one session."
+        return [item for node in np.flatnonzero(fired[session])
+                for item in self.events[node].inventory_items]
+
+
+class BatchAttributes:
+    """
+    The attributes of every session in a batch: an array with a row for each
+    session and a column for each slot of an attribute schema. Attributes a
+    session doesn't have are held as 0.
+
+    :param attributes: the attributes every session starts with
+    :param sessions: the number of sessions
+    """
+
+    def __init__(self, attributes: PlayerAttributes, sessions: int):
+        self.schema = attributes.schema
+        start = [0 if value is None else value for value in attributes.values]
+        self.values = np.tile(np.array(start, dtype=float), (sessions, 1))
+        # The attributes the sessions started with, which they have even while 0
+        self._had = np.array([value is not None for value in attributes.values], dtype=bool)
+
+    def _fit(self):
+        "Makes room for the slots the schema has gained."
+        missing = len(self.schema) - self.values.shape[1]
+        if missing > 0:
+            self.values = np.pad(self.values, ((0, 0), (0, missing)))
+            self._had = np.pad(self._had, (0, missing))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        "The values of an attribute, one for each session."
+        self._fit()
+        return self.values[:, self.schema.slots[name]]
+
+    def __setitem__(self, name: str, values):
+        slot = self.schema.slot(name)
+        self._fit()
+        self.values[:, slot] = values
+        self._had[slot] = True
+
+    def __iadd__(self, deltas: np.ndarray):
+        "Adds changes laid out by the schema, such as those from ``BatchEvents.process``."
+        self._fit()
+        self.values[:, :deltas.shape[1]] += deltas
+        return self
+
+    def session(self, session: int) -> PlayerAttributes:
+        "One session's attributes, with those it didn't start with once they are not 0."
+        self._fit()
+        row = self.values[session]
+        attributes = PlayerAttributes(schema=self.schema)
+        for slot in np.flatnonzero(self._had | (row != 0)):
+            value = row[slot].item()
+            attributes.values[slot] = int(value) if value.is_integer() else value
+        return attributes
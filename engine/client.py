@@ -0,0 +1,104 @@
+"""
+A line-based client for ``engine.server``, for playing and for load tests.
+
+    python -m engine.client --port 4000                        # play interactively
+    python -m engine.client --port 4000 --bots 1000 --turns 50 # many scripted players
+
+Bots send the same commands over and over, and the client reports the round
+trip latency of every turn, as seen from the client's side.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from itertools import cycle, islice
+from time import perf_counter
+from typing import Iterable
+
+from .server import PROMPT, TurnLatency
+
+
+async def run_client(
+    host: str, port: int, lines: Iterable[str], latency: TurnLatency | None = None
+) -> str:
+    """
+    Plays one session by sending `lines`, one a turn, and returns everything
+    the server sent back. Stops early if the server closes the connection.
+
+    :param latency: records the round trip time of each line
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    prompt = PROMPT.encode()
+    transcript = []
+    try:
+        transcript.append(await reader.readuntil(prompt))
+        for line in lines:
+            started = perf_counter()
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+            try:
+                transcript.append(await reader.readuntil(prompt))
+            except asyncio.IncompleteReadError as e:  # The game is over
+                transcript.append(e.partial)
+                break
+            if latency is not None:
+                latency.record(perf_counter() - started)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return b"".join(transcript).decode()
+
+
+async def run_bots(
+    host: str, port: int, bots: int, turns: int, commands: list[str]
+) -> TurnLatency:
+    "Runs `bots` concurrent scripted sessions, returning the latency of all of their turns."
+    latency = TurnLatency()
+    await asyncio.gather(*(
+        run_client(host, port, islice(cycle(commands), turns), latency)
+        for _ in range(bots)
+    ))
+    return latency
+
+
+async def play_interactively(host: str, port: int):
+    reader, writer = await asyncio.open_connection(host, port)
+    prompt = PROMPT.encode()
+    try:
+        while True:
+            try:
+                output = await reader.readuntil(prompt)
+            except asyncio.IncompleteReadError as e:
+                print(e.partial.decode(), end="")
+                return
+            line = await asyncio.to_thread(input, output.decode())
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Connect to a game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--bots", type=int, default=0, help="run this many scripted players")
+    parser.add_argument("--turns", type=int, default=20, help="lines each bot sends")
+    parser.add_argument(
+        "--commands", nargs="+", default=["look", "i"], help="the lines bots send, in turn"
+    )
+    args = parser.parse_args(argv)
+
+    if args.bots:
+        latency = asyncio.run(run_bots(args.host, args.port, args.bots, args.turns, args.commands))
+        print(f"{args.bots} sessions: {latency}")
+    else:
+        try:
+            asyncio.run(play_interactively(args.host, args.port))
+        except (EOFError, KeyboardInterrupt):
+            pass
+
+
+if __name__ == "__main__":
+    main()
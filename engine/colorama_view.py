@@ -0,0 +1,83 @@
+from typing import TextIO
+
+from colorama import Fore, Style, just_fix_windows_console
+
+from .command import Command
+from .view import BufferedView
+
+
+class ColoramaView(BufferedView):
+    """
+    A fun and whimsical command-line view that uses colorama and emojis for styling.
+    """
+
+    def __init__(self, out: TextIO | None = None):
+        super().__init__(out)
+        # Writes straight to the terminal, resetting the style at the end of each line
+        just_fix_windows_console()
+        # The color palette remains the same
+        self.LOCATION_STYLE = Fore.CYAN + Style.BRIGHT
+        self.EXITS_STYLE = Fore.GREEN
+        self.ITEMS_STYLE = Fore.YELLOW
+        self.PROMPT_STYLE = Fore.MAGENTA + Style.BRIGHT
+        self.MESSAGE_STYLE = Fore.WHITE
+        self.ERROR_STYLE = Fore.RED + Style.BRIGHT
+        self.SEPARATOR_STYLE = Fore.BLUE + Style.DIM
+        self._separator = self.SEPARATOR_STYLE + "~" * 50 + Style.RESET_ALL
+
+    def _styled(self, style: str, text: str):
+        self._frame += (style, text, Style.RESET_ALL, "\n")
+
+    def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
+        self._frame += ("\n", self._separator, "\n")
+        # NEW: Added a compass emoji
+        self._styled(self.LOCATION_STYLE, f"🧭 {scene_description}")
+        if items:
+            # NEW: Added a magnifying glass emoji
+            self._styled(self.ITEMS_STYLE, f"🔎 You see: {', '.join(items)}")
+        if exits:
+            # NEW: Added a door emoji
+            self._styled(self.EXITS_STYLE, f"🚪 Obvious exits are: {', '.join(exits)}")
+        self._line(self._separator)
+
+    def render_player_state(self, inventory: list[str], attributes: str):
+        if inventory:
+            # NEW: Added a backpack emoji
+            self._styled(Style.BRIGHT, f"🎒 You are carrying: {', '.join(inventory)}")
+        # NEW: Added a scroll emoji
+        self._line(f"📜 Attributes: {attributes}")
+
+    def render_message(self, message: str):
+        if message:
+            # NEW: Added a speech bubble emoji
+            self._styled(self.MESSAGE_STYLE, f"💬 {message}")
+
+    def _styled_input(self, prompt: str) -> str:
+        # The style stays on for what the player types, and is reset with the next frame
+        line = self._input(self.PROMPT_STYLE + prompt)
+        self._frame.append(Style.RESET_ALL)
+        return line
+
+    def get_raw_command(self) -> str:
+        """The CLI-specific input prompt (already whimsical!)."""
+        try:
+            return self._styled_input("✨ > ").lower().strip()
+        except (EOFError, KeyboardInterrupt):
+            return "quit"
+
+    def get_menu_choice(self, choices: list[Command]) -> Command:
+        """The Menu-specific input prompt, now with more magic."""
+        # NEW: Added a magic wand emoji
+        self._styled(self.PROMPT_STYLE, "\n--- 🪄 What wondrous deed to do? ---")
+        for i, command in enumerate(choices, 1):
+            self._line(f"{self.LOCATION_STYLE}{i}. {Style.RESET_ALL}{command.description}")
+        self._styled(self.PROMPT_STYLE, "----------------------------------")
+
+        while True:
+            # NEW: Added a crystal ball emoji
+            choice = self._styled_input("Choose thy fate 🔮: ")
+            if choice.isdigit() and 1 <= int(choice) <= len(choices):
+                return choices[int(choice) - 1]
+            self.render_message(
+                self.ERROR_STYLE + "A most invalid choice! Pray, try again."
+            )
@@ -9,6 +9,7 @@ from .command_result import CommandResult
 
 if TYPE_CHECKING:
     from .game import Game
+    from .place import Place
     from .transition import Transition
     from .inventory_item import InventoryItem
     # from .activity import Activity
@@ -38,13 +39,38 @@ class GoCommand(Command):
             return CommandResult(message="You can't go that way right now.")
 
 
+class TravelCommand(Command):
+    """
+    Goes to a place, however far, by the shortest route the player can
+    take. The whole journey is one turn, and the places passed through
+    don't have their events.
+    """
+
+    def __init__(self, destination: Place):
+        self.destination = destination
+        super().__init__(description=f"Travel to {destination.name}")
+
+    def execute(self, game: Game) -> CommandResult:
+        from .routes import routes_for  # Routes need places, which need commands
+
+        name = self.destination.name
+        if game.location is self.destination:
+            return CommandResult(message=f"You are already in {name}.")
+        route = routes_for(game).route(game, self.destination)
+        if route is None:
+            return CommandResult(message=f"You can't find a way to {name} from here.")
+        game.location = self.destination
+        steps = "step" if len(route) == 1 else "steps"
+        return CommandResult(message=f"You travel to {name}, {len(route)} {steps} away.", location_changed=True)
+
+
 class TakeCommand(Command):
     def __init__(self, item: InventoryItem):
         self.item = item
         super().__init__(description=f"Take {item.name}")
 
     def execute(self, game: Game) -> CommandResult:
-        game.location.inventory_items.remove(self.item)
+        game.state.remove_item(game.location, self.item)
         game.inventory.append(self.item)
         return CommandResult(message=f"You take the {self.item.name}.")
 
@@ -56,7 +82,7 @@ class DropCommand(Command):
 
     def execute(self, game: Game) -> CommandResult:
         game.inventory.remove(self.item)
-        game.location.inventory_items.append(self.item)
+        game.state.add_item(game.location, self.item)
         return CommandResult(message=f"You drop the {self.item.name}.")
 
 
@@ -91,7 +117,7 @@ class LookCommand(Command):
 
         # Case 2: "look <target>" command
         # Search for the target item in the room and in the player's inventory
-        search_areas = game.location.inventory_items + game.inventory
+        search_areas = game.state.items_in(game.location) + game.inventory
         for item in search_areas:
             if self.target.lower() in item.name.lower():
                 # Found the item! Return its detailed description.
@@ -114,6 +140,7 @@ class HelpCommand(Command):
         help_text = (
             "Available commands:\n"
             "  - go [direction/place]\n"
+            "  - travel to [place]\n"
             "  - look / look [item]\n"
             "  - take [item]\n"
             "  - drop [item]\n"
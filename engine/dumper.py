@@ -1,37 +1,196 @@
-from engine.event import Event
-from engine.place import Place
+"""
+Writes out every place reachable from a starting place, as text or in a
+format other tools can read:
 
+- ``dump_place``: an indented listing of places, events, items and exits;
+- ``dump_jsonl``: one JSON object per place;
+- ``dump_dot``: a GraphViz digraph of the places and exits;
+- ``dump_csv``: the exits as rows of an adjacency list.
 
-def dump_event(event: Event, is_else, level=1):
-    else_msg = 'Else ' if is_else else ''
-    print(('\t' * level) + else_msg + event.message + ', ' + str(event.condition_change))
-    for item in event.inventory_items:
-        print(('\t' * (level + 1)) + f'Item: {item}')
+The world is walked breadth first without recursion, however deep it or its
+event chains go, and each place is written to `out`, any file-like object,
+as it is reached. Places are numbered in the order they are reached,
+starting with 0.
 
-    for event in event.else_events:
-        dump_event(event, True, level + 1)
+    python -m engine.dumper ship_game:ShipGame --format dot > ship.dot
+"""
 
-    for event in event.chained_events:
-        dump_event(event, False, level + 1)
+from __future__ import annotations
 
+import argparse
+import csv
+import json
+import sys
+from typing import TYPE_CHECKING, Iterator, TextIO
 
-def dump_place(place: Place, explored: list[Place]):
-    explored.append(place)
-    print(place)
+from .event import Event
 
-    for event in place.events:
-        dump_event(event, False)
+if TYPE_CHECKING:
+    from .place import Place
+    from .transition import Transition
 
-    for item in place.inventory_items:
-        print(f'\tItem: {item}')
 
-    for transition in place.transitions:
-        print(f'\tTransition: {transition}')
+def walk(start: Place) -> Iterator[tuple[int, Place, list[tuple[Transition, int]]]]:
+    """
+    Yields each place reachable from `start` once, with its number and its
+    exits, each paired with the number of the place it leads to.
+    """
+    numbers: dict[int, int] = {id(start): 0}  # Keyed by id(), as a set of places seen
+    places = [start]
+    for number, place in enumerate(places):  # Grows as new places are reached
+        exits = []
+        for transition in place.transitions:
+            target = numbers.get(id(transition.place))
+            if target is None:
+                target = numbers[id(transition.place)] = len(places)
+                places.append(transition.place)
+            exits.append((transition, target))
+        yield number, place, exits
 
-    # for activity in place.activities:
-    #     print(f'\tActivity: {activity}')
 
-    for transition in place.transitions:
-        if transition.place not in explored:
-            explored.append(transition.place)
-            dump_place(transition.place, explored)
+def event_tree(events: list) -> Iterator[tuple[int, bool, Event]]:
+    """
+    Yields the events in a list and, after each, its “else” and chained
+    events, with how deeply each is nested and whether it is an “else”
+    event. Commands in the list are skipped.
+    """
+    stack = [(0, False, e) for e in reversed(events) if isinstance(e, Event)]
+    while stack:
+        depth, is_else, event = stack.pop()
+        yield depth, is_else, event
+        if event.chained_events:
+            stack.extend([(depth + 1, False, e) for e in reversed(event.chained_events)])
+        if event.else_events:
+            stack.extend([(depth + 1, True, e) for e in reversed(event.else_events)])
+
+
+def _event_lines(events: list, level: int, is_else: bool = False, changes: dict | None = None) -> list[str]:
+    # Events share their changes, so `changes` keeps the text of each, by id()
+    changes = {} if changes is None else changes
+    lines = []
+    for depth, else_event, event in event_tree(events):
+        indent = "\t" * (level + depth)
+        else_msg = "Else " if (else_event or depth == 0 and is_else) else ""
+        change = changes.get(id(event.condition_change))
+        if change is None:
+            change = changes[id(event.condition_change)] = str(event.condition_change)
+        lines.append(f"{indent}{else_msg}{event.message}, {change}\n")
+        if event.inventory_items:
+            lines.extend([f"{indent}\tItem: {item}\n" for item in event.inventory_items])
+    return lines
+
+
+def dump_event(event: Event, is_else: bool = False, level: int = 1, out: TextIO | None = None):
+    "Writes an event, its items and the events that follow from it, indented by `level` tabs."
+    (out or sys.stdout).writelines(_event_lines([event], level, is_else))
+
+
+def dump_place(start: Place, out: TextIO | None = None):
+    "Writes an indented listing of every place reachable from `start`."
+    out = out or sys.stdout
+    changes = {}
+    for _, place, exits in walk(start):
+        lines = [f"{place.name}\n"]
+        lines.extend([f"\tCommand: {type(e).__name__}\n" for e in place.events if not isinstance(e, Event)])
+        lines.extend(_event_lines(place.events, 1, changes=changes))
+        lines.extend(f"\tItem: {item}\n" for item in place.inventory_items)
+        lines.extend(f"\tTransition: {_describe_exit(transition)}\n" for transition, _ in exits)
+        out.writelines(lines)
+
+
+def _describe_exit(transition: Transition) -> str:
+    text = transition.place.name
+    if transition.direction:
+        text += f" ({transition.direction})"
+    if transition.key is not None:
+        text += f", needs {transition.key.name}"
+    return text
+
+
+def dump_jsonl(start: Place, out: TextIO | None = None):
+    """
+    Writes each place as a line of JSON. A place's events are listed flat,
+    in the order ``event_tree`` gives them. Those that follow from another
+    give its position in the list as "after", and "else" if they are “else”
+    events. Empty lists of items are left out.
+    """
+    out = out or sys.stdout
+    encode = json.JSONEncoder(ensure_ascii=False, check_circular=False).encode
+    for number, place, exits in walk(start):
+        events = []
+        parents: list[int] = []  # The latest event at each depth
+        for depth, is_else, event in event_tree(place.events):
+            record = {
+                "message": event.message,
+                "probability": event.probability,
+                "change": dict(event.condition_change.items()),
+                "max_occurrences": event.max_occurrences,
+            }
+            if event.inventory_items:
+                record["items"] = [item.name for item in event.inventory_items]
+            if depth:
+                del parents[depth:]
+                record["after"] = parents[-1]
+                record["else"] = is_else
+            parents.append(len(events))
+            events.append(record)
+        record = {"id": number, "name": place.name, "description": place.description, "events": events}
+        if place.inventory_items:
+            record["items"] = [item.name for item in place.inventory_items]
+        commands = [type(e).__name__ for e in place.events if not isinstance(e, Event)]
+        if commands:
+            record["commands"] = commands
+        record["exits"] = [
+            {"to": target, "direction": t.direction, "key": t.key.name if t.key is not None else None}
+            for t, target in exits
+        ]
+        out.write(encode(record) + "\n")
+
+
+def dump_dot(start: Place, out: TextIO | None = None):
+    "Writes a GraphViz digraph with a node for each place and an edge for each exit."
+    out = out or sys.stdout
+    quote = json.JSONEncoder(ensure_ascii=False).encode  # JSON strings are valid DOT strings
+    out.write("digraph world {\n")
+    for number, place, exits in walk(start):
+        lines = [f"  p{number} [label={quote(place.name)}];\n"]
+        for transition, target in exits:
+            label = " / ".join(filter(None, [
+                transition.direction, transition.key.name if transition.key is not None else None
+            ]))
+            lines.append(f"  p{number} -> p{target} [label={quote(label)}];\n" if label
+                         else f"  p{number} -> p{target};\n")
+        out.writelines(lines)
+    out.write("}\n")
+
+
+def dump_csv(start: Place, out: TextIO | None = None):
+    "Writes a row for each exit: the numbers and names of the places it joins, its direction and key."
+    writer = csv.writer(out or sys.stdout, lineterminator="\n")
+    writer.writerow(["from", "from_name", "to", "to_name", "direction", "key"])
+    for number, place, exits in walk(start):
+        writer.writerows(
+            (number, place.name, target, t.place.name, t.direction or "", t.key.name if t.key is not None else "")
+            for t, target in exits
+        )
+
+
+FORMATS = {"text": dump_place, "jsonl": dump_jsonl, "dot": dump_dot, "csv": dump_csv}
+
+
+def main(argv: list[str] | None = None):
+    from .simulator import load_game_class
+    from .view import NullView
+
+    parser = argparse.ArgumentParser(description="Write out every place in a game's world.")
+    parser.add_argument("game", help="the Game subclass, as module:ClassName")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    parser.add_argument("--output", type=argparse.FileType("w", encoding="utf-8"), default=sys.stdout)
+    args = parser.parse_args(argv)
+
+    game = load_game_class(args.game)(None, NullView())
+    FORMATS[args.format](game.location, args.output)
+
+
+if __name__ == "__main__":
+    main()
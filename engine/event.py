@@ -1,18 +1,45 @@
-from random import random
+from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from engine.inventory_item import InventoryItem
 from engine.player_attributes import PlayerAttributes, AttrsType
 
+if TYPE_CHECKING:
+    from engine.game import Game
 
-@dataclass
+
+# Events making the same changes share one PlayerAttributes, which is never changed
+_shared_changes: dict[tuple, PlayerAttributes] = {}
+
+
+def _shared_change(attribs: AttrsType) -> PlayerAttributes:
+    key = tuple(attribs.items())
+    change = _shared_changes.get(key)
+    if change is None:
+        change = PlayerAttributes(attribs)
+        _shared_changes[key] = change
+    return change
+
+
+@dataclass(slots=True)
 class Event:
+    # The places and events this event belongs to, told when its tree changes.
+    # Set first, so it is there when the probability is.
+    _owners: tuple = field(default=(), init=False, repr=False, compare=False)
+
     probability: float
     message: str
     flexible_condition_change: int | AttrsType
     max_occurrences: int = 100_000
 
     condition_change: PlayerAttributes = field(init=False)
+    # Filled in by __post_init__. Absent chains, items and owners are the
+    # shared empty tuple, and adding to them makes a new tuple.
+    remaining_occurrences: int = field(init=False, repr=False, compare=False)
+    chained_events: tuple[Event, ...] = field(init=False, repr=False, compare=False)
+    else_events: tuple[Event, ...] = field(init=False, repr=False, compare=False)
+    inventory_items: tuple[InventoryItem, ...] = field(init=False, repr=False, compare=False)
 
     """
     A game event, including the probability of its happening.
@@ -25,50 +52,61 @@ class Event:
 
     def __post_init__(self):
         self.remaining_occurrences = self.max_occurrences
-        self.chained_events: list[Event] = []
-        self.else_events: list[Event] = []
-        self.inventory_items: list[InventoryItem] = []
+        self.chained_events = self.else_events = self.inventory_items = ()
         fcc: int | AttrsType = self.flexible_condition_change  # Shorter name
-        attr = getattr(Event, "default_attribute")
-        chg = PlayerAttributes(fcc if isinstance(fcc, dict) else {attr: fcc})
+        chg = _shared_change(fcc if isinstance(fcc, dict) else {Event.default_attribute: fcc})
         self.condition_change = chg
+        if isinstance(fcc, dict):  # Keep the shared copy rather than the caller's
+            self.flexible_condition_change = chg.attribs
 
-    def process(self, inventory: list[InventoryItem]) -> PlayerAttributes:
+    def process(self, game: Game) -> PlayerAttributes:
         """
         Process the event.
 
-        :param inventory: the player’s inventory, which may be changed by the event
+        :param game: the game being played; the player’s inventory may be
+            changed by the event, its occurrences are counted in the game's
+            session state, and its impact is reported through the view
         :return: the changes in condition
         """
-        attrs = PlayerAttributes()
-        if self.remaining_occurrences and random() < self.probability:
-            self.remaining_occurrences -= 1
-            self._display_impact()
-            attrs += self.condition_change
+        attrs = PlayerAttributes(schema=game.attribute_schema)
+        remaining = game.state.remaining_occurrences(self)
+        if remaining and game.rng.random() < self.probability:
+            game.state.remaining[id(self)] = remaining - 1
+            self._display_impact(game.view)
+            attrs.add(self.condition_change.layout(attrs.schema))
             for item in self.inventory_items:
-                inventory.append(item)
+                game.inventory.append(item)
             for event in self.chained_events:
-                attrs += event.process(inventory)
+                attrs += event.process(game)
         else:
             for event in self.else_events:
-                attrs += event.process(inventory)
+                attrs += event.process(game)
 
         return attrs
 
-    def _display_impact(self):
+    def _display_impact(self, view):
+        if view.renders_output:
+            for message in self.impact_messages():
+                view.render_message(message)
+
+    def impact_messages(self) -> list[str]:
+        "The messages describing the event and each change it makes when it occurs."
+        messages = []
         for condition, value in self.condition_change.items():
             change_sign = "+" if value > 0 else ""
-            print(f"{self.message}   {condition}: {change_sign}{value}")
+            messages.append(f"{self.message}   {condition}: {change_sign}{value}")
+        return messages
 
     def add_items(self, *items: InventoryItem):
         "Add one or more inventory items to this event."
-        for item in items:
-            self.inventory_items.append(item)
+        self.inventory_items += items
 
     def chain(self, *events: "Event"):
         "Chain one or more events to an event, so that if the event occurs, each of the chained events may also occur."
+        self.chained_events += events
         for event in events:
-            self.chained_events.append(event)
+            event._owners += (self,)
+        self._event_tree_changed()
 
     def add_else_events(self, *events: "Event"):
         """
@@ -77,11 +115,33 @@ class Event:
 
         :param events: one or more “else” events
         """
+        self.else_events += events
         for event in events:
-            self.else_events.append(event)
+            event._owners += (self,)
+        self._event_tree_changed()
+
+    def _event_tree_changed(self):
+        "Passes word of a change in this event's tree up to the places holding it."
+        for owner in self._owners:
+            owner._event_tree_changed()
 
     def __str__(self) -> str:
         return self.str("Condition")
 
     def str(self, condition_description: str) -> str:
         return f"Event: {self.message}, Chance: {self.probability}, {condition_description}: {self.condition_change}"
+
+
+# Unlikely events are scheduled by their probability, so the places holding
+# an event are told when it is tuned. The probability is kept in its slot as
+# before, behind a property that passes the word on.
+_probability_slot = Event.probability
+
+
+def _set_probability(event: Event, probability: float):
+    _probability_slot.__set__(event, probability)
+    if event._owners:
+        event._event_tree_changed()
+
+
+Event.probability = property(_probability_slot.__get__, _set_probability, doc="the probability the event will occur")
@@ -0,0 +1,227 @@
+"""
+Places compile their events into a flat program, which runs a turn's worth
+of events in one loop instead of recursing through ``Event.process``.
+
+Unlikely events aren't rolled for every turn. Whether an event occurs is an
+independent draw each turn, so the number of turns until it next occurs
+follows a geometric distribution, and can be drawn once instead. Each
+session keeps, for each place, a heap of the turns the place's unlikely
+top-level events are next due, and a turn runs only the events that are due
+and those still rolled for.
+"""
+
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from math import inf, log1p
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .command import Command
+from .event import Event
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .player_attributes import AttributeSchema
+
+# Top-level events less likely than this to occur in a turn are scheduled
+# rather than rolled for, unless they have “else” events, which need a roll
+# every turn to know they didn't occur
+SCHEDULE_BELOW = 0.1
+
+
+def turns_until(probability: float, random: Callable[[], float]) -> float:
+    """
+    The number of turns that pass before an event with `probability` of
+    occurring in each turn occurs: 0 if it occurs in the first.
+    """
+    if probability >= 1:
+        return 0
+    if probability <= 0:
+        return inf
+    return int(log1p(-random()) / log1p(-probability))
+
+
+class EventProgram:
+    """
+    A place's event tree as a flat list of instructions.
+
+    Each event becomes one instruction, followed by the instructions for its
+    chained events and then those for its “else” events. An instruction holds
+    the event, its id, its probability, its changes as (slot, value) pairs
+    laid out by the game's attribute schema, and the positions of the next
+    instruction to run if the event occurs or if it does not. The event's
+    items are read when the program runs, so only changes to the shape of
+    the tree, or to the probabilities of events, call for a new program.
+
+    Top-level events with no “else” events and a probability below
+    ``SCHEDULE_BELOW`` are scheduled.
+
+    :param events: the place's events; commands are left out
+    :param schema: the attribute schema of the games the program runs for
+    :param key: what sessions keep the program's schedules under, such as
+        its place, so a new program's schedules replace the old one's; the
+        program itself if not given
+    """
+
+    def __init__(self, events: Iterable[Event | Command], schema: AttributeSchema, key=None):
+        self.schema = schema
+        self.key = self if key is None else key
+        self._sizes: dict[int, int] = {}
+        self.instructions: list[tuple] = []
+        top_level = [e for e in events if not isinstance(e, Command)]
+        end = sum(self._size(e) for e in top_level)
+        self._emit_sequence(top_level, end)
+
+        # The scheduled events' positions, and the stretches of events rolled
+        # for between them, as (start, end, no schedule) for run
+        self.scheduled: list[int] = []
+        self.rolled: list[tuple[int, int, None]] = []
+        self.ends: dict[int, int] = {}
+        position = 0
+        for event in top_level:
+            following = self.ends[position] = position + self._size(event)
+            if not event.else_events and 0 < event.probability < SCHEDULE_BELOW:
+                self.scheduled.append(position)
+            elif self.rolled and self.rolled[-1][1] == position:
+                self.rolled[-1] = (self.rolled[-1][0], following, None)
+            else:
+                self.rolled.append((position, following, None))
+            position = following
+        del self._sizes
+
+    def _size(self, event: Event) -> int:
+        size = self._sizes.get(id(event))
+        if size is None:
+            size = 1 + sum(self._size(e) for e in event.chained_events)
+            size += sum(self._size(e) for e in event.else_events)
+            self._sizes[id(event)] = size
+        return size
+
+    def _emit_sequence(self, events: list[Event], continuation: int) -> int:
+        "Emits events that run one after another, returning where they start."
+        if not events:
+            return continuation
+        start = len(self.instructions)
+        for event in events[:-1]:
+            self._emit(event, len(self.instructions) + self._size(event))
+        self._emit(events[-1], continuation)
+        return start
+
+    def _emit(self, event: Event, continuation: int):
+        index = len(self.instructions)
+        self.instructions.append(None)  # Filled in once the branches are placed
+        on_occur = self._emit_sequence(event.chained_events, continuation)
+        on_miss = self._emit_sequence(event.else_events, continuation)
+        layout = event.condition_change.layout(self.schema)
+        self.instructions[index] = (event, id(event), event.probability, layout, on_occur, on_miss)
+
+    def run(self, game: Game, fired: list[int] | None = None) -> int:
+        """
+        Gives each event the chance to occur that ``Event.process`` would,
+        applying the changes directly to the game's attributes and inventory
+        and counting used-up occurrences in the game's session state.
+
+        :param fired: a list to add the ids of the events that occur to
+        :return: the number of events that occurred
+        """
+        if self.scheduled:
+            stretches = self._stretches(game)
+        else:
+            stretches = ((0, len(self.instructions), None),)
+        attributes = game.attributes
+        attributes.fit()  # For any slots laid out since the attributes were
+        values = attributes.values
+        remaining = game.state.remaining
+        report = game.view.render_message if game.view.renders_output else None
+        random = game.rng.random
+        instructions = self.instructions
+        count = 0
+        for pc, end, schedule in stretches:
+            # A stretch with a schedule starts with an event that is due, and
+            # occurs without a roll if it has occurrences left
+            due = schedule is not None
+            while pc < end:
+                event, event_id, probability, layout, on_occur, on_miss = instructions[pc]
+                left = remaining.get(event_id)
+                if left is None:
+                    left = event.remaining_occurrences
+                if left and (due or random() < probability):
+                    remaining[event_id] = left - 1
+                    count += 1
+                    if fired is not None:
+                        fired.append(event_id)
+                    if due and left > 1:
+                        schedule.add(pc, schedule.turn, random)
+                    if report:
+                        for message in event.impact_messages():
+                            report(message)
+                    for slot, value in layout:
+                        old = values[slot]
+                        values[slot] = value if old is None else old + value
+                    if event.inventory_items:
+                        game.inventory.extend(event.inventory_items)
+                    pc = on_occur
+                else:
+                    pc = on_miss
+                due = False
+        return count
+
+    def _stretches(self, game: Game) -> list[tuple[int, int, EventSchedule | None]]:
+        """
+        The stretches of instructions to run this turn, in the order of the
+        program: the events rolled for, and the scheduled events that are due,
+        each with the session's schedule.
+        """
+        schedules = game.state.schedules
+        schedule = schedules.get(self.key)
+        if schedule is None or schedule.program is not self:
+            schedule = schedules[self.key] = EventSchedule(self, game.rng.random)
+        turn = schedule.turn
+        schedule.turn += 1
+        due = schedule.due
+        if not due or due[0][0] > turn:
+            return self.rolled
+
+        stretches = []
+        rolled = iter(self.rolled)
+        stretch = next(rolled, None)
+        while due and due[0][0] == turn:
+            position = heappop(due)[1]
+            while stretch is not None and stretch[0] < position:
+                stretches.append(stretch)
+                stretch = next(rolled, None)
+            stretches.append((position, self.ends[position], schedule))
+        if stretch is not None:
+            stretches.append(stretch)
+            stretches.extend(rolled)
+        return stretches
+
+
+class EventSchedule:
+    """
+    The turns when the scheduled events of a program are next due to occur
+    in one session, counting the times the program has run for it.
+
+    As the turns until an event occurs don't depend on the turns that have
+    passed, a schedule can be dropped and drawn anew at any time without
+    changing how often events occur. Snapshots don't keep schedules.
+
+    :param program: the program whose events are scheduled
+    :param random: the session's random numbers
+    """
+
+    __slots__ = ("program", "turn", "due")
+
+    def __init__(self, program: EventProgram, random: Callable[[], float]):
+        self.program = program
+        self.turn = 0
+        # (turn, position) for each event that will occur
+        self.due: list[tuple[int, int]] = []
+        for position in program.scheduled:
+            self.add(position, 0, random)
+
+    def add(self, position: int, turn: int, random: Callable[[], float]):
+        "Schedules the event at `position` to occur in `turn` or after it."
+        turns = turns_until(self.program.instructions[position][2], random)
+        if turns != inf:
+            heappush(self.due, (turn + turns, position))
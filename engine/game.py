@@ -1,19 +1,47 @@
 # In engine/game.py
 
 from time import sleep
+from typing import TYPE_CHECKING
 
 from .event import Event
-from .player_attributes import PlayerAttributes
+from .lookup import Inventory
+from .place import Place
+from .profiling import EVENTS, INPUT, RENDER, TurnProfile
+from .player_attributes import AttributeSchema, PlayerAttributes
+from .rng import Rng
+from .scene import SceneCache
+from .session import SessionState
 from .strategies import InputStrategy
 from .view import View # <-- NEW: Import the View
 from .command import Command # <-- NEW: Import the base Command
 from .command_result import CommandResult # <-- NEW: Import the CommandResult
 
+if TYPE_CHECKING:
+    from .turn_log import TurnLog
+
 class Game:
-    def __init__(self, attribute_name_for_suspense: str, input_strategy: InputStrategy, view: View):
+    # Custom fields, such as counters kept by the game's commands, that are
+    # part of a player's session and saved in its snapshots
+    snapshot_fields: tuple[str, ...] = ()
+
+    def __init__(self, attribute_name_for_suspense: str, input_strategy: InputStrategy, view: View, rng: Rng | None = None):
         # Store the view and input strategy
         self.view = view
         self.input_strategy = input_strategy
+        # This session's own random numbers, for events and custom commands
+        self.rng = rng if rng is not None else Rng()
+        # What this player has changed in the world, which may be shared
+        self.state = SessionState()
+        # What was last rendered, kept so an unchanged scene isn't built again
+        self._scene = SceneCache()
+        # The slots of the attributes, which players' attributes and events'
+        # changes are laid out by. Shared by every game of the class.
+        self.attribute_schema = self._class_attribute_schema(attribute_name_for_suspense)
+        # Set to a TurnProfile, before playing, to time each phase of the turns
+        self.profile: TurnProfile | None = None
+        self._timer = None
+        # Set to a TurnLog, before playing, to record every turn
+        self.turn_log: "TurnLog | None" = None
 
         # Model Data
         self.location = None # Will be set by the subclass
@@ -23,53 +51,158 @@ class Game:
         Event.default_attribute = attribute_name_for_suspense
         self.is_running = True
 
+    def _define_world(self) -> Place:
+        "Builds the game's places, returning the one where the player starts."
+        raise NotImplementedError
+
+    def shared_world(self) -> Place:
+        """
+        The place where the player starts, in a world built by
+        ``_define_world`` for the first game of this class and shared by
+        every game of the class after it. Players' changes to it are kept in
+        their own ``state``, so a new game costs no more than its state.
+        """
+        cls = type(self)
+        if "_world" not in cls.__dict__:  # Subclasses have their own worlds
+            cls._world = self._define_world()
+        return cls._world
+
+    @classmethod
+    def _class_attribute_schema(cls, first_name: str) -> AttributeSchema:
+        if "_attribute_schema" not in cls.__dict__:  # Subclasses have their own
+            cls._attribute_schema = AttributeSchema([first_name])
+        return cls._attribute_schema
+
+    @property
+    def attributes(self) -> PlayerAttributes:
+        "The player's attributes, laid out by the game's attribute schema."
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, attributes: PlayerAttributes | None):
+        if attributes is not None:
+            attributes.adopt(self.attribute_schema)
+        self._attributes = attributes
+
+    @property
+    def inventory(self) -> Inventory:
+        "The items the player carries, which can be looked up by name."
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, items):
+        self._inventory = Inventory(items)
+
     def _render_full_scene(self):
-        """A helper method to render the complete game state via the View."""
-        # 1. Prepare scene data from the model
-        place = self.location
-        exit_details = []
-        for t in place.get_transitions():
-            detail = t.place.name
-            if t.direction:
-                detail += f" ({t.direction})"
-            exit_details.append(detail)
-        
-        item_names = [item.name for item in place.inventory_items]
-        inventory_names = [item.name for item in self.inventory]
-
-        # 2. Call the view methods to render
-        self.view.render_scene(place.description, exit_details, item_names)
-        self.view.render_player_state(inventory_names, str(self.attributes))
+        """
+        Renders the complete game state via the View. The parts that haven't
+        changed since the last render are reused, not built again.
+        """
+        if self.view.renders_output:
+            self._scene.render(self)
 
     def play(self):
         # Initial rendering of the first location
         self._render_full_scene()
+        timer = self._timer = self.profile.timer() if self.profile is not None else None
+        log = self.turn_log
+        input_view = self._start_log(log)
 
         # The Presenter Loop
         while self.is_running:
-            # Automatic events process the model directly
-            self.location.process_events(self.attributes)
+            if timer:
+                timer.start()
+            if log:
+                log.begin_turn(self)
+            command = None
+            if self._process_events():
+                # 1. Get a command object from the input strategy
+                command = self.input_strategy.get_action(self, input_view)
+                if timer:
+                    timer.lap(INPUT)
+                # The turn's output goes out in one piece, if asking for the command hasn't sent it
+                self.view.flush()
+                self._apply(command)
+            if log:
+                log.end_turn(self, command)
+        self.view.flush()
+
+    async def play_async(self):
+        """
+        The same loop as ``play``, for hosting many games in one process.
+        The input strategy's ``get_action`` may be a coroutine, such as one
+        waiting for a line from a network connection, and other games run
+        while it waits.
+        """
+        # Imported here, as asyncio takes longer to import than the rest of the engine
+        import asyncio
+        import inspect
+
+        self._render_full_scene()
+        timer = self._timer = self.profile.timer() if self.profile is not None else None
+        log = self.turn_log
+        input_view = self._start_log(log)
+
+        while self.is_running:
+            if timer:
+                timer.start()
+            if log:
+                log.begin_turn(self)
+            command = None
+            if self._process_events():
+                command = self.input_strategy.get_action(self, input_view)
+                if inspect.isawaitable(command):
+                    command = await command
+                else:
+                    await asyncio.sleep(0)  # Let other games have a turn
+                if timer:
+                    timer.lap(INPUT)
+                self.view.flush()
+                self._apply(command)
+            if log:
+                log.end_turn(self, command)
+        self.view.flush()
+
+    def _start_log(self, log: "TurnLog | None") -> View:
+        "Starts the turn log, if there is one, returning the view to read the player's input from."
+        if log is None:
+            return self.view
+        log.start(self)
+        return log.input_view(self.view)
 
-            # Check for game over from automatic events
-            if self.attributes.attribs[self._attribute_name_for_suspense] <= 0:
-                self.view.render_message(f"Your {self._attribute_name_for_suspense} is at 0. You lose.")
+    def _process_events(self) -> bool:
+        "Processes the current place's events, returning whether the game goes on."
+        # Automatic events process the model directly
+        fired = self.location.process_events(self, self.turn_log.fired if self.turn_log else None)
+
+        # Check for game over from automatic events
+        if self.attributes[self._attribute_name_for_suspense] <= 0:
+            self.view.render_message(f"Your {self._attribute_name_for_suspense} is at 0. You lose.")
+            self.is_running = False
+        if self._timer:
+            self._timer.events_fired(self.location.name, fired)
+            self._timer.lap(EVENTS)
+        return self.is_running
+
+    def _apply(self, command: Command | None):
+        timer = self._timer
+        if timer:
+            timer.lap(RENDER)  # Flushing the view, before the command
+        if command:
+            # 2. Execute the command on the model, get a result
+            result = command.execute(self)
+            if timer:
+                timer.command(command)
+
+            # 3. Use the result to update the view and presenter state
+            if result.game_over:
                 self.is_running = False
-                continue
-
-            # 1. Get a command object from the input strategy
-            command = self.input_strategy.get_action(self, self.view)
-            
-            if command:
-                # 2. Execute the command on the model, get a result
-                result = command.execute(self)
-
-                # 3. Use the result to update the view and presenter state
-                if result.game_over:
-                    self.is_running = False
-                
-                # If location changed, re-render the entire scene
-                if result.location_changed:
-                    self._render_full_scene()
-                
-                # Always render the command's feedback message
-                self.view.render_message(result.message)
+
+            # If location changed, re-render the entire scene
+            if result.location_changed:
+                self._render_full_scene()
+
+            # Always render the command's feedback message
+            self.view.render_message(result.message)
+        if timer:
+            timer.lap(RENDER)
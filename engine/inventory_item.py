@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, slots=True)
 class InventoryItem:
     name: str
     description: str
@@ -0,0 +1,163 @@
+"""
+Indexes used to find what the player names in a command, such as the item in
+“take key” or the place in “go dorm room”, without scanning every exit, item
+and command in the current place.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Generic, Iterable, TypeVar
+
+from .command import Command
+
+if TYPE_CHECKING:
+    from .inventory_item import InventoryItem
+    from .place import Place
+    from .transition import Transition
+
+T = TypeVar("T")
+
+
+class NameIndex(Generic[T]):
+    """
+    Finds things by a name, or any part of a name, typed by the player.
+
+    Each thing's name is lowercased once, and every piece of it up to
+    ``MAX_KEY_LENGTH`` characters long is indexed. A lookup, whether it finds
+    something or not, is one dictionary access; targets longer than that are
+    looked up by their first characters and then checked against the whole
+    name. As with a scan in order, the thing added first wins when several
+    names match.
+
+    :param name_of: gets the name of a thing
+    """
+
+    MAX_KEY_LENGTH = 12
+
+    def __init__(self, name_of: Callable[[T], str]):
+        self._name_of = name_of
+        # Keyed by id(thing); dicts keep the order things were added in
+        self._entries: dict[int, tuple[T, str]] = {}
+        self._by_key: dict[str, dict[int, tuple[T, str]]] = {}
+
+    def _keys(self, name: str) -> set[str]:
+        longest = self.MAX_KEY_LENGTH
+        return {
+            name[start:end]
+            for start in range(len(name))
+            for end in range(start + 1, min(start + longest, len(name)) + 1)
+        }
+
+    def add(self, thing: T):
+        entry = (thing, self._name_of(thing).lower())
+        self._entries[id(thing)] = entry
+        for key in self._keys(entry[1]):
+            self._by_key.setdefault(key, {})[id(thing)] = entry
+
+    def remove(self, thing: T):
+        entry = self._entries.pop(id(thing), None)
+        if entry:
+            for key in self._keys(entry[1]):
+                entries = self._by_key[key]
+                del entries[id(thing)]
+                if not entries:
+                    del self._by_key[key]
+
+    def find(self, target: str) -> T | None:
+        "The first thing added whose lowercased name contains `target`."
+        if not target:
+            candidates = self._entries
+        else:
+            candidates = self._by_key.get(target[:self.MAX_KEY_LENGTH], {})
+        for thing, name in candidates.values():
+            if target in name:
+                return thing
+        return None
+
+
+class PlaceIndex:
+    """
+    The exits and selectable commands of a place, indexed by the names a
+    player may use for them. Kept up to date by the place as they change.
+    Items are found through the place's items, which are an ``Inventory``.
+    """
+
+    def __init__(self, place: Place):
+        self.directions: dict[str, Transition] = {}
+        self.exits: NameIndex[Transition] = NameIndex(lambda t: t.place.name)
+        self.commands: NameIndex[Command] = NameIndex(lambda c: c.description)
+
+        for transition in place.transitions:
+            self.add_transition(transition)
+        for command in place.get_selectable_commands():
+            self.commands.add(command)
+
+    def add_transition(self, transition: Transition):
+        if transition.direction:
+            self.directions.setdefault(transition.direction, transition)
+        self.exits.add(transition)
+
+
+class Inventory(list):
+    """
+    A list of items, such as the player's inventory or the items in a place,
+    that can also find an item by name through a ``NameIndex``. Appending, extending and removing keep the
+    index up to date; any other change makes it be rebuilt on the next lookup.
+    ``version`` goes up with every change.
+    """
+
+    __slots__ = ("_index", "version")
+
+    def __init__(self, items: Iterable[InventoryItem] = ()):
+        super().__init__(items)
+        self._index: NameIndex[InventoryItem] | None = None
+        self.version = 0
+
+    def find(self, target: str) -> InventoryItem | None:
+        "The first item whose lowercased name contains `target`."
+        if self._index is None:
+            self._index = NameIndex(lambda i: i.name)
+            for item in self:
+                self._index.add(item)
+        return self._index.find(target)
+
+    def append(self, item: InventoryItem):
+        super().append(item)
+        self.version += 1
+        if self._index is not None:
+            self._index.add(item)
+
+    def extend(self, items: Iterable[InventoryItem]):
+        items = list(items)
+        super().extend(items)
+        self.version += 1
+        if self._index is not None:
+            for item in items:
+                self._index.add(item)
+
+    def __iadd__(self, items: Iterable[InventoryItem]):
+        self.extend(items)
+        return self
+
+    def remove(self, item: InventoryItem):
+        super().remove(item)
+        self.version += 1
+        if self._index is not None:
+            if item in self:  # Another copy is still carried
+                self._index = None
+            else:
+                self._index.remove(item)
+
+    def _invalidating(method):
+        def wrapper(self, *args, **kwargs):
+            self._index = None
+            self.version += 1
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    insert = _invalidating(list.insert)
+    pop = _invalidating(list.pop)
+    clear = _invalidating(list.clear)
+    __setitem__ = _invalidating(list.__setitem__)
+    __delitem__ = _invalidating(list.__delitem__)
+    del _invalidating
@@ -1,10 +1,17 @@
+from typing import TYPE_CHECKING
+
 from .event import Event
+from .event_program import EventProgram
+from .lookup import Inventory, PlaceIndex
 from .inventory_item import InventoryItem
 from .transition import Transition
 # from .activity import Activity
 from .player_attributes import PlayerAttributes
 from .command import Command
 
+if TYPE_CHECKING:
+    from .game import Game
+
 OPPOSITE_DIRECTIONS = {
     "north": "south",
     "south": "north",
@@ -21,15 +28,32 @@ OPPOSITE_DIRECTIONS = {
 }
 
 
+# Shared by every place that has no items, until one is added
+_NO_ITEMS = Inventory()
+
+
 class Place:
     """
     A location in the game.
+
+    Places without events, items or exits share empty ones, and a place's
+    default description is made when it is asked for, so a world with many
+    places stores little beyond what is particular to each.
     """
 
+    __slots__ = (
+        "name", "_description", "events", "inventory_items", "transitions",
+        "_event_program", "_index", "version", "__weakref__",
+    )
+
+    # Counts changes to the exits of every place, so anything built from the
+    # whole map, such as a route table, knows when to rebuild
+    map_version = 0
+
     name: str
     description: str
     events: list[Event]
-    inventory_items: list[InventoryItem]
+    inventory_items: Inventory
     transitions: list[Transition]
 
     def __init__(
@@ -40,32 +64,85 @@ class Place:
         inventory_items: list[InventoryItem] = None,
     ):
         self.name = name
-        self.description = description if description else f"You are in {name}."
-        self.events = events if events else []
-        self.inventory_items = inventory_items if inventory_items else []
-        self.transitions = []
+        self._description = description
+        self.events = events if events else ()
+        for event in self.events:
+            self._own(event)
+        self.inventory_items = Inventory(inventory_items) if inventory_items else _NO_ITEMS
+        self.transitions = ()
+        self._event_program: EventProgram | None = None
+        self._index: PlaceIndex | None = None
+        # Counts changes to the exits and events, so anything built from
+        # them, such as a menu, knows when to rebuild
+        self.version = 0
+
+    @property
+    def description(self) -> str:
+        return self._description or f"You are in {self.name}."
+
+    @description.setter
+    def description(self, description: str):
+        self._description = description
+
+    @property
+    def index(self) -> PlaceIndex:
+        "Finds this place's exits, items and commands by name. Built when first needed."
+        if self._index is None:
+            self._index = PlaceIndex(self)
+        return self._index
 
     def add_events(self, *events: Event):
+        if isinstance(self.events, tuple):  # Still the shared empty tuple
+            self.events = []
         self.events.extend(events)
+        for event in events:
+            self._own(event)
+        self._event_program = None
+        self._index = None
+        self.version += 1
+
+    def _own(self, event: Event):
+        if isinstance(event, Event):
+            event._owners += (self,)
+
+    def _event_tree_changed(self):
+        "Called by this place's events when chained or “else” events are added, or when they are tuned."
+        self._event_program = None
+
+    def add_item(self, item: InventoryItem):
+        "Puts an item here when the world is defined. Players' changes are kept by their session."
+        if self.inventory_items is _NO_ITEMS:
+            self.inventory_items = Inventory()
+        self.inventory_items.append(item)
+
+    def remove_item(self, item: InventoryItem):
+        self.inventory_items.remove(item)
 
     # def add_activities(self, *activities: Activity):
     #     """A convenience method for adding activities."""
     #     self.add_events(*activities)
 
-    def process_events(self, attributes: PlayerAttributes):
-        # Local import to avoid circular dependencies.
+    def process_events(self, game: "Game", fired: list[int] | None = None) -> int:
+        """
+        Gives each automatic event in this place a chance to occur, applying
+        the resulting changes to the player's attributes.
 
-        for event in self.events:
-            if isinstance(event, Command):
-                continue  # Skips to the next item in the loop
-            
-            event.process(attributes)
-            # ONLY process the event if it is NOT an Activity.
-            # if not isinstance(event, Activity):
-            #     event.process(attributes)
+        :param fired: a list to add the ids of the events that occur to
+        :return: the number of events that occurred
+        """
+        program = self._event_program
+        if program is None or program.schema is not game.attributes.schema:
+            program = self._event_program = EventProgram(self.events, game.attributes.schema, self)
+        return program.run(game, fired)
 
     def add_transition(self, transition: Transition):
+        if not self.transitions:  # Still the shared empty tuple
+            self.transitions = []
         self.transitions.append(transition)
+        if self._index is not None:
+            self._index.add_transition(transition)
+        self.version += 1
+        Place.map_version += 1
 
     def add_transitions(self, *targets, reverse=False):
         """
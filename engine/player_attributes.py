@@ -1,26 +1,196 @@
-from dataclasses import dataclass, field
+"""
+A player's attributes, such as health, and the changes events make to them.
+
+Each game has an ``AttributeSchema`` that gives every attribute name a slot.
+Attribute values are kept in a list indexed by slot, and a change laid out
+for the schema is a list of (slot, value) pairs, so applying it costs no
+lookups by name. Names still work for everything else, such as a game's own
+commands changing ``attributes.attribs["Health"]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 
 AttrsType = dict[str, int | float]
 
+
+class AttributeSchema:
+    """
+    The attribute names of a game, each with its slot: the index of its
+    value in every ``PlayerAttributes`` laid out by the schema. Slots are
+    only ever added, so anything laid out by a schema stays valid as it
+    grows.
+
+    :param names: the first names, in the order of their slots
+    """
+
+    __slots__ = ("names", "slots")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = []
+        self.slots: dict[str, int] = {}
+        for name in names:
+            self.slot(name)
+
+    def slot(self, name: str) -> int:
+        "The slot of `name`, given the next one if it hasn't one yet."
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.names)
+            self.names.append(sys.intern(name))
+        return slot
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self):
+        return f"AttributeSchema({self.names!r})"
+
+
+class AttributeMap(MutableMapping):
+    "The attributes a player has, by name."
+
+    __slots__ = ("_attributes",)
+
+    def __init__(self, attributes: PlayerAttributes):
+        self._attributes = attributes
+
+    def __getitem__(self, name: str) -> int | float:
+        return self._attributes[name]
+
+    def __setitem__(self, name: str, value: int | float):
+        self._attributes[name] = value
+
+    def __delitem__(self, name: str):
+        attributes = self._attributes
+        attributes[name]  # Raises KeyError if absent
+        attributes.values[attributes.schema.slots[name]] = None
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._attributes.items())
+
+    def __len__(self) -> int:
+        return sum(value is not None for value in self._attributes.values)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
 class PlayerAttributes:
-    pass
-    
-@dataclass
-class PlayerAttributes:
-    attribs: AttrsType = field(default_factory=dict)
-
-    def __iadd__(self, other: PlayerAttributes):
-        if not other:
-            return
-        for k, v in other.items():
-            if k in self.attribs:
-                self.attribs[k] += v
+    """
+    Attribute values, such as a player's, or the changes an event makes.
+
+    :param attribs: the values by name
+    :param schema: the schema to lay them out by; a schema of their own if
+        not given
+    """
+
+    __slots__ = ("schema", "values", "_map", "_layout")
+
+    def __init__(self, attribs: Mapping[str, int | float] | None = None, schema: AttributeSchema | None = None):
+        self.schema = AttributeSchema() if schema is None else schema
+        # Each slot's value, or None for attributes not had
+        self.values: list[int | float | None] = [None] * len(self.schema.names)
+        self._map: AttributeMap | None = None
+        # As a change, its (slot, value) pairs in the last schema asked for
+        self._layout: tuple[AttributeSchema, tuple[tuple[int, int | float], ...]] | None = None
+        if attribs:
+            for name, value in attribs.items():
+                self[name] = value
+
+    @property
+    def attribs(self) -> AttributeMap:
+        "The values by name, which can be changed."
+        if self._map is None:
+            self._map = AttributeMap(self)
+        return self._map
+
+    def fit(self):
+        "Makes room for the slots the schema has gained."
+        missing = len(self.schema.names) - len(self.values)
+        if missing > 0:
+            self.values.extend([None] * missing)
+
+    def adopt(self, schema: AttributeSchema):
+        "Lays the values out by `schema` instead."
+        if schema is not self.schema:
+            values = list(self.items())
+            self.schema, self.values = schema, [None] * len(schema.names)
+            for name, value in values:
+                self[name] = value
+
+    def layout(self, schema: AttributeSchema) -> tuple[tuple[int, int | float], ...]:
+        "This change as (slot, value) pairs in `schema`, which gains any slots it lacks."
+        layout = self._layout
+        if layout is None or layout[0] is not schema:
+            layout = self._layout = (schema, tuple((schema.slot(name), value) for name, value in self.items()))
+        return layout[1]
+
+    def __getitem__(self, name: str) -> int | float:
+        slot = self.schema.slots.get(name)
+        value = None if slot is None or slot >= len(self.values) else self.values[slot]
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, value: int | float):
+        slot = self.schema.slot(name)
+        if slot >= len(self.values):
+            self.fit()
+        self.values[slot] = value
+
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def items(self) -> Iterator[tuple[str, int | float]]:
+        names = self.schema.names
+        return ((names[slot], value) for slot, value in enumerate(self.values) if value is not None)
+
+    def add(self, layout: tuple[tuple[int, int | float], ...]):
+        "Adds a change laid out by this schema, as from ``layout``."
+        values = self.values
+        if len(values) < len(self.schema.names):
+            self.fit()
+        for slot, change in layout:
+            value = values[slot]
+            values[slot] = change if value is None else value + change
+
+    def __iadd__(self, other: PlayerAttributes | Mapping[str, int | float] | None):
+        if other is None:
+            return self
+        if isinstance(other, PlayerAttributes):
+            if other.schema is self.schema:
+                # The same layout: add slot by slot
+                self.fit()
+                values = self.values
+                for slot, change in enumerate(other.values):
+                    if change is not None:
+                        value = values[slot]
+                        values[slot] = change if value is None else value + change
             else:
-                self.attribs[k] = v
+                self.add(other.layout(self.schema))
+        else:
+            for name, change in other.items():
+                self[name] = self.get(name, 0) + change
         return self
 
-    def items(self):
-        return self.attribs.items()
+    def __len__(self) -> int:
+        return sum(value is not None for value in self.values)
+
+    def __eq__(self, other):
+        if isinstance(other, PlayerAttributes):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"PlayerAttributes({dict(self.items())!r})"
 
     def __str__(self):
-        return ', '.join(f'{name}: {value}' for name, value in self.attribs.items())
+        return ', '.join(f'{name}: {value}' for name, value in self.items())
@@ -0,0 +1,224 @@
+"""
+Timers and counters for the turns of ``Game.play``, for finding out where a
+slow session's time goes.
+
+Give a game a ``TurnProfile`` as its ``profile`` before it plays, and each
+turn is split into phases, each timed by the wall clock and by the CPU time
+of the game's thread:
+
+- ``events``: ``Place.process_events``, and checking whether the game is lost;
+- ``input``: ``InputStrategy.get_action``, including waiting for the player;
+- ``command``: ``Command.execute``;
+- ``render``: rendering the turn's output and flushing the view.
+
+The profile also counts the commands run, by class, with a histogram of how
+long they took, and the events that occurred in each place. Many games may
+share one profile, as the sessions of a server do; there, the CPU time of
+a session's input phase includes the other sessions' turns played while it
+waited. A game without a profile only checks, a few times a turn, that it
+has none.
+
+A profile can be written as JSON, or in the Prometheus text format for a
+metrics scraper:
+
+    profile.write("turns.json")
+    profile.write("turns.prom")
+"""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections import Counter
+from time import perf_counter, thread_time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .command import Command
+
+EVENTS, INPUT, COMMAND, RENDER = PHASES = ("events", "input", "command", "render")
+
+# The upper bounds, in seconds, of the buckets of the command latency histograms
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+class CommandStats:
+    "The number of times a command class ran, and how long it took."
+
+    __slots__ = ("count", "seconds", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        # The runs that took no longer than each bound, and not the one before;
+        # the last counts those slower than every bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def merge(self, other: CommandStats):
+        self.count += other.count
+        self.seconds += other.seconds
+        self.buckets = [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)]
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        "Each bucket's bound, and the runs that took no longer, as Prometheus has them."
+        bounds = [repr(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        counts, total = [], 0
+        for count in self.buckets:
+            total += count
+            counts.append(total)
+        return list(zip(bounds, counts))
+
+
+class TurnProfile:
+    "Timings and counts of the turns of one or more games."
+
+    def __init__(self):
+        self.turns = 0
+        # The seconds spent in each phase, by the wall clock and in CPU time
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.commands: dict[str, CommandStats] = {}
+        # The events that occurred in each place, by the place's name
+        self.events_fired: Counter[str] = Counter()
+
+    def timer(self) -> PhaseTimer:
+        "A timer for one game's turns, adding to this profile."
+        return PhaseTimer(self)
+
+    def merge(self, other: TurnProfile) -> TurnProfile:
+        "Adds the timings and counts of another profile to this one."
+        self.turns += other.turns
+        for phase in PHASES:
+            self.wall[phase] += other.wall[phase]
+            self.cpu[phase] += other.cpu[phase]
+        for name, stats in other.commands.items():
+            self.commands.setdefault(name, CommandStats()).merge(stats)
+        self.events_fired.update(other.events_fired)
+        return self
+
+    # --- Exporting ---
+
+    def to_dict(self) -> dict:
+        return {
+            "turns": self.turns,
+            "phases": {
+                phase: {"wall_seconds": self.wall[phase], "cpu_seconds": self.cpu[phase]}
+                for phase in PHASES
+            },
+            "commands": {
+                name: {
+                    "count": stats.count,
+                    "seconds": stats.seconds,
+                    "buckets": dict(stats.cumulative_buckets()),
+                }
+                for name, stats in sorted(self.commands.items())
+            },
+            "events_fired": dict(sorted(self.events_fired.items())),
+        }
+
+    def to_json(self) -> str:
+        import json  # Only needed by games that export their profiles
+
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        "The profile in the Prometheus text exposition format."
+        lines = [
+            "# HELP game_turns_total Turns played.",
+            "# TYPE game_turns_total counter",
+            f"game_turns_total {self.turns}",
+        ]
+        for clock, seconds in (("wall", self.wall), ("cpu", self.cpu)):
+            metric = f"game_phase_{clock}_seconds_total"
+            lines += [
+                f"# HELP {metric} Time spent in each phase of a turn, by the {clock} clock.",
+                f"# TYPE {metric} counter",
+            ]
+            lines += [f'{metric}{{phase="{phase}"}} {seconds[phase]!r}' for phase in PHASES]
+        lines += [
+            "# HELP game_command_seconds How long commands took to execute.",
+            "# TYPE game_command_seconds histogram",
+        ]
+        for name, stats in sorted(self.commands.items()):
+            label = f'command="{_escape(name)}"'
+            lines += [
+                f'game_command_seconds_bucket{{{label},le="{bound}"}} {count}'
+                for bound, count in stats.cumulative_buckets()
+            ]
+            lines.append(f"game_command_seconds_sum{{{label}}} {stats.seconds!r}")
+            lines.append(f"game_command_seconds_count{{{label}}} {stats.count}")
+        lines += [
+            "# HELP game_events_fired_total Events that occurred, by place.",
+            "# TYPE game_events_fired_total counter",
+        ]
+        lines += [
+            f'game_events_fired_total{{place="{_escape(place)}"}} {count}'
+            for place, count in sorted(self.events_fired.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """
+        Writes the profile to `path`: in the Prometheus format if it ends in
+        .prom, or else as JSON. The file is replaced in one step, so a
+        collector reading it never sees half of it.
+        """
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        partial = f"{path}.partial"
+        with open(partial, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(partial, path)
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class PhaseTimer:
+    """
+    Times the phases of one game's turns. Each ``lap`` adds the time since
+    the last one to a phase of the profile. Reading the clocks costs more
+    than anything else the timer does, so a turn starts where the last lap
+    of the turn before it ended, and the clocks are read once for each lap.
+
+    :param profile: the profile to add to
+    """
+
+    __slots__ = ("profile", "_wall", "_cpu")
+
+    def __init__(self, profile: TurnProfile):
+        self.profile = profile
+        self._wall, self._cpu = perf_counter(), thread_time()
+
+    def start(self):
+        "Starts a turn."
+        self.profile.turns += 1
+
+    def lap(self, phase: str) -> float:
+        "Adds the time since the last lap to `phase`, returning the wall clock time."
+        wall, cpu = perf_counter(), thread_time()
+        elapsed = wall - self._wall
+        profile = self.profile
+        profile.wall[phase] += elapsed
+        profile.cpu[phase] += cpu - self._cpu
+        self._wall, self._cpu = wall, cpu
+        return elapsed
+
+    def command(self, command: Command):
+        "Ends the command phase, counting it as a run of `command`'s class."
+        elapsed = self.lap(COMMAND)
+        commands = self.profile.commands
+        name = type(command).__name__
+        stats = commands.get(name)
+        if stats is None:
+            stats = commands[name] = CommandStats()
+        stats.record(elapsed)
+
+    def events_fired(self, place_name: str, count: int):
+        if count:
+            self.profile.events_fired[place_name] += count
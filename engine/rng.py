@@ -0,0 +1,99 @@
+"""
+Per-session random number streams.
+
+Each game owns an ``Rng``, so concurrent sessions never share a stream and
+any session can be reproduced from its seed.
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import chain, islice, repeat, starmap
+from operator import length_hint
+from random import Random
+from typing import Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class Rng:
+    """
+    A reproducible stream of random numbers in [0, 1).
+
+    Numbers are drawn in bulk, a chunk at a time, from a generator seeded by
+    the stream's seed and the chunk's number. ``random`` just hands out the
+    next pre-drawn number, and the whole state of the stream is its seed, the
+    number of draws made so far and the number of child streams split off.
+    Nothing is drawn until the first number is asked for.
+
+    :param seed: a non-negative integer; a random one is chosen if omitted
+    :param position: the number of draws to skip
+    """
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self, seed: int | None = None, position: int = 0):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8))
+        elif seed < 0:
+            raise ValueError(f"Rng seed must be non-negative, not {seed}")
+        self.seed = seed
+        self._splits = 0
+        self.seek(position)
+
+    def _draw_chunk(self, number: int) -> Iterator[float]:
+        draw = Random((self.seed << 64) | number).random
+        return iter(list(starmap(draw, repeat((), self.CHUNK_SIZE))))
+
+    def _chunks(self) -> Iterator[Iterator[float]]:
+        self._current = self._draw_chunk(self._chunk_number)
+        next(islice(self._current, self._offset, self._offset), None)
+        yield self._current
+        while True:
+            self._chunk_number += 1
+            self._current = self._draw_chunk(self._chunk_number)
+            yield self._current
+
+    def seek(self, position: int):
+        "Moves the stream to just after draw number `position`."
+        self._chunk_number, self._offset = divmod(position, self.CHUNK_SIZE)
+        self._current = None  # The chunk is drawn on the first call to random
+        # Bound to a C-level iterator, so each call costs no more than random.random
+        self.random = chain.from_iterable(self._chunks()).__next__
+
+    @property
+    def position(self) -> int:
+        "The number of draws made so far."
+        if self._current is None:
+            return self._chunk_number * self.CHUNK_SIZE + self._offset
+        return (self._chunk_number + 1) * self.CHUNK_SIZE - length_hint(self._current)
+
+    def getstate(self) -> tuple[int, int, int]:
+        return self.seed, self.position, self._splits
+
+    def setstate(self, state: tuple[int, int, int]):
+        self.seed, position, self._splits = state
+        self.seek(position)
+
+    def split(self) -> Rng:
+        """
+        Makes a new independent child stream, such as one for each parallel
+        worker.
+        """
+        self._splits += 1
+        return self.child(self._splits - 1)
+
+    def child(self, index: int) -> Rng:
+        "The independent child stream number `index`, which is always the same for a given seed."
+        from hashlib import blake2b  # Only needed by games that split their streams
+
+        digest = blake2b(f"{self.seed}/{index}".encode(), digest_size=8).digest()
+        return Rng(int.from_bytes(digest))
+
+    def randint(self, a: int, b: int) -> int:
+        "A random integer N such that a <= N <= b."
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq: Sequence[T]) -> T:
+        "A random element of a non-empty sequence."
+        return seq[int(self.random() * len(seq))]
@@ -0,0 +1,144 @@
+"""
+Shortest routes between the places of a world, for travelling to a place in
+one command.
+
+A ``RouteTable`` numbers the places of a world once and keeps, for each
+destination asked for, the exit to take from every place to get closer to
+it. Which exits a player can take depends on the keys they carry and on the
+exits' conditions, so tables are kept for each destination, set of keys
+held and state of the conditions. A table is built with one walk back from
+its destination. After that, finding the next exit is a list lookup, and a
+route costs one lookup per step. Every table is dropped when any place's
+exits change.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from .place import Place
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .transition import Transition
+
+
+class RouteTable:
+    """
+    Routes between the places reachable from `start`. Building it reaches
+    every place, so in a world loaded lazily, every place is loaded.
+
+    :param start: the place where every game in the world starts
+    """
+
+    # Tables kept at once, each a list as long as the world
+    MAX_TABLES = 64
+
+    def __init__(self, start: Place):
+        self._start = start
+        self._map_version = -1
+        self._tables: dict[tuple, list[Transition | None]] = {}
+
+    def _build(self):
+        "Numbers the places and lists the exits leading into each."
+        self.places: list[Place] = [self._start]
+        self.numbers: dict[int, int] = {id(self._start): 0}  # Keyed by id(), as places are
+        self.entrances: list[list[tuple[int, Transition]]] = [[]]
+        self.conditional: list[Transition] = []
+        self.key_ids: dict[int, int] = {}  # Keyed by id(), as items compare by value
+        for number, place in enumerate(self.places):  # Grows as new places are reached
+            for transition in place.transitions:
+                target = self.numbers.get(id(transition.place))
+                if target is None:
+                    target = self.numbers[id(transition.place)] = len(self.places)
+                    self.places.append(transition.place)
+                    self.entrances.append([])
+                self.entrances[target].append((number, transition))
+                if transition.condition is not None:
+                    self.conditional.append(transition)
+                if transition.key is not None:
+                    self.key_ids.setdefault(id(transition.key), len(self.key_ids))
+        self.names: dict[str, Place] = {}
+        for place in reversed(self.places):  # The first place reached wins a shared name
+            self.names[place.name.lower()] = place
+        self._tables.clear()
+        self._map_version = Place.map_version  # After building, which loads lazy places
+
+    def _up_to_date(self):
+        if self._map_version != Place.map_version:
+            self._build()
+
+    def find(self, name: str) -> Place | None:
+        """
+        The place called `name`, ignoring case, or failing that the first
+        one reached whose name contains it.
+        """
+        self._up_to_date()
+        name = name.lower()
+        place = self.names.get(name)
+        if place is None and name:
+            place = next((p for n, p in self.names.items() if name in n), None)
+        return place
+
+    def next_exits(self, game: Game, destination: Place) -> list[Transition | None]:
+        """
+        For each place, by number, the exit to take towards `destination`,
+        which the player can use now, or None if there is none.
+        """
+        self._up_to_date()
+        key_ids = self.key_ids
+        keys = frozenset(key_ids[id(item)] for item in game.inventory if id(item) in key_ids)
+        conditions = tuple(t.condition() for t in self.conditional)
+        cache_key = (self.numbers[id(destination)], keys, conditions)
+        table = self._tables.get(cache_key)
+        if table is None:
+            if len(self._tables) >= self.MAX_TABLES:
+                del self._tables[next(iter(self._tables))]  # The oldest
+            table = self._tables[cache_key] = self._walk_back(cache_key[0], game)
+        return table
+
+    def _walk_back(self, destination: int, game: Game) -> list[Transition | None]:
+        table: list[Transition | None] = [None] * len(self.places)
+        reached = [False] * len(self.places)
+        reached[destination] = True
+        queue = deque([destination])
+        entrances = self.entrances
+        while queue:
+            for source, transition in entrances[queue.popleft()]:
+                if not reached[source] and transition.is_accessible(game):
+                    reached[source] = True
+                    table[source] = transition
+                    queue.append(source)
+        return table
+
+    def route(self, game: Game, destination: Place) -> list[Transition] | None:
+        """
+        The exits to take, in order, on a shortest route the player can take
+        from where they are to `destination`, or None if there is none.
+        """
+        table = self.next_exits(game, destination)
+        here = self.numbers.get(id(game.location))
+        if here is None:
+            return None
+        route = []
+        while self.places[here] is not destination:
+            transition = table[here]
+            if transition is None:
+                return None
+            route.append(transition)
+            here = self.numbers[id(transition.place)]
+        return route
+
+
+_route_tables: WeakKeyDictionary[Place, RouteTable] = WeakKeyDictionary()
+
+
+def routes_for(game: Game) -> RouteTable:
+    "The route table of the game's shared world, made the first time it is needed."
+    start = game.shared_world()
+    table = _route_tables.get(start)
+    if table is None:
+        table = _route_tables[start] = RouteTable(start)
+    return table
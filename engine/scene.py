@@ -0,0 +1,77 @@
+"""
+The scene and player panel a game shows, kept between renders so that only
+what has changed is built again.
+
+Each part is checked against what it was built from, using the change
+counters the model already keeps: a place's ``version``, which
+``add_transition`` bumps, and the ``version`` of the ``Inventory`` lists
+that taking and dropping items change. A move is seen by the location
+itself changing. Attributes are compared by value, since games' own
+commands change them directly. Looking again at a room where nothing has
+changed builds nothing, and the view is given the same lists and strings as
+before.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .lookup import Inventory
+    from .place import Place
+
+
+class _Names:
+    "The names of the items in an inventory, as of its last change."
+
+    __slots__ = ("items", "version", "names")
+
+    def __init__(self):
+        self.items: Inventory | None = None
+        self.version = -1
+        self.names: list[str] = []
+
+    def of(self, items: Inventory) -> list[str]:
+        if items is not self.items or items.version != self.version:
+            self.items, self.version = items, items.version
+            self.names = [item.name for item in items]
+        return self.names
+
+
+class SceneCache:
+    "One game's last rendered scene and player panel."
+
+    __slots__ = ("_place", "_place_version", "_exits", "_items", "_inventory", "_values", "_attributes")
+
+    def __init__(self):
+        self._place: Place | None = None
+        self._place_version = -1
+        self._exits: list[str] = []
+        self._items = _Names()
+        self._inventory = _Names()
+        self._values: list | None = None
+        self._attributes = ""
+
+    def _exit_names(self, place: Place) -> list[str]:
+        if place is not self._place or place.version != self._place_version:
+            self._place, self._place_version = place, place.version
+            self._exits = []
+            for t in place.get_transitions():
+                name = t.place.name
+                if t.direction:
+                    name += f" ({t.direction})"
+                self._exits.append(name)
+        return self._exits
+
+    def render(self, game: Game):
+        "Renders the game's scene and player panel, rebuilding only the parts that have changed."
+        place = game.location
+        items = self._items.of(game.state.items_in(place))
+        game.view.render_scene(place.description, self._exit_names(place), items)
+
+        values = game.attributes.values
+        if values != self._values:
+            self._values = list(values)
+            self._attributes = str(game.attributes)
+        game.view.render_player_state(self._inventory.of(game.inventory), self._attributes)
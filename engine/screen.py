@@ -0,0 +1,260 @@
+"""
+A full-screen terminal view that redraws only what has changed.
+
+``ScreenView`` lays the terminal out in fixed panes: the scene at the top,
+the exits and the player's inventory side by side beneath it, a line of
+attributes, and a log of messages. It keeps what the screen shows, one
+character and one style for each cell, and at the end of each turn sends
+only the escape sequences and characters for the cells that differ. Moving
+to a new room rewrites the scene and exits; taking an item rewrites a line
+or two. The styles' escape sequences are made once, and each cell's style
+is a single character, so comparing and writing a line costs no string
+building beyond the line itself.
+
+Each character is taken to fill one cell, so the view uses no emoji.
+"""
+
+from __future__ import annotations
+
+import shutil
+import textwrap
+from typing import TYPE_CHECKING, TextIO
+
+from colorama import Fore, Style, just_fix_windows_console
+
+from .view import BufferedView
+
+if TYPE_CHECKING:
+    from .command import Command
+
+
+def _sgr(*sequences: str) -> str:
+    "One escape sequence that sets everything the given colorama sequences set."
+    return "\x1b[" + ";".join(sequence[2:-1] for sequence in sequences) + "m"
+
+
+# Each style's code, as kept for a cell, and the one sequence that switches
+# to it from any other style
+PLAIN, LOCATION, ITEMS, EXITS, INVENTORY, ATTRIBUTES, MESSAGE, RULE, PROMPT = " lxeiamrp"
+STYLES = {
+    PLAIN: Style.RESET_ALL,
+    LOCATION: _sgr(Style.RESET_ALL, Fore.CYAN, Style.BRIGHT),
+    ITEMS: _sgr(Style.RESET_ALL, Fore.YELLOW),
+    EXITS: _sgr(Style.RESET_ALL, Fore.GREEN),
+    INVENTORY: _sgr(Style.RESET_ALL, Style.BRIGHT),
+    ATTRIBUTES: _sgr(Style.RESET_ALL, Fore.MAGENTA),
+    MESSAGE: _sgr(Style.RESET_ALL, Fore.WHITE),
+    RULE: _sgr(Style.RESET_ALL, Fore.BLUE, Style.DIM),
+    PROMPT: _sgr(Style.RESET_ALL, Fore.MAGENTA, Style.BRIGHT),
+}
+
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE = "\x1b[2K"
+CLEAR_TO_END = "\x1b[K"
+
+# Unchanged cells between two changes that are written again rather than
+# skipped, as moving the cursor past them costs about as much
+SKIP_AFTER = 6
+
+
+def _move(row: int, column: int) -> str:
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+class ScreenView(BufferedView):
+    """
+    A view that draws the game in fixed panes on the whole terminal.
+
+    :param out: where to write, sys.stdout if not given
+    :param size: the screen's columns and lines, the terminal's size if not given
+    """
+
+    SCENE_LINES = 5
+    LIST_LINES = 6
+    MIN_LINES = SCENE_LINES + LIST_LINES + 7
+
+    def __init__(self, out: TextIO | None = None, size: tuple[int, int] | None = None):
+        super().__init__(out)
+        just_fix_windows_console()
+        self.width, self.height = size or shutil.get_terminal_size()
+        if self.height < self.MIN_LINES:
+            raise ValueError(f"the screen must have at least {self.MIN_LINES} lines")
+        # Where each pane starts
+        self._lists_row = self.SCENE_LINES + 1
+        self._attributes_row = self._lists_row + self.LIST_LINES
+        self._log_row = self._attributes_row + 2
+        self._prompt_row = self.height - 2  # Entering a line leaves the cursor on the last
+        # Each line of the screen above the prompt as it is to be shown: its
+        # characters, and each character's style code
+        self._blank = self._fill("", PLAIN, self.width)
+        rule = ("-" * self.width, RULE * self.width)
+        self._lines = [self._blank] * self._prompt_row
+        self._lines[self.SCENE_LINES] = self._lines[self._attributes_row + 1] = rule
+        # What the screen shows, None until it is first drawn
+        self._shown: list[tuple[str, str]] | None = None
+        # Lines the message log has moved up since it was last drawn
+        self._scrolled = 0
+        # What the panes were made from, which the game passes again when it is unchanged
+        self._scene_made_from = None
+        self._exits: list[str] = []
+        self._inventory: list[str] | None = None
+        self._attributes = None
+
+    # --- Filling in the panes ---
+
+    @staticmethod
+    def _fill(text: str, style: str, width: int) -> tuple[str, str]:
+        return text[:width].ljust(width), style * width
+
+    def _wrap(self, text: str) -> list[str]:
+        return [text] if len(text) <= self.width else textwrap.wrap(text, self.width)
+
+    def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
+        made_from = (scene_description, exits, items)
+        if made_from == self._scene_made_from:  # Quick when they are the same lists
+            return
+        self._scene_made_from = made_from
+        scene = [(line, LOCATION) for line in self._wrap(scene_description)]
+        if items:
+            scene += [(line, ITEMS) for line in self._wrap(f"You see: {', '.join(items)}")]
+        scene = [self._fill(text, style, self.width) for text, style in scene[:self.SCENE_LINES]]
+        self._lines[:self.SCENE_LINES] = scene + [self._blank] * (self.SCENE_LINES - len(scene))
+        if exits != self._exits:
+            self._exits = exits
+            self._fill_lists()
+
+    def render_player_state(self, inventory: list[str], attributes: str):
+        if inventory != self._inventory:
+            self._inventory = inventory
+            self._fill_lists()
+        if attributes != self._attributes:
+            self._attributes = attributes
+            self._lines[self._attributes_row] = self._fill(attributes, ATTRIBUTES, self.width)
+
+    def _fill_lists(self):
+        "Fills in the exits and, beside them, the inventory."
+        exits = ["Exits:"] + [f"  {name}" for name in self._exits]
+        inventory = ["You are carrying:" if self._inventory else "You carry nothing."]
+        inventory += [f"  {name}" for name in self._inventory or ()]
+        left, right = self.width // 2, self.width - self.width // 2
+        for i in range(self.LIST_LINES):
+            exit_text, exit_styles = self._fill(exits[i] if i < len(exits) else "", EXITS, left)
+            item_text, item_styles = self._fill(inventory[i] if i < len(inventory) else "", INVENTORY, right)
+            self._lines[self._lists_row + i] = (exit_text + item_text, exit_styles + item_styles)
+
+    def render_message(self, message: str, style: str = MESSAGE):
+        for paragraph in message.splitlines():
+            for line in self._wrap(paragraph) or [""]:
+                del self._lines[self._log_row]
+                self._lines.append(self._fill(line, style, self.width))
+                self._scrolled += 1
+
+    # --- Drawing ---
+
+    def _scroll_log(self):
+        """
+        Moves the message log's lines up on the screen by scrolling just that
+        part of it, rather than writing each line again.
+        """
+        scrolled, self._scrolled = self._scrolled, 0
+        top, end = self._log_row, self._prompt_row
+        kept = self._shown[top + scrolled:end]
+        if scrolled >= end - top or all(line[0] == self._blank[0] for line in kept):
+            return  # Every line is written, or only blank ones would move
+        self._frame += (f"\x1b[{top + 1};{end}r", _move(end - 1, 0), "\n" * scrolled, "\x1b[r")
+        self._shown[top:end] = kept + [self._blank] * scrolled
+
+    def _draw(self):
+        """
+        Adds to the frame what it takes to change the screen into the new one.
+        Styles only show in characters, so spaces count as unchanged whatever
+        their style, and the blank end of a line is cleared rather than written.
+        """
+        frame = self._frame
+        if self._shown is None:
+            frame.append(CLEAR_SCREEN)
+            self._shown = [self._blank] * len(self._lines)
+            self._scrolled = 0
+        elif self._scrolled:
+            self._scroll_log()
+        style = None  # The style the terminal is in, unknown until one is sent
+        cursor = None
+        for row, (line, shown) in enumerate(zip(self._lines, self._shown)):
+            if line is shown or line == shown:
+                continue
+            (text, styles), (old_text, old_styles) = line, shown
+            # Outside the stretch where either line has characters, both are all spaces
+            tail = len(text.rstrip(" "))
+            first = min(len(text) - len(text.lstrip(" ")), len(old_text) - len(old_text.lstrip(" ")))
+            end = max(tail, len(old_text.rstrip(" ")))
+            if styles == old_styles:
+                changed = [
+                    column for column, char, old_char in zip(range(first, end), text[first:end], old_text[first:end])
+                    if char != old_char
+                ]
+            else:
+                changed = [
+                    column for column, char, old_char, char_style, old_style in zip(
+                        range(first, end), text[first:end], old_text[first:end],
+                        styles[first:end], old_styles[first:end],
+                    )
+                    if char != old_char or (char_style != old_style and char != " ")
+                ]
+            i, count = 0, len(changed)
+            while i < count:
+                start = last = changed[i]
+                if start >= tail:
+                    # Cleared from where the cursor is, if it's already past the last character
+                    if cursor is None or cursor[0] != row or cursor[1] < tail:
+                        frame.append(_move(row, start))
+                    frame.append(CLEAR_TO_END)
+                    break
+                if cursor != (row, start):
+                    frame.append(_move(row, start))
+                # Write on to the last change not followed by SKIP_AFTER unchanged cells
+                i += 1
+                while i < count and changed[i] < tail and changed[i] - last <= SKIP_AFTER:
+                    last = changed[i]
+                    i += 1
+                # Each stretch of one style, switching to it unless it is all spaces
+                while start <= last:
+                    code = styles[start]
+                    rest = styles[start:last + 1]
+                    length = len(rest) - len(rest.lstrip(code))
+                    piece = text[start:start + length]
+                    if code != style and not piece.isspace():
+                        style = code
+                        frame.append(STYLES[code])
+                    frame.append(piece)
+                    start += length
+                cursor = (row, last + 1)
+        self._shown = list(self._lines)
+
+    def flush(self, prompt: str = ""):
+        """
+        Changes the screen to show everything rendered, then shows `prompt`
+        on the prompt line if given, or leaves the cursor below the panes.
+        """
+        self._draw()
+        if prompt:
+            self._frame += (_move(self._prompt_row, 0), CLEAR_LINE, STYLES[PROMPT], prompt)
+        elif self._frame:
+            self._frame += (_move(self.height - 1, 0), STYLES[PLAIN])
+        super().flush()
+
+    def get_raw_command(self) -> str:
+        """Shows a prompt under the panes and gets a raw string command."""
+        try:
+            return self._input("> ").lower().strip()
+        except (EOFError, KeyboardInterrupt):
+            return "quit"
+
+    def get_menu_choice(self, choices: list[Command]) -> Command:
+        """Lists the choices in the message log and gets the player's choice."""
+        for i, command in enumerate(choices, 1):
+            self.render_message(f"{i}. {command.description}", PROMPT)
+        while True:
+            choice = self._input("What do you do? ")
+            if choice.isdigit() and 1 <= int(choice) <= len(choices):
+                return choices[int(choice) - 1]
+            self.render_message("Invalid choice. Please enter a number from the list.")
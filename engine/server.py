@@ -0,0 +1,248 @@
+"""
+An asyncio TCP server that hosts many concurrent games in one process.
+
+Each connection gets its own game, played with ``Game.play_async``. Players
+type one command per line, and while one session waits for its next line the
+others run, so no session needs a thread of its own. Run it with
+
+    python -m engine.server ship_game:ShipGame --port 4000 [--menu] [--profile turns.prom]
+
+and connect with ``python -m engine.client`` or any line-based client.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from statistics import fmean
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from .command import Command, QuitCommand
+from .profiling import TurnProfile
+from .rng import Rng
+from .simulator import load_game_class
+from .strategies import AsyncCliInputStrategy, AsyncMenuInputStrategy
+from .view import View
+
+if TYPE_CHECKING:
+    from .game import Game
+
+logger = logging.getLogger(__name__)
+
+# Sent whenever the server is ready for the next line; clients read up to it
+PROMPT = "\n> "
+
+
+@dataclass
+class TurnLatency:
+    """The time taken to answer each line a player sent, in seconds."""
+
+    samples: list[float] = field(default_factory=list)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def merge(self, other: TurnLatency):
+        self.samples.extend(other.samples)
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def __str__(self) -> str:
+        if not self.samples:
+            return "no turns"
+        return (
+            f"{len(self.samples)} turns, mean {fmean(self.samples) * 1e3:.3f} ms, "
+            f"p50 {self.percentile(0.5) * 1e3:.3f} ms, "
+            f"p99 {self.percentile(0.99) * 1e3:.3f} ms, "
+            f"max {max(self.samples) * 1e3:.3f} ms"
+        )
+
+
+class StreamView(View):
+    """
+    A view that plays over a network connection. A turn's output is kept
+    until the view prompts for the player's next line, and then written to
+    the connection in one piece with the prompt.
+
+    Measures each turn's latency: the time from receiving a line to being
+    ready for the next one.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.latency = TurnLatency()
+        self._received_at: float | None = None
+        self._frame: list[str] = []
+
+    def _write(self, text: str):
+        self._frame.append(text)
+        self._frame.append("\n")
+
+    def flush(self, prompt: str = ""):
+        if self._frame or prompt:
+            self._frame.append(prompt)
+            self.writer.write("".join(self._frame).encode())
+            self._frame.clear()
+
+    def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
+        self._write("\n" + "#" * 40)
+        self._write(scene_description)
+        if items:
+            self._write(f"You see: {', '.join(items)}")
+        if exits:
+            self._write(f"Obvious exits are: {', '.join(exits)}")
+        self._write("#" * 40)
+
+    def render_player_state(self, inventory: list[str], attributes: str):
+        if inventory:
+            self._write(f"You are carrying: {', '.join(inventory)}")
+        self._write(f"Attributes: {attributes}")
+
+    def render_message(self, message: str):
+        if message:
+            self._write(message)
+
+    async def _read_line(self) -> str | None:
+        "Prompts for and reads the player's next line, or None once they have gone."
+        if self._received_at is not None:
+            self.latency.record(perf_counter() - self._received_at)
+        self.flush(PROMPT)
+        await self.writer.drain()
+        try:
+            line = await self.reader.readline()
+        except (ConnectionError, ValueError):  # ValueError: the line is too long
+            line = b""
+        if not line:
+            self._received_at = None
+            return None
+        self._received_at = perf_counter()
+        return line.decode(errors="replace").lower().strip()
+
+    async def get_raw_command(self) -> str:
+        line = await self._read_line()
+        return "quit" if line is None else line
+
+    async def get_menu_choice(self, choices: list[Command]) -> Command:
+        self._write("\n--- Choices ---")
+        for i, command in enumerate(choices, 1):
+            self._write(f"{i}. {command.description}")
+        self._write("---------------")
+
+        while True:
+            choice = await self._read_line()
+            if choice is None:
+                return QuitCommand()
+            if choice.isdigit() and 1 <= int(choice) <= len(choices):
+                return choices[int(choice) - 1]
+            self.render_message("Invalid choice. Please enter a number from the list.")
+
+    async def close(self):
+        if self._received_at is not None:
+            self.latency.record(perf_counter() - self._received_at)
+        self.flush()
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class GameServer:
+    """
+    Serves a new game of `game_class` to each connection.
+
+    :param game_class: a Game subclass taking ``input_strategy``, ``view`` and ``rng``
+    :param menu: offer numbered menus rather than typed commands
+    :param seed: makes the sessions reproducible; each one plays with the
+        next child stream of the seed
+    :param profile: times the phases of every session's turns
+    """
+
+    def __init__(
+        self, game_class: type[Game], *, menu: bool = False, seed: int | None = None,
+        profile: TurnProfile | None = None,
+    ):
+        self.game_class = game_class
+        self.menu = menu
+        self.rng = Rng(seed)
+        self.profile = profile
+        self.active_sessions = 0
+        self.latency = TurnLatency()  # Of every finished session
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        "Plays one session to the end on a new connection."
+        peer = writer.get_extra_info("peername")
+        view = StreamView(reader, writer)
+        strategy = AsyncMenuInputStrategy() if self.menu else AsyncCliInputStrategy()
+        game = self.game_class(input_strategy=strategy, view=view, rng=self.rng.split())
+        game.profile = self.profile
+
+        self.active_sessions += 1
+        try:
+            await game.play_async()
+        except ConnectionError:
+            logger.info("%s disconnected", peer)
+        finally:
+            await view.close()
+            self.active_sessions -= 1
+            self.latency.merge(view.latency)
+            logger.info("%s: %s", peer, view.latency)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        "Starts listening; port 0 picks a free port."
+        # asyncio's default backlog of 100 stalls connections when thousands
+        # of players arrive at once
+        return await asyncio.start_server(self.handle, host, port, backlog=4096)
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 4000):
+        server = await self.start(host, port)
+        logger.info("Serving %s on %s", self.game_class.__name__,
+                    ", ".join(str(s.getsockname()) for s in server.sockets))
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Serve a game to many players over TCP.")
+    parser.add_argument("game", help="the Game subclass, as module:ClassName")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--menu", action="store_true", help="offer numbered menus")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--profile", metavar="PATH",
+                        help="keep the turns' timings in PATH, as .json or .prom, updated every minute")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    profile = TurnProfile() if args.profile else None
+    server = GameServer(load_game_class(args.game), menu=args.menu, seed=args.seed, profile=profile)
+
+    async def serve():
+        if profile:
+            asyncio.create_task(write_every(60, profile, args.profile))
+        await server.serve_forever(args.host, args.port)
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print(f"All sessions: {server.latency}")
+    finally:
+        if profile:
+            profile.write(args.profile)
+
+
+async def write_every(seconds: float, profile: TurnProfile, path: str):
+    "Writes `profile` to `path` every so often, for a metrics collector to pick up."
+    while True:
+        await asyncio.sleep(seconds)
+        profile.write(path)
+
+
+if __name__ == "__main__":
+    main()
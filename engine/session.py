@@ -0,0 +1,60 @@
+"""
+The state of one player's game, kept apart from the world they play in.
+
+A game's places, events and transitions are defined once and shared, unchanged,
+by every session playing it. What a player changes is recorded in their
+session's ``SessionState``: the items they have moved and the occurrences of
+events they have used up. Starting a session costs nothing, and a session's
+memory grows only with what its player has done.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .lookup import Inventory
+
+if TYPE_CHECKING:
+    from .event import Event
+    from .event_program import EventProgram, EventSchedule
+    from .inventory_item import InventoryItem
+    from .place import Place
+
+
+class SessionState:
+    """
+    A copy-on-write overlay on a shared world.
+
+    A place's items are copied into the overlay the first time the player
+    changes them; until then the place's own items are used. Events' used-up
+    occurrences are counted here rather than on the events.
+    """
+
+    def __init__(self):
+        # The items in each place the player has changed
+        self.items: dict[Place, Inventory] = {}
+        # id(event) -> occurrences left, for each event that has occurred
+        self.remaining: dict[int, int] = {}
+        # When each place's unlikely events are next due, drawn when first needed
+        self.schedules: dict[EventProgram, EventSchedule] = {}
+
+    def items_in(self, place: Place) -> Inventory:
+        "The items in `place` as this player sees them. Not to be changed directly."
+        items = self.items.get(place)
+        return place.inventory_items if items is None else items
+
+    def _changeable_items(self, place: Place) -> Inventory:
+        items = self.items.get(place)
+        if items is None:
+            items = self.items[place] = Inventory(place.inventory_items)
+        return items
+
+    def add_item(self, place: Place, item: InventoryItem):
+        self._changeable_items(place).append(item)
+
+    def remove_item(self, place: Place, item: InventoryItem):
+        self._changeable_items(place).remove(item)
+
+    def remaining_occurrences(self, event: Event) -> int:
+        "The number of times `event` may still occur in this session."
+        return self.remaining.get(id(event), event.remaining_occurrences)
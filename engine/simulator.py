@@ -0,0 +1,236 @@
+"""
+Headless simulation of many playthroughs, used to tune event probabilities.
+
+Each playthrough is a normal ``Game.play`` session driven by an automated
+input strategy and a view that discards all output. Runs are spread over a
+process pool and their outcomes are aggregated into a ``SimulationResult``.
+
+From the command line::
+
+    python -m engine.simulator ship_game:ShipGame --runs 100000 [--profile turns.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Callable
+
+from .command import QuitCommand
+from .game import Game
+from .profiling import TurnProfile
+from .rng import Rng
+from .strategies import InputStrategy, RandomInputStrategy
+from .view import NullView, View
+
+StrategyFactory = Callable[[], InputStrategy]
+
+
+@dataclass
+class SimulationResult:
+    """
+    Aggregate outcome of many playthroughs.
+
+    :param runs: the number of playthroughs
+    :param losses: how many ended with the suspense attribute at 0
+    :param turns: a histogram mapping turns survived to number of runs
+    :param attributes: for each attribute, a histogram of its final values
+    :param place_visits: how many times each place was entered, over all runs
+    :param profile: the timings of every run's turns, if they were profiled
+    """
+
+    runs: int = 0
+    losses: int = 0
+    turns: Counter = field(default_factory=Counter)
+    attributes: dict[str, Counter] = field(default_factory=dict)
+    place_visits: Counter = field(default_factory=Counter)
+    profile: TurnProfile | None = field(default=None, compare=False)
+
+    def merge(self, other: SimulationResult) -> SimulationResult:
+        "Add the outcomes of another result to this one."
+        self.runs += other.runs
+        self.losses += other.losses
+        self.turns.update(other.turns)
+        for name, values in other.attributes.items():
+            self.attributes.setdefault(name, Counter()).update(values)
+        self.place_visits.update(other.place_visits)
+        if other.profile is not None:
+            self.profile = (self.profile or TurnProfile()).merge(other.profile)
+        return self
+
+    @property
+    def mean_turns(self) -> float:
+        return _mean(self.turns)
+
+    def __str__(self) -> str:
+        lines = [f"Runs: {self.runs}, losses: {self.losses}"]
+        if self.turns:
+            lines.append(
+                f"Turns survived: mean {self.mean_turns:.2f}, "
+                f"min {min(self.turns)}, max {max(self.turns)}"
+            )
+        for name, values in self.attributes.items():
+            lines.append(
+                f"{name}: mean {_mean(values):.2f}, min {min(values)}, max {max(values)}"
+            )
+        for name, count in self.place_visits.most_common():
+            lines.append(f"\tVisits to {name}: {count}")
+        return "\n".join(lines)
+
+
+def _mean(histogram: Counter) -> float:
+    total = sum(histogram.values())
+    return sum(value * count for value, count in histogram.items()) / total if total else 0.0
+
+
+class _TrackingStrategy(InputStrategy):
+    """
+    Wraps the automated strategy to count turns and place visits, and ends
+    the game by quitting once the turn limit is reached.
+    """
+
+    def __init__(self, strategy: InputStrategy, max_turns: int, visits: Counter):
+        self.strategy = strategy
+        self.max_turns = max_turns
+        self.visits = visits
+        self.turns = 0
+        self.last_location = None
+
+    def record_location(self, game: Game):
+        if game.location is not self.last_location:
+            self.last_location = game.location
+            self.visits[game.location.name] += 1
+
+    def get_action(self, game: Game, view: View):
+        self.record_location(game)
+        if self.turns >= self.max_turns:
+            return QuitCommand()
+        self.turns += 1
+        return self.strategy.get_action(game, view)
+
+
+def play_headless(
+    game_class: type[Game],
+    strategy: InputStrategy,
+    rng: Rng,
+    max_turns: int,
+    result: SimulationResult,
+):
+    """Plays one game to the end without any output, adding its outcome to `result`."""
+    tracker = _TrackingStrategy(strategy, max_turns, result.place_visits)
+    game = game_class(input_strategy=tracker, view=NullView(), rng=rng)
+    game.profile = result.profile
+    game.play()
+    tracker.record_location(game)
+
+    result.runs += 1
+    result.turns[tracker.turns] += 1
+    suspense = game._attribute_name_for_suspense
+    if game.attributes.attribs[suspense] <= 0:
+        result.losses += 1
+    for name, value in game.attributes.items():
+        result.attributes.setdefault(name, Counter())[value] += 1
+
+
+def _run_chunk(
+    game_class: type[Game],
+    strategy_factory: StrategyFactory,
+    max_turns: int,
+    seed: int,
+    profile: bool,
+    runs: range,
+) -> SimulationResult:
+    root_rng = Rng(seed)
+    result = SimulationResult(profile=TurnProfile() if profile else None)
+    for run in runs:
+        play_headless(game_class, strategy_factory(), root_rng.child(run), max_turns, result)
+    return result
+
+
+def simulate(
+    game_class: type[Game],
+    runs: int,
+    *,
+    strategy_factory: StrategyFactory = RandomInputStrategy,
+    max_turns: int = 200,
+    workers: int | None = None,
+    seed: int | None = None,
+    profile: bool = False,
+) -> SimulationResult:
+    """
+    Plays `runs` complete games of `game_class` and aggregates the outcomes.
+
+    A 200-turn ShipGame run takes about 2 ms in one process (about 10 µs a
+    turn), so each worker plays roughly 500 runs a second.
+
+    :param game_class: a Game subclass taking ``input_strategy``, ``view`` and ``rng``
+    :param runs: the number of playthroughs
+    :param strategy_factory: makes an automated InputStrategy
+    :param max_turns: games still running after this many turns are ended
+    :param workers: the number of worker processes; defaults to the CPU count,
+        and 1 runs everything in this process
+    :param seed: makes the simulation reproducible; each run plays with its
+        own child stream of the seed, whichever worker it lands on
+    :param profile: time the phases of every turn, in the result's ``profile``
+    """
+    workers = workers or os.cpu_count() or 1
+    seed = Rng(seed).seed
+
+    # Several chunks per worker keeps all processes busy until the end
+    chunk_count = min(runs, workers * 4) or 1
+    chunks = [range(i, runs, chunk_count) for i in range(chunk_count)]
+    args = (
+        repeat(game_class),
+        repeat(strategy_factory),
+        repeat(max_turns),
+        repeat(seed),
+        repeat(profile),
+        chunks,
+    )
+
+    result = SimulationResult()
+    if workers == 1:
+        for chunk in map(_run_chunk, *args):
+            result.merge(chunk)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            for chunk in pool.map(_run_chunk, *args):
+                result.merge(chunk)
+    return result
+
+
+def load_game_class(target: str) -> type[Game]:
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Run headless playthroughs of a game.")
+    parser.add_argument("game", help="the Game subclass, as module:ClassName")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--profile", metavar="PATH", help="write the turns' timings to PATH, as .json or .prom")
+    args = parser.parse_args(argv)
+
+    result = simulate(
+        load_game_class(args.game),
+        args.runs,
+        max_turns=args.max_turns,
+        workers=args.workers,
+        seed=args.seed,
+        profile=args.profile is not None,
+    )
+    print(result)
+    if args.profile:
+        result.profile.write(args.profile)
+
+
+if __name__ == "__main__":
+    main()
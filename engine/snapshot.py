@@ -0,0 +1,327 @@
+"""
+Compact binary snapshots of a game session, for saving and checkpointing.
+
+A snapshot holds what makes one session different from every other game of
+its class:
+- where the player is;
+- what they carry;
+- their attributes;
+- their random number stream;
+- their ``SessionState``;
+- any fields the game names in ``snapshot_fields``.
+
+Places, items and events are stored as numbers from a ``WorldCatalog``, so a
+snapshot can only be restored into the same world, and snapshots made with
+``delta=True`` hold only what differs from the world as it was defined.
+"""
+
+from __future__ import annotations
+
+import operator
+import sys
+from array import array
+from hashlib import blake2b
+from struct import Struct
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from .event import Event
+from .lookup import Inventory
+from .player_attributes import PlayerAttributes
+from .session import SessionState
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .inventory_item import InventoryItem
+    from .place import Place
+
+MAGIC = b"TASN"
+FORMAT_VERSION = 1
+FULL = 1  # Header flag: every place and event is stored, not just the changed ones
+
+_HEADER = Struct("<4sBBQ")  # magic, format version, flags, world fingerprint
+_U8 = Struct("<B")
+_U16 = Struct("<H")
+_U32 = Struct("<I")
+_RNG = Struct("<QI")  # position, splits
+_I64 = Struct("<q")
+_F64 = Struct("<d")
+
+# Tags for the values of attributes and snapshot fields
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR = range(6)
+
+
+class WorldCatalog:
+    """
+    Numbers every place, item and event in a world, in the order they are
+    reached from the starting place, so the numbers are the same each time
+    the world is built.
+
+    :param start: the place where every game in the world starts
+    """
+
+    def __init__(self, start: Place):
+        self.places: list[Place] = []
+        self.items: list[InventoryItem] = []
+        self.events: list[Event] = []
+        # Keyed by id(), as items and events compare by value
+        self.place_ids: dict[int, int] = {}
+        self.item_ids: dict[int, int] = {}
+        self.event_ids: dict[int, int] = {}
+
+        self._add(self.places, self.place_ids, start)
+        for place in self.places:  # Grows as new places are reached
+            for item in place.inventory_items:
+                self._add(self.items, self.item_ids, item)
+            self._add_events(place.events)
+            for transition in place.transitions:
+                if transition.key is not None:
+                    self._add(self.items, self.item_ids, transition.key)
+                self._add(self.places, self.place_ids, transition.place)
+
+        names = "\n".join(
+            [p.name for p in self.places] + [i.name for i in self.items] + [e.message for e in self.events]
+        )
+        digest = blake2b(names.encode(), digest_size=8).digest()
+        self.fingerprint = int.from_bytes(digest, "little")
+
+    @staticmethod
+    def _add(things: list, ids: dict[int, int], thing):
+        if id(thing) not in ids:
+            ids[id(thing)] = len(things)
+            things.append(thing)
+
+    def _add_events(self, events: list):
+        stack = [e for e in reversed(events) if isinstance(e, Event)]
+        while stack:
+            event = stack.pop()
+            if id(event) in self.event_ids:
+                continue
+            self._add(self.events, self.event_ids, event)
+            for item in event.inventory_items:
+                self._add(self.items, self.item_ids, item)
+            stack.extend(reversed(event.else_events))
+            stack.extend(reversed(event.chained_events))
+
+    def _id(self, ids: dict[int, int], thing, kind: str) -> int:
+        number = ids.get(id(thing))
+        if number is None:
+            raise ValueError(f"{kind} {thing} is not part of this world")
+        return number
+
+    def place_id(self, place: Place) -> int:
+        return self._id(self.place_ids, place, "Place")
+
+    def item_ids_of(self, items: list[InventoryItem]) -> array:
+        return array("I", [self._id(self.item_ids, item, "Item") for item in items])
+
+
+_catalogs: WeakKeyDictionary[Place, WorldCatalog] = WeakKeyDictionary()
+
+
+def catalog_for(game: Game) -> WorldCatalog:
+    "The catalog of the game's shared world, made the first time it is needed."
+    start = game.shared_world()
+    catalog = _catalogs.get(start)
+    if catalog is None:
+        catalog = _catalogs[start] = WorldCatalog(start)
+    return catalog
+
+
+def _same(items: list, other_items: list) -> bool:
+    "Whether two lists hold the very same items, as items compare by value."
+    return len(items) == len(other_items) and all(map(operator.is_, items, other_items))
+
+
+def _little_endian(ids: array) -> bytes:
+    if sys.byteorder == "big":
+        ids = array(ids.typecode, ids)
+        ids.byteswap()
+    return ids.tobytes()
+
+
+class _Writer:
+    def __init__(self):
+        self.out = bytearray()
+
+    def u8(self, value: int):
+        self.out += _U8.pack(value)
+
+    def u16(self, value: int):
+        self.out += _U16.pack(value)
+
+    def u32(self, value: int):
+        self.out += _U32.pack(value)
+
+    def blob(self, value: bytes):
+        self.out += _U8.pack(len(value))
+        self.out += value
+
+    def text(self, value: str):
+        encoded = value.encode()
+        self.out += _U16.pack(len(encoded))
+        self.out += encoded
+
+    def ids(self, ids: array):
+        self.out += _U32.pack(len(ids))
+        self.out += _little_endian(ids)
+
+    def value(self, value: Any):
+        if value is None:
+            self.u8(_NONE)
+        elif value is True or value is False:
+            self.u8(_TRUE if value else _FALSE)
+        elif isinstance(value, int):
+            self.u8(_INT)
+            self.out += _I64.pack(value)
+        elif isinstance(value, float):
+            self.u8(_FLOAT)
+            self.out += _F64.pack(value)
+        elif isinstance(value, str):
+            self.u8(_STR)
+            self.text(value)
+        else:
+            raise TypeError(f"Snapshots can't hold a {type(value).__name__}")
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, struct: Struct) -> tuple:
+        values = struct.unpack_from(self.data, self.offset)
+        self.offset += struct.size
+        return values
+
+    def u8(self) -> int:
+        return self.unpack(_U8)[0]
+
+    def u16(self) -> int:
+        return self.unpack(_U16)[0]
+
+    def u32(self) -> int:
+        return self.unpack(_U32)[0]
+
+    def blob(self) -> bytes:
+        length = self.u8()
+        self.offset += length
+        return bytes(self.data[self.offset - length:self.offset])
+
+    def text(self) -> str:
+        length = self.u16()
+        self.offset += length
+        return str(self.data[self.offset - length:self.offset], "utf-8")
+
+    def array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        end = self.offset + count * values.itemsize
+        values.frombytes(self.data[self.offset:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        self.offset = end
+        return values
+
+    def ids(self) -> array:
+        return self.array("I", self.u32())
+
+    def value(self) -> Any:
+        tag = self.u8()
+        if tag == _INT:
+            return self.unpack(_I64)[0]
+        if tag == _FLOAT:
+            return self.unpack(_F64)[0]
+        if tag == _STR:
+            return self.text()
+        return {_NONE: None, _FALSE: False, _TRUE: True}[tag]
+
+
+def save_snapshot(game: Game, *, delta: bool = True) -> bytes:
+    """
+    Saves the session of `game`, whose world must come from ``shared_world``.
+
+    :param delta: store only the places and events that differ from the
+        world as defined; otherwise every place's items and every event's
+        remaining occurrences are stored
+    """
+    catalog = catalog_for(game)
+    state = game.state
+    w = _Writer()
+    w.out += _HEADER.pack(MAGIC, FORMAT_VERSION, 0 if delta else FULL, catalog.fingerprint)
+
+    w.u32(catalog.place_id(game.location))
+    seed, position, splits = game.rng.getstate()
+    w.blob(seed.to_bytes((seed.bit_length() + 7) // 8, "little"))
+    w.out += _RNG.pack(position, splits)
+    w.ids(catalog.item_ids_of(game.inventory))
+
+    attribs = game.attributes.attribs
+    w.u16(len(attribs))
+    for name, value in attribs.items():
+        w.text(name)
+        w.value(value)
+
+    if delta:
+        places = [p for p, items in state.items.items() if not _same(items, p.inventory_items)]
+    else:
+        places = catalog.places
+    w.u32(len(places))
+    for place in places:
+        w.u32(catalog.place_id(place))
+        w.ids(catalog.item_ids_of(state.items_in(place)))
+
+    if delta:
+        event_ids = catalog.event_ids
+        changed = [(event_ids[key], left) for key, left in state.remaining.items()]
+        changed = [(n, left) for n, left in changed if left != catalog.events[n].remaining_occurrences]
+    else:
+        changed = [(n, state.remaining_occurrences(e)) for n, e in enumerate(catalog.events)]
+    w.ids(array("I", [n for n, _ in changed]))
+    w.out += _little_endian(array("q", [left for _, left in changed]))
+
+    w.u16(len(game.snapshot_fields))
+    for name in game.snapshot_fields:
+        w.text(name)
+        w.value(getattr(game, name))
+    return bytes(w.out)
+
+
+def load_snapshot(game: Game, data: bytes):
+    """
+    Restores a session saved by ``save_snapshot`` into `game`, which must be
+    a game of the same world, such as a new one of the same class.
+    """
+    catalog = catalog_for(game)
+    r = _Reader(data)
+    magic, version, _flags, fingerprint = r.unpack(_HEADER)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a snapshot, or one from an unsupported version")
+    if fingerprint != catalog.fingerprint:
+        raise ValueError("The snapshot was saved from a different world")
+
+    game.location = catalog.places[r.u32()]
+    seed = int.from_bytes(r.blob(), "little")
+    position, splits = r.unpack(_RNG)
+    game.rng.setstate((seed, position, splits))
+    items = catalog.items
+    game.inventory = [items[n] for n in r.ids()]
+
+    game.attributes = PlayerAttributes({r.text(): r.value() for _ in range(r.u16())})
+
+    state = game.state = SessionState()
+    for _ in range(r.u32()):
+        place = catalog.places[r.u32()]
+        place_items = [items[n] for n in r.ids()]
+        if not _same(place_items, place.inventory_items):
+            state.items[place] = Inventory(place_items)
+
+    event_numbers = r.ids()
+    events = catalog.events
+    for n, left in zip(event_numbers, r.array("q", len(event_numbers))):
+        event = events[n]
+        if left != event.remaining_occurrences:
+            state.remaining[id(event)] = left
+
+    for _ in range(r.u16()):
+        name = r.text()
+        setattr(game, name, r.value())
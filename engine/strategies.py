@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from .command import (
     Command,
@@ -9,10 +12,21 @@ from .command import (
     QuitCommand,
     LookCommand,
     HelpCommand,
+    TravelCommand,
 )
-
+from .routes import routes_for
 from .view import View, CliView, MenuView
 
+if TYPE_CHECKING:
+    from .inventory_item import InventoryItem
+    from .lookup import Inventory
+    from .place import Place
+    from .transition import Transition
+
+
+# Returned by CliInputStrategy.parse for a line that should be typed again
+ASK_AGAIN = object()
+
 
 class InputStrategy(ABC):
     @abstractmethod
@@ -21,33 +35,125 @@ class InputStrategy(ABC):
 
 
 class MenuInputStrategy(InputStrategy):
-    """The Menu strategy, now updated to return Command objects."""
+    """
+    The Menu strategy, now updated to return Command objects.
+
+    Menus are cached for each place, along with the versions of the place, of
+    its items and of the player's inventory they were built from, so a menu is only rebuilt
+    after something in it changes. The commands in a menu are flyweights,
+    made once for each exit and item and shared by every menu they appear in.
+    """
+
+    def __init__(self):
+        # place -> (place version, its items and their version,
+        #           the player's inventory and its version, menu)
+        self._menus: dict[Place, tuple] = {}
+        # id(exit or item) -> (exit or item, command); holding on to the
+        # exit or item keeps its id from being reused
+        self._go_commands: dict[int, tuple[Transition, GoCommand]] = {}
+        self._take_commands: dict[int, tuple[InventoryItem, TakeCommand]] = {}
+        self._drop_commands: dict[int, tuple[InventoryItem, DropCommand]] = {}
+        self._quit_command = QuitCommand()
 
     def get_action(self, game, view: MenuView):
         # 1. Gather all possible commands from the current game state.
-        location = game.location
+        possible_commands = self.possible_commands(game)
+
+        # 2. Delegate to the view to show the menu and get the chosen command.
+        return view.get_menu_choice(possible_commands)
+
+    def possible_commands(self, game) -> list[Command]:
+        """
+        The list of commands the player may choose from. The same list is
+        returned for as long as nothing in it changes, so it must not be
+        modified.
+        """
+        location, inventory = game.location, game.inventory
+        items = game.state.items_in(location)
+        cached = self._menus.get(location)
+        if (
+            cached is not None
+            and cached[0] == location.version
+            and cached[1] is items
+            and cached[2] == items.version
+            and cached[3] is inventory
+            and cached[4] == inventory.version
+        ):
+            return cached[5]
+
+        menu = self._build_menu(location, items, inventory)
+        self._menus[location] = (
+            location.version, items, items.version, inventory, inventory.version, menu
+        )
+        return menu
+
+    def _build_menu(
+        self, location: Place, items: Inventory, inventory: Inventory
+    ) -> list[Command]:
         possible_commands = []
 
         # Add commands for transitions
         for t in location.get_transitions():
-            possible_commands.append(GoCommand(t))
+            possible_commands.append(self._flyweight(self._go_commands, t, GoCommand))
 
         # Add commands for selectable activities/events
         possible_commands.extend(location.get_selectable_commands())
 
         # Add commands for taking items
-        for i in location.inventory_items:
-            possible_commands.append(TakeCommand(i))
+        for i in items:
+            possible_commands.append(self._flyweight(self._take_commands, i, TakeCommand))
 
         # Add commands for dropping items
-        for i in game.inventory:
-            possible_commands.append(DropCommand(i))
+        for i in inventory:
+            possible_commands.append(self._flyweight(self._drop_commands, i, DropCommand))
 
         # Always add the quit option
-        possible_commands.append(QuitCommand())
+        possible_commands.append(self._quit_command)
 
-        # 2. Delegate to the view to show the menu and get the chosen command.
-        return view.get_menu_choice(possible_commands)
+        return possible_commands
+
+    @staticmethod
+    def _flyweight(commands: dict, target, command_class: type[Command]) -> Command:
+        "The command for `target`, made the first time it is needed."
+        entry = commands.get(id(target))
+        if entry is None:
+            entry = commands[id(target)] = (target, command_class(target))
+        return entry[1]
+
+
+class RandomInputStrategy(MenuInputStrategy):
+    """
+    An automated player that picks uniformly among the menu choices, never
+    choosing to quit. It draws from the game's own random numbers, so a
+    seeded game plays out the same way every time. Used to drive headless
+    simulations.
+
+    Only the chosen command is built: one number picks a position in the
+    menu, in the same order as ``possible_commands``, and the command for
+    that position is made.
+    """
+
+    def get_action(self, game, view: View):
+        location = game.location
+        transitions = location.get_transitions()
+        commands = location.get_selectable_commands()
+        items = game.state.items_in(location)
+        inventory = game.inventory
+
+        count = len(transitions) + len(commands) + len(items) + len(inventory)
+        if not count:
+            return None
+        choice = int(game.rng.random() * count)
+
+        if choice < len(transitions):
+            return GoCommand(transitions[choice])
+        choice -= len(transitions)
+        if choice < len(commands):
+            return commands[choice]
+        choice -= len(commands)
+        if choice < len(items):
+            return TakeCommand(items[choice])
+        return DropCommand(inventory[choice - len(items)])
 
 
 class CliInputStrategy(InputStrategy):
@@ -83,87 +189,107 @@ class CliInputStrategy(InputStrategy):
         }
 
     def get_action(self, game: "Game", view: CliView):
-        location = game.location
-
         while True:
             # command = input('\n> ').lower().strip()
-            command = view.get_raw_command()
-
-            if not command:
-                continue
-
-            parts = command.split(" ", 1)
-            verb = parts[0]
-            target = parts[1] if len(parts) > 1 else ""
-
-            # 1. Check for Quit
-            if verb in ["quit", "exit", "bye"]:
-                return QuitCommand()
-
-            # 1. Check for movement
-            potential_direction = self.direction_map.get(verb) or (
-                verb == "go" and self.direction_map.get(target)
-            )
-            if potential_direction:
-                for transition in location.get_transitions():
-                    if transition.direction == potential_direction:
-                        return GoCommand(transition)
-                print(f"You can't go {potential_direction}.")
-                continue
-
-            if verb == "go":
-                for transition in location.get_transitions():
-                    if target in transition.place.name.lower():
-                        return GoCommand(transition)
-                print(f"You can't go to a place called '{target}'.")
-                continue
-
-            # 2. Check the verb map for other commands
-            if verb in self.verb_map:
-                command_class = self.verb_map[verb]
-
-                if command_class is LookCommand:
-                    return LookCommand(target=target)
-
-                # Handle commands that need a target
-                if command_class in [TakeCommand, DropCommand]:
-                    if not target:
-                        view.render_message(f"What do you want to {verb}?")
-                        continue
-
-                    # Logic to find the specific item for Take/Drop...
-                    if command_class is TakeCommand:
-                        item_found = next(
-                            (
-                                i
-                                for i in location.inventory_items
-                                if target in i.name.lower()
-                            ),
-                            None,
-                        )
-                        if item_found:
-                            return TakeCommand(item_found)
-
-                    if command_class is DropCommand:
-                        item_found = next(
-                            (i for i in game.inventory if target in i.name.lower()),
-                            None,
-                        )
-                        if item_found:
-                            return DropCommand(item_found)
-
-                    if command_class is LookCommand:
-                        return LookCommand(
-                            target
-                        )  # LookCommand handles finding the item
-
-                # Handle commands that don't need a target
-                else:
-                    return command_class()
-
-            # 3. Check for selectable commands (like "play video games")
-            for cmd in location.get_selectable_commands():
-                if command in cmd.description.lower():
-                    return cmd
+            command = self.parse(game, view, view.get_raw_command())
+            if command is not ASK_AGAIN:
+                return command
+
+    def parse(self, game: "Game", view: View, command: str):
+        """
+        Turns a typed line into a Command, or None if it names nothing here.
+        Returns ASK_AGAIN, after telling the player why, if the line can't be
+        used and another should be read.
+        """
+        location = game.location
+        index = location.index
+
+        if not command:
+            return ASK_AGAIN
+
+        parts = command.split(" ", 1)
+        verb = parts[0]
+        target = parts[1] if len(parts) > 1 else ""
+
+        # 1. Check for Quit
+        if verb in ["quit", "exit", "bye"]:
+            return QuitCommand()
+
+        # 1. Check for movement
+        potential_direction = self.direction_map.get(verb) or (
+            verb == "go" and self.direction_map.get(target)
+        )
+        if potential_direction:
+            transition = index.directions.get(potential_direction)
+            if transition:
+                return GoCommand(transition)
+            view.render_message(f"You can't go {potential_direction}.")
+            return ASK_AGAIN
+
+        if verb == "go":
+            transition = index.exits.find(target)
+            if transition:
+                return GoCommand(transition)
+            view.render_message(f"You can't go to a place called '{target}'.")
+            return ASK_AGAIN
+
+        if verb == "travel":
+            target = target.removeprefix("to ").strip()
+            destination = routes_for(game).find(target) if target else None
+            if destination:
+                return TravelCommand(destination)
+            view.render_message(f"You don't know of a place called '{target}'.")
+            return ASK_AGAIN
+
+        # 2. Check the verb map for other commands
+        if verb in self.verb_map:
+            command_class = self.verb_map[verb]
+
+            if command_class is LookCommand:
+                return LookCommand(target=target)
+
+            # Handle commands that need a target
+            if command_class in [TakeCommand, DropCommand]:
+                if not target:
+                    view.render_message(f"What do you want to {verb}?")
+                    return ASK_AGAIN
+
+                # Logic to find the specific item for Take/Drop...
+                if command_class is TakeCommand:
+                    item_found = game.state.items_in(location).find(target)
+                    if item_found:
+                        return TakeCommand(item_found)
+
+                if command_class is DropCommand:
+                    item_found = game.inventory.find(target)
+                    if item_found:
+                        return DropCommand(item_found)
+
+            # Handle commands that don't need a target
+            else:
+                return command_class()
+
+        # 3. Check for selectable commands (like "play video games")
+        return index.commands.find(command)
+
+
+class AsyncCliInputStrategy(CliInputStrategy):
+    """
+    The CLI strategy for views that read lines asynchronously, such as a
+    network connection. The view's ``get_raw_command`` must be awaitable.
+    """
+
+    async def get_action(self, game: "Game", view: View):
+        while True:
+            command = self.parse(game, view, await view.get_raw_command())
+            if command is not ASK_AGAIN:
+                return command
 
-            return None
+
+class AsyncMenuInputStrategy(MenuInputStrategy):
+    """
+    The Menu strategy for views whose ``get_menu_choice`` is awaitable.
+    """
+
+    async def get_action(self, game, view: View):
+        return await view.get_menu_choice(self.possible_commands(game))
@@ -1,25 +1,34 @@
+import sys
 from typing import Callable
 from .inventory_item import InventoryItem
 # NOTE: We DO NOT import Place at the top level to avoid circular dependencies.
+# It is imported by the first transition made, as importing it again for each
+# one would take longer than the rest of making it.
+_Place = None
 
 class Transition:
     """
     Represents a one-way path from one Place to another,
     which may have conditions or require a key.
     """
+    __slots__ = ("place", "condition", "key", "direction")
+
     place: 'Place'
     condition: Callable[[], bool] | None
     key: InventoryItem | None
 
     def __init__(self, place: 'Place', condition: Callable[[], bool] | None = None, key: InventoryItem | None = None, direction: str | None = None):
-        # This local import is the key to breaking the circular dependency.
-        from .place import Place
-        assert isinstance(place, Place)
+        global _Place
+        if _Place is None:
+            # This local import is the key to breaking the circular dependency.
+            from .place import Place as _Place
+        assert isinstance(place, _Place)
 
         self.place = place
         self.condition = condition
         self.key = key
-        self.direction = direction
+        # Directions are few and repeated, so every transition shares one copy of each
+        self.direction = sys.intern(direction) if direction else direction
 
 
     def is_accessible(self, game: 'Game') -> bool:
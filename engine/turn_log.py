@@ -0,0 +1,404 @@
+"""
+An append-only log of the turns of a game session, and a replay engine that
+plays a log again as fast as it will go and checks that every turn comes
+out the same.
+
+Give a game a ``TurnLog`` as its ``turn_log`` before it plays. The log starts
+with a snapshot of the session and the input strategy it is played with,
+and then records each turn as it ends:
+- the position of the random number stream when the turn began;
+- the lines the player typed, or the number of the menu choice they made;
+- the command those resolved to;
+- the events that occurred;
+- the changes to the player's attributes;
+- where the player ended up, and whether the game went on.
+
+``replay`` restores the snapshot into a new game of the same class and plays
+it with the logged input and no view. Each turn's record is made again and
+compared with the logged one, and the first that differs raises a
+``ReplayDivergence``. Like snapshots, logs need a world from
+``Game.shared_world``. From the command line::
+
+    python -m engine.turn_log replay ship_game:ShipGame session.tlog
+    python -m engine.turn_log show session.tlog
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+from array import array
+from dataclasses import dataclass, field
+from struct import Struct
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from .rng import Rng
+from .snapshot import _U32, _Reader, _Writer, catalog_for, load_snapshot, save_snapshot
+from .strategies import InputStrategy
+from .view import NullView, View
+
+if TYPE_CHECKING:
+    from .command import Command
+    from .game import Game
+
+MAGIC = b"TALG"
+FORMAT_VERSION = 1
+
+_HEADER = Struct("<4sB")  # magic, format version
+_U64 = Struct("<Q")
+
+# What the player gave in a turn
+_NO_INPUT, _LINES, _MENU = range(3)
+
+
+class ReplayDivergence(Exception):
+    "A replayed game that didn't play out as its log says it did."
+
+    def __init__(self, turn: int, message: str):
+        super().__init__(f"Turn {turn}: {message}")
+        self.turn = turn
+
+
+@dataclass
+class TurnRecord:
+    """
+    One turn of a log.
+
+    :param rng_position: the draws made from the game's random numbers when the turn began
+    :param lines: the lines typed, including any that had to be typed again
+    :param choice: the number of the menu choice made, counting from 0
+    :param command: the class of the command, or "" if there was none
+    :param events: the catalog numbers of the events that occurred
+    :param changes: the changes to the player's attributes
+    :param location: the catalog number of the place the turn ended in
+    :param running: whether the game went on
+    """
+
+    rng_position: int
+    lines: list[str] = field(default_factory=list)
+    choice: int | None = None
+    command: str = ""
+    events: list[int] = field(default_factory=list)
+    changes: dict[str, int | float] = field(default_factory=dict)
+    location: int = 0
+    running: bool = True
+
+    @classmethod
+    def decode(cls, data: bytes) -> TurnRecord:
+        r = _Reader(data)
+        record = cls(r.unpack(_U64)[0])
+        kind = r.u8()
+        if kind == _LINES:
+            record.lines = [r.text() for _ in range(r.u16())]
+        elif kind == _MENU:
+            record.choice = r.u16()
+        record.command = r.text()
+        record.events = list(r.ids())
+        record.changes = {r.text(): r.value() for _ in range(r.u16())}
+        record.location = r.u32()
+        record.running = bool(r.u8())
+        return record
+
+    def differences(self, other: TurnRecord) -> str:
+        return "; ".join(
+            f"{name} was {value!r}, not {other.__dict__[name]!r}"
+            for name, value in self.__dict__.items() if value != other.__dict__[name]
+        )
+
+
+def _strategy_name(strategy: InputStrategy) -> str:
+    """
+    The input strategy's class, as module:ClassName. Replays are played
+    without waiting, so an asynchronous strategy is named by the class it
+    is the asynchronous form of.
+    """
+    cls = next(c for c in type(strategy).__mro__ if not inspect.iscoroutinefunction(c.get_action))
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load(target: str):
+    module_name, _, name = target.partition(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+class TurnLog:
+    """
+    Records each turn of a game, writing it to `out` when the turn ends.
+
+    :param out: a binary file, only ever written to at its end
+    """
+
+    def __init__(self, out: BinaryIO | None):
+        self.out = out
+        self.turns = 0
+        # The ids of the events that occur in a turn, added by the game
+        self.fired: list[int] = []
+        self._catalog = None
+        self._lines: list[str] = []
+        self._choice: int | None = None
+        self._rng_position = 0
+        self._values: list = []
+
+    def start(self, game: Game):
+        "Writes what the log starts from: the session as it is, and how its input is read."
+        self._catalog = catalog_for(game)
+        # Schedules aren't kept in snapshots, so they are drawn again from
+        # here on, just as they will be when the snapshot is replayed
+        game.state.schedules.clear()
+        w = _Writer()
+        w.out += _HEADER.pack(MAGIC, FORMAT_VERSION)
+        w.text(_strategy_name(game.input_strategy))
+        snapshot = save_snapshot(game)
+        w.u32(len(snapshot))
+        w.out += snapshot
+        self.out.write(w.out)
+
+    def input_view(self, view: View) -> View:
+        "The view for the input strategy to read the player's input from, which records it."
+        return _InputRecorder(view, self)
+
+    def begin_turn(self, game: Game):
+        self.fired.clear()
+        self._lines.clear()
+        self._choice = None
+        self._rng_position = game.rng.position
+        self._values = list(game.attributes.values)
+
+    def end_turn(self, game: Game, command: Command | None):
+        self.turns += 1
+        self._write(self._record(game, command))
+
+    def _record(self, game: Game, command: Command | None) -> bytes:
+        catalog = self._catalog
+        w = _Writer()
+        w.out += _U64.pack(self._rng_position)
+        if self._choice is not None:
+            w.u8(_MENU)
+            w.u16(self._choice)
+        elif self._lines:
+            w.u8(_LINES)
+            w.u16(len(self._lines))
+            for line in self._lines:
+                w.text(line)
+        else:
+            w.u8(_NO_INPUT)
+        w.text(type(command).__name__ if command is not None else "")
+        w.ids(array("I", [catalog.event_ids[event_id] for event_id in self.fired]))
+
+        names, before = game.attributes.schema.names, self._values
+        changes = []
+        for slot, value in enumerate(game.attributes.values):
+            old = before[slot] if slot < len(before) else None
+            if value != old:
+                changes.append((names[slot], (value or 0) - (old or 0)))
+        w.u16(len(changes))
+        for name, change in changes:
+            w.text(name)
+            w.value(change)
+
+        w.u32(catalog.place_id(game.location))
+        w.u8(game.is_running)
+        return bytes(w.out)
+
+    def _write(self, record: bytes):
+        self.out.write(_U32.pack(len(record)) + record)
+
+
+class _InputRecorder:
+    "Passes on a view's input, recording it in a turn log."
+
+    def __init__(self, view: View, log: TurnLog):
+        self._view = view
+        self._log = log
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._view, name)
+
+    def get_raw_command(self):
+        line = self._view.get_raw_command()
+        if inspect.isawaitable(line):
+            return self._line_when_read(line)
+        self._log._lines.append(line)
+        return line
+
+    async def _line_when_read(self, reading) -> str:
+        line = await reading
+        self._log._lines.append(line)
+        return line
+
+    def get_menu_choice(self, choices: list[Command]):
+        choice = self._view.get_menu_choice(choices)
+        if inspect.isawaitable(choice):
+            return self._choice_when_made(choice, choices)
+        self._log._choice = _index(choices, choice)
+        return choice
+
+    async def _choice_when_made(self, choosing, choices: list[Command]) -> Command:
+        choice = await choosing
+        self._log._choice = _index(choices, choice)
+        return choice
+
+
+def _index(choices: list[Command], choice: Command) -> int:
+    return next(i for i, command in enumerate(choices) if command is choice)
+
+
+# --- Replaying ---
+
+
+class _EndOfLog(Exception):
+    pass
+
+
+class _ReplayLog(TurnLog):
+    "Gives a game the logged input, turn by turn, and checks each turn against its record."
+
+    def __init__(self, records: list[bytes]):
+        super().__init__(None)
+        self._records = records
+        self._logged: TurnRecord | None = None
+        self._next_line = 0
+
+    def start(self, game: Game):
+        self._catalog = catalog_for(game)
+
+    def input_view(self, view: View) -> View:
+        return _InputPlayer(self)
+
+    def begin_turn(self, game: Game):
+        if self.turns == len(self._records):
+            raise _EndOfLog
+        super().begin_turn(game)
+        self._logged = None  # Decoded if the input is asked for
+        self._next_line = 0
+
+    def _logged_turn(self) -> TurnRecord:
+        if self._logged is None:
+            self._logged = TurnRecord.decode(self._records[self.turns])
+        return self._logged
+
+    def next_line(self) -> str:
+        lines = self._logged_turn().lines
+        if self._next_line == len(lines):
+            raise ReplayDivergence(self.turns + 1, f"more input was asked for than the {len(lines)} lines logged")
+        self._next_line += 1
+        self._lines.append(lines[self._next_line - 1])
+        return lines[self._next_line - 1]
+
+    def next_choice(self) -> int:
+        choice = self._logged_turn().choice
+        if choice is None:
+            raise ReplayDivergence(self.turns + 1, "a menu choice was asked for, but none was logged")
+        self._choice = choice
+        return choice
+
+    def _write(self, record: bytes):
+        logged = self._records[self.turns - 1]
+        if record != logged:
+            replayed = TurnRecord.decode(record)
+            raise ReplayDivergence(self.turns, TurnRecord.decode(logged).differences(replayed))
+
+
+class _InputPlayer(NullView):
+    "A view that gives the input strategy the logged input."
+
+    def __init__(self, log: _ReplayLog):
+        self._log = log
+
+    def get_raw_command(self) -> str:
+        return self._log.next_line()
+
+    def get_menu_choice(self, choices: list[Command]) -> Command:
+        return choices[self._log.next_choice()]
+
+
+def read_turn_log(data: bytes) -> tuple[str, bytes, list[bytes]]:
+    """
+    The input strategy a log was played with, the snapshot it starts from,
+    and its turns' records. A turn whose record was cut short, as it would
+    be by a crash, is left out.
+    """
+    r = _Reader(data)
+    magic, version = r.unpack(_HEADER)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a turn log, or one from an unsupported version")
+    strategy = r.text()
+    length = r.u32()
+    snapshot = bytes(r.data[r.offset:r.offset + length])
+    r.offset += length
+    records = []
+    while r.offset + _U32.size <= len(data):
+        length = r.u32()
+        if r.offset + length > len(data):
+            break
+        records.append(bytes(r.data[r.offset:r.offset + length]))
+        r.offset += length
+    return strategy, snapshot, records
+
+
+@dataclass
+class ReplayResult:
+    "How long a replay took."
+
+    turns: int
+    seconds: float
+
+    def __str__(self) -> str:
+        rate = self.turns / self.seconds if self.seconds else float("inf")
+        return f"{self.turns} turns replayed in {self.seconds * 1e3:.1f} ms, {rate:,.0f} turns/s"
+
+
+def replay(game_class: type[Game], data: bytes, strategy: InputStrategy | None = None) -> ReplayResult:
+    """
+    Plays a logged session again, without a view, checking that each turn
+    comes out as it was logged.
+
+    :param game_class: the class of the logged game, taking ``input_strategy``, ``view`` and ``rng``
+    :param data: the log
+    :param strategy: the input strategy to play with; by default, a new one
+        of the class the log was played with
+    :raise ReplayDivergence: at the first turn that comes out differently
+    """
+    strategy_name, snapshot, records = read_turn_log(data)
+    if strategy is None:
+        strategy = _load(strategy_name)()
+    game = game_class(input_strategy=strategy, view=NullView(), rng=Rng())
+    load_snapshot(game, snapshot)
+    log = game.turn_log = _ReplayLog(records)
+
+    started = perf_counter()
+    try:
+        game.play()
+    except _EndOfLog:
+        pass
+    seconds = perf_counter() - started
+    if log.turns < len(records):
+        raise ReplayDivergence(log.turns, f"the game ended, but {len(records) - log.turns} more turns were logged")
+    return ReplayResult(log.turns, seconds)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Replay or show a turn log.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    replaying = commands.add_parser("replay", help="play a log again, checking every turn")
+    replaying.add_argument("game", help="the Game subclass, as module:ClassName")
+    replaying.add_argument("log")
+    showing = commands.add_parser("show", help="print each turn of a log")
+    showing.add_argument("log")
+    args = parser.parse_args(argv)
+
+    with open(args.log, "rb") as file:
+        data = file.read()
+    if args.command == "replay":
+        print(replay(_load(args.game), data))
+    else:
+        strategy, snapshot, records = read_turn_log(data)
+        print(f"Played with {strategy}, from a {len(snapshot)} byte snapshot")
+        for turn, record in enumerate(records, 1):
+            print(turn, TurnRecord.decode(record))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
+import sys
 from abc import ABC, abstractmethod
+from typing import TextIO
+
 from .command import Command
-from colorama import init, Fore, Style
 
 
 class View(ABC):
     """The base interface for all game views."""
 
+    # False for views that discard everything, so callers can skip preparing output
+    renders_output = True
+
     @abstractmethod
     def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
         """Renders the primary description of a location."""
@@ -21,133 +26,137 @@ class View(ABC):
         """Renders a feedback message from a command or event."""
         pass
 
+    def flush(self):
+        """Shows anything rendered but not yet shown. Called by the game once a turn."""
+        pass
 
-class CliView(View):
-    """A view for a classic command-line interface."""
 
-    # --- The render methods are the same as before ---
+class NullView(View):
+    """
+    A view that discards all output, for headless and simulated games. The
+    game and its events see ``renders_output`` and don't format any.
+    """
+
+    renders_output = False
+
     def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
-        print("\n" + "#" * 40)
-        print(scene_description)
-        if items:
-            print(f"You see: {', '.join(items)}")
-        if exits:
-            print(f"Obvious exits are: {', '.join(exits)}")
-        print("#" * 40)
+        pass
 
     def render_player_state(self, inventory: list[str], attributes: str):
-        if inventory:
-            print(f"You are carrying: {', '.join(inventory)}")
-        print(f"Attributes: {attributes}")
+        pass
 
     def render_message(self, message: str):
-        if message:
-            print(message)
-
-    def get_raw_command(self) -> str:
-        """Displays a simple prompt and gets a raw string command."""
-        try:
-            return input("\n> ").lower().strip()
-        except (EOFError, KeyboardInterrupt):
-            return "quit"
+        pass
 
 
-class ColoramaView(View):
+class BufferedView(View):
     """
-    A fun and whimsical command-line view that uses colorama and emojis for styling.
+    A view that renders a turn's output into a frame and writes it out in
+    one go: when it prompts for the player's input, or when the game
+    flushes it at the end of a turn.
+
+    :param out: where to write, sys.stdout if not given
     """
 
-    def __init__(self):
-        init(autoreset=True)
-        # The color palette remains the same
-        self.LOCATION_STYLE = Fore.CYAN + Style.BRIGHT
-        self.EXITS_STYLE = Fore.GREEN
-        self.ITEMS_STYLE = Fore.YELLOW
-        self.PROMPT_STYLE = Fore.MAGENTA + Style.BRIGHT
-        self.MESSAGE_STYLE = Fore.WHITE
-        self.ERROR_STYLE = Fore.RED + Style.BRIGHT
-        self.SEPARATOR_STYLE = Fore.BLUE + Style.DIM
+    def __init__(self, out: TextIO | None = None):
+        self._out = out
+        self._frame: list[str] = []
+
+    def _line(self, text: str):
+        self._frame.append(text)
+        self._frame.append("\n")
+
+    def flush(self, prompt: str = ""):
+        "Writes out the frame, followed by `prompt` if given."
+        if not self._frame and not prompt:
+            return
+        self._frame.append(prompt)
+        out = self._out or sys.stdout
+        out.write("".join(self._frame))
+        out.flush()
+        self._frame.clear()
 
+    def _input(self, prompt: str) -> str:
+        self.flush(prompt)
+        return input()
+
+
+class CliView(BufferedView):
+    """A view for a classic command-line interface."""
+
+    # --- The render methods are the same as before ---
     def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
-        separator = self.SEPARATOR_STYLE + "~" * 50
-        print(f"\n{separator}")
-        # NEW: Added a compass emoji
-        print(self.LOCATION_STYLE + f"🧭 {scene_description}")
+        self._line("\n" + "#" * 40)
+        self._line(scene_description)
         if items:
-            # NEW: Added a magnifying glass emoji
-            print(self.ITEMS_STYLE + f"🔎 You see: {', '.join(items)}")
+            self._line(f"You see: {', '.join(items)}")
         if exits:
-            # NEW: Added a door emoji
-            print(self.EXITS_STYLE + f"🚪 Obvious exits are: {', '.join(exits)}")
-        print(separator)
+            self._line(f"Obvious exits are: {', '.join(exits)}")
+        self._line("#" * 40)
 
     def render_player_state(self, inventory: list[str], attributes: str):
         if inventory:
-            # NEW: Added a backpack emoji
-            print(Style.BRIGHT + f"🎒 You are carrying: {', '.join(inventory)}")
-        # NEW: Added a scroll emoji
-        print(f"📜 Attributes: {attributes}")
+            self._line(f"You are carrying: {', '.join(inventory)}")
+        self._line(f"Attributes: {attributes}")
 
     def render_message(self, message: str):
         if message:
-            # NEW: Added a speech bubble emoji
-            print(self.MESSAGE_STYLE + f"💬 {message}")
+            self._line(message)
 
     def get_raw_command(self) -> str:
-        """The CLI-specific input prompt (already whimsical!)."""
+        """Displays a simple prompt and gets a raw string command."""
         try:
-            return input(self.PROMPT_STYLE + "✨ > ").lower().strip()
+            return self._input("\n> ").lower().strip()
         except (EOFError, KeyboardInterrupt):
             return "quit"
 
-    def get_menu_choice(self, choices: list[Command]) -> Command:
-        """The Menu-specific input prompt, now with more magic."""
-        # NEW: Added a magic wand emoji
-        print(self.PROMPT_STYLE + "\n--- 🪄 What wondrous deed to do? ---")
-        for i, command in enumerate(choices, 1):
-            print(f"{self.LOCATION_STYLE}{i}. {Style.RESET_ALL}{command.description}")
-        print(self.PROMPT_STYLE + "----------------------------------")
-
-        while True:
-            # NEW: Added a crystal ball emoji
-            choice = input(self.PROMPT_STYLE + "Choose thy fate 🔮: ")
-            if choice.isdigit() and 1 <= int(choice) <= len(choices):
-                return choices[int(choice) - 1]
-            self.render_message(
-                self.ERROR_STYLE + "A most invalid choice! Pray, try again."
-            )
-
 
-class MenuView(View):
+class MenuView(BufferedView):
     """A view for a classic menu-driven interface."""
 
     def render_scene(self, scene_description: str, exits: list[str], items: list[str]):
-        print("\n" + "#" * 40)
-        print(scene_description)
+        self._line("\n" + "#" * 40)
+        self._line(scene_description)
         if items:
-            print(f"You see: {', '.join(items)}")
+            self._line(f"You see: {', '.join(items)}")
         if exits:
-            print(f"Obvious exits are: {', '.join(exits)}")
-        print("#" * 40)
+            self._line(f"Obvious exits are: {', '.join(exits)}")
+        self._line("#" * 40)
 
     def render_player_state(self, inventory: list[str], attributes: str):
         if inventory:
-            print(f"You are carrying: {', '.join(inventory)}")
-        print(f"Attributes: {attributes}")
+            self._line(f"You are carrying: {', '.join(inventory)}")
+        self._line(f"Attributes: {attributes}")
 
     def render_message(self, message: str):
         if message:
-            print(message)
+            self._line(message)
+
+    def __init__(self, out: TextIO | None = None):
+        super().__init__(out)
+        # The last menu shown, and its text, reused while the menu is unchanged
+        self._menu: list[Command] | None = None
+        self._menu_text = ""
 
     def get_menu_choice(self, choices: list[Command]) -> Command:
         """Displays a menu of commands and gets the user's choice."""
-        print("\n--- Choices ---")
-        for i, command in enumerate(choices, 1):
-            print(f"{i}. {command.description}")
-        print("---------------")
+        if choices is not self._menu:
+            lines = [f"{i}. {command.description}" for i, command in enumerate(choices, 1)]
+            self._menu, self._menu_text = choices, "\n".join(lines)
+        self._line("\n--- Choices ---")
+        self._line(self._menu_text)
+        self._line("---------------")
 
         while True:
-            choice = input("What do you do? ")
+            choice = self._input("What do you do? ")
             if choice.isdigit() and 1 <= int(choice) <= len(choices):
                 return choices[int(choice) - 1]
             self.render_message("Invalid choice. Please enter a number from the list.")
+
+
+def __getattr__(name: str):
+    # ColoramaView is in a module of its own, imported with colorama only when it is used
+    if name == "ColoramaView":
+        from .colorama_view import ColoramaView
+        return ColoramaView
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,191 @@
+"""
+Worlds described in JSON files rather than built in Python code.
+
+A world file names the place to start in, the items in the world and its
+places, with their events and exits::
+
+    {
+      "start": "Bridge",
+      "attribute": "Health",
+      "items": {
+        "suit": {"name": "Spacesuit", "description": "A bulky EVA suit."}
+      },
+      "places": {
+        "Bridge": {
+          "description": "You are on the bridge.",
+          "events": [
+            {"probability": 0.1, "message": "The doctor helps you.", "change": 30,
+             "max_occurrences": 5, "items": ["suit"],
+             "chain": [...], "else": [...]},
+            {"command": "ship_game:VisitFriendsCommand", "args": []}
+          ],
+          "items": ["suit"],
+          "exits": [
+            "Lift",
+            {"to": "Planet", "direction": "down", "key": "suit", "reverse": true}
+          ]
+        }
+      }
+    }
+
+A change given as a number applies to the world's "attribute", or to the
+game's suspense attribute if the file doesn't name one. Exits with
+"reverse" also lead back, in the opposite direction, as with
+``Place.add_transitions(..., reverse=True)``; a place's return exits come
+after its own. Transition conditions can't be described in a file.
+
+Places are built lazily: a place reached through an exit holds only its
+name, enough to be listed as an exit, until it is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from typing import Any
+
+from .event import Event
+from .inventory_item import InventoryItem
+from .place import OPPOSITE_DIRECTIONS, Place
+from .transition import Transition
+
+
+class LazyPlace(Place):
+    """
+    A place from a world file that is built the first time anything but its
+    name is asked for.
+    """
+
+    __slots__ = ("_loader",)
+
+    def __init__(self, name: str, loader: WorldLoader):
+        self.name = name
+        self._loader = loader
+
+    def __getattr__(self, attribute: str):
+        # Only called for attributes that aren't set, which before loading is all but the name
+        loader = self._loader
+        if loader is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {attribute!r}")
+        self._loader = None
+        loader.build(self)
+        return getattr(self, attribute)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loader is None
+
+
+class WorldLoader:
+    """
+    Builds the places of a world file as they are needed.
+
+    :param world: the parsed contents of a world file
+    """
+
+    def __init__(self, world: dict[str, Any]):
+        self._definitions: dict[str, dict] = dict(world["places"])
+        self.place_names: list[str] = list(self._definitions)
+        self._item_definitions: dict[str, dict] = world.get("items", {})
+        self._items: dict[str, InventoryItem] = {}
+        self._places: dict[str, LazyPlace] = {}
+        self.attribute: str | None = world.get("attribute") or getattr(Event, "default_attribute", None)
+
+        # Return exits are found now, so a place can be built without building its neighbors
+        self._return_exits: dict[str, list[dict]] = {}
+        for name, definition in self._definitions.items():
+            for link in definition.get("exits", ()):
+                link = self._exit(link)
+                self._check_place(link["to"], name)
+                if link.get("reverse"):
+                    back = {"to": name, "direction": OPPOSITE_DIRECTIONS.get(link.get("direction"))}
+                    self._return_exits.setdefault(link["to"], []).append(back)
+        self._check_place(world["start"], "start")
+        self.start = self.place(world["start"])
+
+    def _check_place(self, name: str, referrer: str):
+        if name not in self._definitions:
+            raise ValueError(f"Unknown place {name!r}, in {referrer!r}")
+
+    @staticmethod
+    def _exit(link: str | dict) -> dict:
+        return {"to": link} if isinstance(link, str) else link
+
+    def place(self, name: str) -> LazyPlace:
+        "The place called `name`, which is built when first used."
+        place = self._places.get(name)
+        if place is None:
+            place = self._places[name] = LazyPlace(name, self)
+        return place
+
+    def item(self, key: str) -> InventoryItem:
+        item = self._items.get(key)
+        if item is None:
+            definition = self._item_definitions.get(key)
+            if definition is None:
+                raise ValueError(f"Unknown item {key!r}")
+            item = self._items[key] = InventoryItem(
+                definition.get("name", key),
+                definition.get("description", ""),
+                definition.get("acquire_probability", 1),
+            )
+        return item
+
+    def build(self, place: LazyPlace):
+        "Fills in a place from its definition, which is no longer kept afterwards."
+        definition = self._definitions.pop(place.name)
+        Place.__init__(
+            place,
+            place.name,
+            definition.get("description", ""),
+            [self._event(e) for e in definition.get("events", ())],
+            [self.item(key) for key in definition.get("items", ())],
+        )
+        exits = [self._exit(e) for e in definition.get("exits", ())]
+        for link in exits + self._return_exits.pop(place.name, []):
+            key = link.get("key")
+            place.add_transition(Transition(
+                self.place(link["to"]),
+                key=self.item(key) if key is not None else None,
+                direction=link.get("direction"),
+            ))
+
+    def _event(self, definition: dict):
+        if "command" in definition:
+            return _import(definition["command"])(*definition.get("args", ()))
+
+        change = definition.get("change", 0)
+        if not isinstance(change, dict):
+            if self.attribute is None:
+                raise ValueError(f"No attribute is named for the change in {definition['message']!r}")
+            change = {self.attribute: change}
+        event = Event(
+            definition["probability"],
+            definition["message"],
+            change,
+            definition.get("max_occurrences", 100_000),
+        )
+        if "items" in definition:
+            event.add_items(*(self.item(key) for key in definition["items"]))
+        if "chain" in definition:
+            event.chain(*(self._event(e) for e in definition["chain"]))
+        if "else" in definition:
+            event.add_else_events(*(self._event(e) for e in definition["else"]))
+        return event
+
+
+def _import(target: str):
+    module_name, _, name = target.partition(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def load_world(source: str | os.PathLike | dict[str, Any]) -> Place:
+    """
+    Reads a world file, or an already parsed one, returning the place where
+    the player starts. Other places are built as the player reaches them.
+    """
+    if not isinstance(source, dict):
+        with open(source, encoding="utf-8") as file:
+            source = json.load(file)
+    return WorldLoader(source).start
@@ -0,0 +1,250 @@
+"""
+Synthetic worlds of any size, for finding out how the engine scales.
+
+A ``WorldSpec`` describes a world by its shape rather than its places: how
+many places there are, how many exits each leads out of, how many of those
+have a direction and how many are locked, the events in each place and how
+deeply they chain, and how many places hold an item. The same spec and seed
+always make the same world::
+
+    places = generate_world(WorldSpec(places=100_000, branching=3, seed=7))
+
+``generated_game`` makes a Game class playing a spec's world, which the
+simulator and the benchmarks can play like any other game. From the command
+line, the world is built and described, and played with ``--runs``::
+
+    python -m engine.world_generator --places 1000000 [--branching N] ... [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copyreg
+import gc
+import random
+import resource
+from array import array
+from dataclasses import dataclass, fields
+from time import perf_counter
+
+from .event import Event
+from .game import Game
+from .inventory_item import InventoryItem
+from .place import OPPOSITE_DIRECTIONS, Place
+from .player_attributes import PlayerAttributes
+from .transition import Transition
+
+# The attributes changed by the events, the first of which is the game's suspense attribute
+ATTRIBUTES = ("Health", "Luck", "Gold")
+
+DIRECTIONS = tuple(OPPOSITE_DIRECTIONS)
+_OPPOSITES = [DIRECTIONS.index(OPPOSITE_DIRECTIONS[d]) for d in DIRECTIONS]
+_SEARCH_ORDERS = [[(start + i) % len(DIRECTIONS) for i in range(len(DIRECTIONS))] for start in range(len(DIRECTIONS))]
+
+
+@dataclass(frozen=True)
+class WorldSpec:
+    """
+    The shape of a synthetic world.
+
+    :param places: the number of places
+    :param branching: the exits each place adds, each of which also leads
+        back, so a place has about twice as many. The first leads to an
+        earlier place, so every place can be reached from the first.
+    :param directional: the fraction of exits with a direction, such as
+        "north"; the rest are gone through by the name of the place they
+        lead to. An exit keeps to its name when no direction is free at
+        both of its ends.
+    :param locked: the fraction of exits, other than the first of each
+        place, that need a key. Each key is put in a random place.
+    :param events_per_place: the events in each place
+    :param chain_depth: how deeply the first event of each place has events
+        chained to it, each of which may occur if the one before does
+    :param else_depth: how deeply the first event of each place has “else”
+        events, each of which may occur if the one before doesn't
+    :param item_density: the fraction of places with an item in them
+    :param max_probability: the events are less likely than this
+    :param seed: the world is the same for the same spec and seed
+    """
+
+    places: int = 1000
+    branching: int = 2
+    directional: float = 0.5
+    locked: float = 0.1
+    events_per_place: int = 3
+    chain_depth: int = 1
+    else_depth: int = 1
+    item_density: float = 0.1
+    max_probability: float = 0.2
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.places < 1:
+            raise ValueError(f"A world needs at least one place, not {self.places}")
+        for name in ("branching", "events_per_place", "chain_depth", "else_depth"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} can't be negative")
+        for name in ("directional", "locked", "item_density", "max_probability"):
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"{name} must be between 0 and 1, not {getattr(self, name)}")
+
+
+def generate_world(spec: WorldSpec) -> list[Place]:
+    """
+    Builds the places of the world `spec` describes. The player starts in
+    the first. The garbage collector is off meanwhile, as the objects made
+    are all kept, and it would otherwise look through them again and again.
+    """
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _generate(spec)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _generate(spec: WorldSpec) -> list[Place]:
+    rnd = random.Random(spec.seed)
+    places = [
+        Place(
+            f"Place {n}",
+            events=_events(spec, n, rnd.random),
+            inventory_items=[InventoryItem(f"Item {n}", "Something to carry.")]
+            if rnd.random() < spec.item_density else None,
+        )
+        for n in range(spec.places)
+    ]
+    _link(spec, places, rnd)
+    return places
+
+
+def _events(spec: WorldSpec, n: int, random) -> list[Event] | None:
+    if not spec.events_per_place:
+        return None
+    events = []
+    for e in range(spec.events_per_place):
+        change = {ATTRIBUTES[e % len(ATTRIBUTES)]: int(random() * 11) - 5}
+        events.append(Event(random() * spec.max_probability, f"Event {e} in place {n}.", change))
+    # Nested before the events join the place, so it isn't told of each one
+    event = events[0]
+    for depth in range(spec.chain_depth):
+        chained = Event(0.5, f"Chained event {depth} in place {n}.", {ATTRIBUTES[1]: 1})
+        event.chain(chained)
+        event = chained
+    event = events[0]
+    for depth in range(spec.else_depth):
+        otherwise = Event(0.5, f"Else event {depth} in place {n}.", {ATTRIBUTES[0]: -1})
+        event.add_else_events(otherwise)
+        event = otherwise
+    return events
+
+
+def _link(spec: WorldSpec, places: list[Place], rnd: random.Random):
+    count = len(places)
+    random, randrange = rnd.random, rnd.randrange
+    # The directions already taken at each place, one bit for each
+    taken = array("H", bytes(2 * count))
+    keys = 0
+    for n, here in enumerate(places):
+        for b in range(spec.branching):
+            key = None
+            if b == 0:
+                if n == 0:
+                    continue
+                m = randrange(n)
+            else:
+                m = randrange(count)
+                if m == n:
+                    continue
+                if random() < spec.locked:
+                    key = InventoryItem(f"Key {keys}", f"The key to {places[m].name}.")
+                    places[randrange(count)].add_item(key)
+                    keys += 1
+            direction = back = None
+            if random() < spec.directional:
+                # The first direction free at both ends, from a random one on
+                start = randrange(len(DIRECTIONS))
+                for d in _SEARCH_ORDERS[start]:
+                    o = _OPPOSITES[d]
+                    if not (taken[n] >> d & 1 or taken[m] >> o & 1):
+                        taken[n] |= 1 << d
+                        taken[m] |= 1 << o
+                        direction, back = DIRECTIONS[d], DIRECTIONS[o]
+                        break
+            there = places[m]
+            here.add_transition(Transition(there, key=key, direction=direction))
+            there.add_transition(Transition(here, key=key, direction=back))
+
+
+class _GeneratedGameType(type):
+    "The type of the classes made by ``generated_game``."
+
+
+class GeneratedGame(Game, metaclass=_GeneratedGameType):
+    """
+    A game in a synthetic world. The world is built by the first game of the
+    class and shared by the games after it, as with ``shared_world``.
+    """
+
+    spec = WorldSpec()
+
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__(ATTRIBUTES[0], input_strategy, view, rng)
+        self.attributes = PlayerAttributes({ATTRIBUTES[0]: 100, **dict.fromkeys(ATTRIBUTES[1:], 0)})
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        return generate_world(self.spec)[0]
+
+
+_game_classes: dict[WorldSpec, type[GeneratedGame]] = {GeneratedGame.spec: GeneratedGame}
+
+
+def generated_game(spec: WorldSpec) -> type[GeneratedGame]:
+    "The game class playing in the world `spec` describes. The same spec gives the same class."
+    cls = _game_classes.get(spec)
+    if cls is None:
+        cls = _game_classes[spec] = _GeneratedGameType(
+            "GeneratedGame", (GeneratedGame,), {"spec": spec, "__module__": __name__}
+        )
+    return cls
+
+
+# The classes are pickled as their specs, so simulator workers, however started, can make them
+copyreg.pickle(_GeneratedGameType, lambda cls: (generated_game, (cls.spec,)))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Build a synthetic world, and optionally play it.")
+    for spec_field in fields(WorldSpec):
+        parser.add_argument(
+            f"--{spec_field.name.replace('_', '-')}",
+            type=type(spec_field.default),
+            default=spec_field.default,
+        )
+    parser.add_argument("--runs", type=int, default=0, help="playthroughs to simulate in the world")
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    args = vars(parser.parse_args(argv))
+
+    spec = WorldSpec(**{f.name: args[f.name] for f in fields(WorldSpec)})
+    started = perf_counter()
+    places = generate_world(spec)
+    elapsed = perf_counter() - started
+    exits = sum(len(place.transitions) for place in places)
+    events = len(places) * (spec.events_per_place + spec.chain_depth + spec.else_depth) if spec.events_per_place else 0
+    print(f"{len(places)} places, {exits} exits, {events} events built in {elapsed:.1f} s")
+    print(f"Peak memory: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+
+    if args["runs"]:
+        from .simulator import simulate
+
+        game_class = generated_game(spec)
+        game_class._world = places[0]
+        result = simulate(game_class, args["runs"], max_turns=args["max_turns"], workers=args["workers"], seed=spec.seed)
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+Precompiled world images, opened with ``mmap``.
+
+``compile_world`` writes a world to a flat binary file: a table of strings,
+and arrays of places, exits, items and events that refer to each other by
+number. ``open_world`` maps the file read-only and returns the starting
+place. As with places from a world file, every other place is built the
+first time it is used, and its strings are decoded only then. Opening an
+image takes the same time however large the world is. Processes that open
+the same image share one copy of its pages in the OS page cache.
+
+From the command line, a world file or the world of a game class::
+
+    python -m engine.world_image worlds/ship.json ship.img
+    python -m engine.world_image ship_game:ShipGame ship.img
+
+Transition conditions can't be compiled. Commands in places are stored by
+class and built again without arguments.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import mmap
+import os
+import struct
+from struct import Struct
+
+from .command import Command
+from .event import Event
+from .inventory_item import InventoryItem
+from .place import Place
+from .transition import Transition
+from .world_file import LazyPlace
+
+MAGIC = b"TAWI"
+FORMAT_VERSION = 1
+NONE = 0xFFFF_FFFF  # An absent string or key
+COMMAND = 0x8000_0000  # Marks a command, rather than an event, in a place's events
+
+# The tables of an image, in the order they are written
+_TABLES = ("strings", "string_data", "places", "exits", "items", "events", "changes", "refs", "commands")
+
+_HEADER = Struct("<4sI" + "II" * len(_TABLES))  # magic, version, then each table's offset and count
+_STRING = Struct("<II")  # offset into the string data, length
+# name, description, then the start and count of its events, items and exits
+_PLACE = Struct("<IIIIIIII")
+_EXIT = Struct("<III")  # place, direction, key
+_ITEM = Struct("<IId")  # name, description, acquire probability
+# probability, message, max occurrences, then the start and count of its
+# changes, items, chained events and "else" events
+_EVENT = Struct("<dIqIIIIIIII")
+_CHANGE = Struct("<I?")  # attribute name, whether the value is a float
+_CHANGE_VALUE = {False: Struct("<q"), True: Struct("<d")}
+_CHANGE_SIZE = _CHANGE.size + 8
+_U32 = Struct("<I")
+
+
+class _Compiler:
+    "Numbers everything reachable from a place and packs it into tables."
+
+    def __init__(self, start: Place):
+        self.strings: dict[str, int] = {}
+        self.tables: dict[str, list[bytes]] = {name: [] for name in _TABLES[2:]}
+        self.refs: list[int] = []  # Lists of events and items, found by their start and count
+        self.place_ids: dict[int, int] = {id(start): 0}
+        self.places = [start]
+        # Keyed by id(), as items and events compare by value
+        self.item_ids: dict[int, int] = {}
+        self.event_ids: dict[int, int] = {}
+        self.command_ids: dict[type, int] = {}
+
+        for place in self.places:  # Grows as new places are reached
+            self._add_place(place)
+
+    def string(self, text: str | None) -> int:
+        if text is None:
+            return NONE
+        number = self.strings.get(text)
+        if number is None:
+            number = self.strings[text] = len(self.strings)
+        return number
+
+    def ref_list(self, numbers: list[int]) -> tuple[int, int]:
+        start = len(self.refs)
+        self.refs.extend(numbers)
+        return start, len(numbers)
+
+    def _add_place(self, place: Place):
+        events = self.ref_list([
+            self._command(e) if isinstance(e, Command) else self._event(e) for e in place.events
+        ])
+        items = self.ref_list([self._item(i) for i in place.inventory_items])
+        exits = self.tables["exits"]
+        exits_start = len(exits)
+        for transition in place.transitions:
+            if transition.condition is not None:
+                raise ValueError(f"The exit from {place.name} to {transition.place.name} has a condition")
+            target = self.place_ids.get(id(transition.place))
+            if target is None:
+                target = self.place_ids[id(transition.place)] = len(self.places)
+                self.places.append(transition.place)
+            key = NONE if transition.key is None else self._item(transition.key)
+            exits.append(_EXIT.pack(target, self.string(transition.direction), key))
+        self.tables["places"].append(_PLACE.pack(
+            self.string(place.name), self.string(place._description),
+            *events, *items, exits_start, len(place.transitions),
+        ))
+
+    def _item(self, item: InventoryItem) -> int:
+        number = self.item_ids.get(id(item))
+        if number is None:
+            items = self.tables["items"]
+            number = self.item_ids[id(item)] = len(items)
+            items.append(_ITEM.pack(
+                self.string(item.name), self.string(item.description), item.acquire_probability
+            ))
+        return number
+
+    def _event(self, event: Event) -> int:
+        # An event is stored after the events it chains, so they are visited first
+        stack = [(event, False)]
+        while stack:
+            current, ready = stack.pop()
+            if id(current) in self.event_ids:
+                continue
+            if not ready:
+                stack.append((current, True))
+                stack.extend((e, False) for e in (*current.chained_events, *current.else_events))
+                continue
+            changes = self.tables["changes"]
+            changes_start = len(changes)
+            for name, value in current.condition_change.items():
+                is_float = isinstance(value, float)
+                changes.append(_CHANGE.pack(self.string(name), is_float) + _CHANGE_VALUE[is_float].pack(value))
+            items = self.ref_list([self._item(i) for i in current.inventory_items])
+            chained = self.ref_list([self.event_ids[id(e)] for e in current.chained_events])
+            otherwise = self.ref_list([self.event_ids[id(e)] for e in current.else_events])
+            events = self.tables["events"]
+            self.event_ids[id(current)] = len(events)
+            events.append(_EVENT.pack(
+                current.probability, self.string(current.message), current.remaining_occurrences,
+                changes_start, len(changes) - changes_start, *items, *chained, *otherwise,
+            ))
+        return self.event_ids[id(event)]
+
+    def _command(self, command: Command) -> int:
+        cls = type(command)
+        number = self.command_ids.get(cls)
+        if number is None:
+            commands = self.tables["commands"]
+            number = self.command_ids[cls] = len(commands)
+            commands.append(_U32.pack(self.string(f"{cls.__module__}:{cls.__qualname__}")))
+        return number | COMMAND
+
+    def sections(self) -> list[tuple[bytes, int]]:
+        "Each table as bytes, with the number of entries in it."
+        data = bytearray()
+        index = []
+        for text in self.strings:  # Every string has been numbered by now
+            encoded = text.encode()
+            index.append(_STRING.pack(len(data), len(encoded)))
+            data += encoded
+        self.tables["refs"] = [_U32.pack(n) for n in self.refs]
+        return [(b"".join(index), len(index)), (bytes(data), len(data))] + [
+            (b"".join(self.tables[name]), len(self.tables[name])) for name in _TABLES[2:]
+        ]
+
+
+def compile_world(start: Place, path: str | os.PathLike):
+    "Writes the world reachable from `start` to an image file at `path`."
+    sections = _Compiler(start).sections()
+    header = [MAGIC, FORMAT_VERSION]
+    offset = _HEADER.size
+    for section, count in sections:
+        header += [offset, count]
+        offset += len(section)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(*header))
+        for section, _ in sections:
+            file.write(section)
+
+
+class ImagePlace(LazyPlace):
+    "A place from a world image, built the first time anything but its name is asked for."
+
+    __slots__ = ("_number",)
+
+    def __init__(self, name: str, loader: ImageLoader, number: int):
+        super().__init__(name, loader)
+        self._number = number
+
+
+class ImageLoader:
+    """
+    Builds the places of a world image from the mapped file as they are
+    needed. Each place, item and event is built once, so places share them
+    as they did in the compiled world.
+
+    :param path: the image file, as written by ``compile_world``
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        with open(path, "rb") as file:
+            self._image = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, *tables = _HEADER.unpack_from(self._image)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{os.fspath(path)!r} is not a world image, or one from an unsupported version")
+        self._offsets = dict(zip(_TABLES, tables[::2]))
+        self.place_count = tables[_TABLES.index("places") * 2 + 1]
+        self._places: dict[int, ImagePlace] = {}
+        self._items: dict[int, InventoryItem] = {}
+        self._events: dict[int, Event] = {}
+        self._commands: dict[int, type[Command]] = {}
+        self.start = self.place(0)
+
+    def _unpack(self, layout: Struct, table: str, number: int) -> tuple:
+        return layout.unpack_from(self._image, self._offsets[table] + number * layout.size)
+
+    def _string(self, number: int) -> str | None:
+        if number == NONE:
+            return None
+        offset, length = self._unpack(_STRING, "strings", number)
+        start = self._offsets["string_data"] + offset
+        return str(self._image[start:start + length], "utf-8")
+
+    def _refs(self, start: int, count: int) -> tuple[int, ...]:
+        return struct.unpack_from(f"<{count}I", self._image, self._offsets["refs"] + start * 4)
+
+    def place(self, number: int) -> ImagePlace:
+        "The place numbered `number`, which is built when first used."
+        place = self._places.get(number)
+        if place is None:
+            name = self._string(self._unpack(_PLACE, "places", number)[0])
+            place = self._places[number] = ImagePlace(name, self, number)
+        return place
+
+    def build(self, place: ImagePlace):
+        "Fills in a place from its record in the image."
+        (_, description, events_start, event_count, items_start, item_count,
+         exits_start, exit_count) = self._unpack(_PLACE, "places", place._number)
+        Place.__init__(
+            place,
+            place.name,
+            self._string(description),
+            [self._event_or_command(n) for n in self._refs(events_start, event_count)],
+            [self._item(n) for n in self._refs(items_start, item_count)],
+        )
+        for n in range(exits_start, exits_start + exit_count):
+            target, direction, key = self._unpack(_EXIT, "exits", n)
+            place.add_transition(Transition(
+                self.place(target),
+                key=None if key == NONE else self._item(key),
+                direction=self._string(direction),
+            ))
+
+    def _item(self, number: int) -> InventoryItem:
+        item = self._items.get(number)
+        if item is None:
+            name, description, acquire_probability = self._unpack(_ITEM, "items", number)
+            item = self._items[number] = InventoryItem(
+                self._string(name), self._string(description), acquire_probability
+            )
+        return item
+
+    def _event_or_command(self, number: int) -> Event | Command:
+        if not number & COMMAND:
+            return self._event(number)
+        number &= ~COMMAND
+        cls = self._commands.get(number)
+        if cls is None:
+            module_name, _, name = self._string(self._unpack(_U32, "commands", number)[0]).partition(":")
+            cls = self._commands[number] = getattr(importlib.import_module(module_name), name)
+        return cls()
+
+    def _event(self, number: int) -> Event:
+        event = self._events.get(number)
+        if event is not None:
+            return event
+        (probability, message, max_occurrences, changes_start, change_count, items_start, item_count,
+         chained_start, chained_count, else_start, else_count) = self._unpack(_EVENT, "events", number)
+        change = {}
+        offset = self._offsets["changes"] + changes_start * _CHANGE_SIZE
+        for _ in range(change_count):
+            name, is_float = _CHANGE.unpack_from(self._image, offset)
+            change[self._string(name)] = _CHANGE_VALUE[is_float].unpack_from(self._image, offset + _CHANGE.size)[0]
+            offset += _CHANGE_SIZE
+        event = self._events[number] = Event(probability, self._string(message), change, max_occurrences)
+        if item_count:
+            event.add_items(*(self._item(n) for n in self._refs(items_start, item_count)))
+        if chained_count:
+            event.chain(*(self._event(n) for n in self._refs(chained_start, chained_count)))
+        if else_count:
+            event.add_else_events(*(self._event(n) for n in self._refs(else_start, else_count)))
+        return event
+
+
+def open_world(path: str | os.PathLike) -> Place:
+    """
+    Maps a world image, returning the place where the player starts. Other
+    places are built from the image as the player reaches them.
+    """
+    return ImageLoader(path).start
+
+
+def main(argv: list[str] | None = None):
+    from .simulator import load_game_class
+    from .view import NullView
+    from .world_file import load_world
+
+    parser = argparse.ArgumentParser(description="Compile a world to an image file.")
+    parser.add_argument("source", help="a world file, or a Game subclass as module:ClassName")
+    parser.add_argument("image", help="the image file to write")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.source):
+        start = load_world(args.source)
+    else:
+        start = load_game_class(args.source)(None, NullView()).shared_world()
+    compile_world(start, args.image)
+    loader = ImageLoader(args.image)
+    print(f"{loader.place_count} places written to {args.image}, {os.path.getsize(args.image)} bytes")
+
+
+if __name__ == "__main__":
+    main()
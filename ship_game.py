@@ -41,18 +41,20 @@ class VisitFriendsCommand(Command):
 
 
 class ShipGame(Game):
+    snapshot_fields = ('friend_visits',)
+
     # CHANGED: The constructor now accepts the strategy and view from the launcher.
-    def __init__(self, input_strategy, view):
+    def __init__(self, input_strategy, view, rng=None):
         # CHANGED: Pass all required arguments to the parent Game class.
         # The main attribute for this game is 'Health'.
-        super().__init__('Health', input_strategy, view)
+        super().__init__('Health', input_strategy, view, rng)
         
         # NEW: Custom game state is initialized here.
         self.friend_visits = 0
         
         # This will be set by the _define_world method.
         self.attributes = PlayerAttributes({'Health': 100})
-        self.location = self._define_world()
+        self.location = self.shared_world()
 
     def _define_world(self) -> Place:
         """Creates and connects all the places in the game."""
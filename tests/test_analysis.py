@@ -0,0 +1,76 @@
+import sys
+
+from engine.analysis import WorldGraph, analyze
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.transition import Transition
+from engine.view import NullView
+from engine.world_file import WorldLoader
+from tests.test_world_file import WORLD
+
+
+class TestAnalysis:
+
+    def setup_method(self):
+        Game("Health", None, NullView())  # Sets the default attribute for events
+        self.key, self.crown = InventoryItem("Key", "A small key."), InventoryItem("Crown", "Lost forever.")
+        self.hall, self.cellar, self.vault, self.throne, self.pit = (
+            Place(name) for name in ("Hall", "Cellar", "Vault", "Throne Room", "Pit")
+        )
+        self.hall.add_transitions(self.cellar, reverse=True)
+        self.hall.add_transition(Transition(self.vault, key=self.key))
+        self.vault.add_transitions(self.hall)
+        self.vault.add_transition(Transition(self.throne, key=self.crown))
+        self.throne.add_transitions(self.vault)
+        self.cellar.add_transition(Transition(self.pit))  # No way back
+        finding = Event(1, "You find a key.", 0)
+        finding.chain(Event(1, "It glints.", 0))
+        finding.chained_events[0].add_items(self.key)
+        self.cellar.add_events(finding)
+
+    def test_keys_found_in_play_open_their_regions(self):
+        # ACT
+        report = analyze(self.hall)
+
+        # ASSERT
+        assert report.places == 5
+        assert report.unreachable == []
+        assert report.unreachable_in_play == ["Throne Room"]
+        assert report.gated_regions == {"Key": ["Throne Room", "Vault"], "Crown": ["Throne Room"]}
+        assert report.unobtainable_keys == ["Crown"]
+        assert report.problems == ["Place 'Throne Room' can't be reached", "Key 'Crown' can't be obtained"]
+
+    def test_one_way_exits_and_trapping_places_are_found(self):
+        # ACT
+        report = analyze(self.hall)
+
+        # ASSERT
+        assert report.one_way_exits == [("Cellar", "Pit")]
+        assert report.trapping == ["Pit"]
+        assert (report.components, report.largest_component) == (2, 4)
+
+    def test_places_linked_to_nothing_are_unreachable(self):
+        # ARRANGE
+        world = dict(WORLD, places=dict(WORLD["places"], Attic={"exits": ["Hall"]}))
+        loader = WorldLoader(world)
+
+        # ACT
+        report = analyze(loader.start, [loader.place(name) for name in loader.place_names])
+
+        # ASSERT
+        assert report.unreachable == ["Attic"]
+
+    def test_long_paths_need_no_recursion(self):
+        # ARRANGE
+        places = [Place(f"Room {n}") for n in range(sys.getrecursionlimit() * 2)]
+        for here, there in zip(places, places[1:]):
+            here.add_transitions(there)
+        places[-1].add_transitions(places[0])
+
+        # ACT
+        components = WorldGraph(places[0]).components()
+
+        # ASSERT
+        assert [len(c) for c in components] == [len(places)]
@@ -0,0 +1,91 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.game import Game
+from engine.place import Place
+from engine.event import Event
+from engine.player_attributes import PlayerAttributes
+from engine.command import QuitCommand
+from engine.view import NullView
+from engine.batch import BatchAttributes, BatchEvents
+
+
+class TestBatchEvents:
+
+    def setup_method(self):
+        self.game = Game("Health", None, NullView())
+        self.game.attributes = PlayerAttributes({"Health": 100})
+
+    def make_place(self) -> Place:
+        """A place whose events only use certain or impossible probabilities."""
+        certain = Event(1, "A sure thing.", -5, max_occurrences=2)
+        certain.chain(Event(1, "It keeps going.", {"Luck": 1}))
+        certain.add_else_events(Event(1, "Consolation.", 3))
+
+        never = Event(0, "Never happens.", -100)
+        never.add_else_events(Event(1, "Instead, this.", {"Luck": 2}))
+
+        return Place("Room", events=[certain, never, QuitCommand()])
+
+    def test_batch_matches_scalar_processing_over_several_turns(self):
+        # ARRANGE: A scalar place and a batch of 4 sessions of an identical one.
+        scalar_place = self.make_place()
+        batch = BatchEvents.from_place(self.make_place())
+        remaining = batch.new_remaining(4)
+
+        for turn in range(4):
+            # ACT
+            before = dict(self.game.attributes.attribs)
+            scalar_place.process_events(self.game)
+            deltas, fired = batch.process(remaining, np.random.default_rng(turn))
+
+            # ASSERT: Every session saw the same changes as the scalar game.
+            for name, column in zip(batch.attribute_names, deltas.T):
+                expected = self.game.attributes.attribs.get(name, 0) - before.get(name, 0)
+                assert (column == expected).all()
+
+    def test_max_occurrences_are_tracked_per_session(self):
+        # ARRANGE
+        batch = BatchEvents([Event(1, "Once only.", -1, max_occurrences=1)])
+        remaining = batch.new_remaining(3)
+        remaining[0, 0] = 0 # The first session has already used it up
+
+        # ACT
+        first, _ = batch.process(remaining)
+        second, _ = batch.process(remaining)
+
+        # ASSERT
+        assert first[:, 0].tolist() == [0, -1, -1]
+        assert second[:, 0].tolist() == [0, 0, 0]
+
+    def test_probabilities_match_on_average(self):
+        # ARRANGE
+        event = Event(0.3, "Sometimes.", 1)
+        event.add_else_events(Event(0.5, "Otherwise, sometimes.", {"Luck": 1}))
+        batch = BatchEvents([event])
+
+        # ACT
+        deltas, _ = batch.process(batch.new_remaining(100_000), np.random.default_rng(0))
+
+        # ASSERT: P(Health) = 0.3, P(Luck) = 0.7 * 0.5
+        health, luck = deltas.mean(axis=0)
+        assert health == pytest.approx(0.3, abs=0.01)
+        assert luck == pytest.approx(0.35, abs=0.01)
+
+    def test_batch_attributes_follow_the_games_schema(self):
+        # ARRANGE
+        place = self.make_place()
+        batch = BatchEvents.from_place(self.make_place(), self.game.attribute_schema)
+        attributes = BatchAttributes(self.game.attributes, 3)
+        remaining = batch.new_remaining(3)
+
+        for turn in range(3):
+            # ACT
+            place.process_events(self.game)
+            deltas, _ = batch.process(remaining, np.random.default_rng(turn))
+            attributes += deltas
+
+            # ASSERT
+            assert (attributes["Health"] == self.game.attributes["Health"]).all()
+            assert attributes.session(2) == self.game.attributes
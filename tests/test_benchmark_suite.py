@@ -0,0 +1,45 @@
+import json
+
+from benchmarks import suite
+
+
+class TestBenchmarkSuite:
+
+    def test_only_benchmarks_slower_than_the_threshold_allows_regress(self):
+        # ARRANGE
+        baselines = {"steady": 10.0, "slower": 10.0, "much slower": 10.0}
+        timings = {"steady": 9.0, "slower": 12.0, "much slower": 13.0, "new": 99.0}
+
+        # ACT
+        slower = suite.regressions(timings, baselines, threshold=0.25)
+
+        # ASSERT
+        assert slower == ["much slower"]
+
+    def test_saving_replaces_the_timed_baselines_and_keeps_the_rest(self, tmp_path):
+        # ARRANGE
+        path = tmp_path / "baselines.json"
+        path.write_text(json.dumps({"kept": 1.0, "replaced": 2.0}))
+
+        # ACT
+        suite.save_baselines(str(path), {"replaced": 3.14159, "added": 4.0})
+
+        # ASSERT
+        assert json.loads(path.read_text()) == {"added": 4.0, "kept": 1.0, "replaced": 3.142}
+
+    def test_the_suite_fails_when_a_benchmark_has_become_slower(self, tmp_path, monkeypatch):
+        # ARRANGE: A benchmark that gets slower once it has a baseline.
+        path = str(tmp_path / "baselines.json")
+        work = [1000]
+        monkeypatch.setitem(suite.BENCHMARKS, "fake.sum", lambda: lambda: sum(range(work[0])))
+        args = ["--baselines", path, "--only", "fake.", "--repeat", "3", "--seconds", "0.01"]
+
+        # ACT
+        saved = suite.main(args + ["--save"])
+        unchanged = suite.main(args + ["--threshold", "10"])
+        work[0] = 100_000
+        slowed = suite.main(args + ["--retries", "0"])
+
+        # ASSERT
+        assert (saved, unchanged, slowed) == (0, 0, 1)
+        assert list(json.loads(open(path).read())) == ["fake.sum"]
@@ -55,7 +55,8 @@ class TestCommands:
         result = command.execute(self.game)
 
         # ASSERT: Check if the world changed in the way we expected.
-        assert self.key not in self.start_room.inventory_items # Key should be gone from room
+        assert self.key not in self.game.state.items_in(self.start_room) # Key should be gone from room
+        assert self.key in self.start_room.inventory_items # ...for this player only
         assert self.key in self.game.inventory # Key should be in player's inventory
         assert result.message == "You take the key." # The result message should be correct
 
@@ -70,7 +71,8 @@ class TestCommands:
         result = command.execute(self.game)
 
         # ASSERT: Check the results.
-        assert self.sword in self.start_room.inventory_items # Sword should now be in the room
+        assert self.sword in self.game.state.items_in(self.start_room) # Sword should now be in the room
+        assert self.sword not in self.start_room.inventory_items # ...for this player only
         assert self.sword not in self.game.inventory # Sword should be gone from player
         assert result.message == "You drop the sword."
 
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+import sys
+
+from engine.dumper import dump_csv, dump_dot, dump_event, dump_jsonl, dump_place
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.transition import Transition
+from engine.view import NullView
+
+
+class TestDumper:
+
+    def setup_method(self):
+        Game("Health", None, NullView())  # Sets the default attribute for events
+        self.key = InventoryItem("Key", "A small key.")
+        self.hall, self.cellar, self.vault = Place("Hall"), Place("Cellar"), Place("Vault")
+        draft = Event(1, "A draft.", -1)
+        draft.chain(Event(1, "You shiver.", {"Luck": -1}))
+        draft.add_else_events(Event(1, "All is still.", 0))
+        self.hall.add_events(draft)
+        self.hall.add_transition(Transition(self.cellar, direction="down"))
+        self.hall.add_transition(Transition(self.vault, key=self.key))
+        self.cellar.add_transition(Transition(self.hall, direction="up"))
+        self.cellar.add_item(self.key)
+
+    def test_text_lists_each_place_once_with_its_events(self):
+        # ARRANGE
+        out = io.StringIO()
+
+        # ACT
+        dump_place(self.hall, out)
+
+        # ASSERT
+        assert out.getvalue() == (
+            "Hall\n"
+            "\tA draft., Health: -1\n"
+            "\t\tElse All is still., Health: 0\n"
+            "\t\tYou shiver., Luck: -1\n"
+            "\tTransition: Cellar (down)\n"
+            "\tTransition: Vault, needs Key\n"
+            "Cellar\n"
+            "\tItem: Key, Acquire probability: 1\n"
+            "\tTransition: Hall (up)\n"
+            "Vault\n"
+        )
+
+    def test_graph_formats_number_places_as_they_are_reached(self):
+        # ARRANGE
+        jsonl, dot, table = io.StringIO(), io.StringIO(), io.StringIO()
+
+        # ACT
+        dump_jsonl(self.hall, jsonl)
+        dump_dot(self.hall, dot)
+        dump_csv(self.hall, table)
+
+        # ASSERT
+        places = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        assert [p["name"] for p in places] == ["Hall", "Cellar", "Vault"]
+        assert places[0]["exits"][1] == {"to": 2, "direction": None, "key": "Key"}
+        assert [(e["message"], e.get("after"), e.get("else")) for e in places[0]["events"]] == [
+            ("A draft.", None, None), ("All is still.", 0, True), ("You shiver.", 0, False)
+        ]
+        assert '  p0 -> p1 [label="down"];\n' in dot.getvalue()
+        assert dot.getvalue().endswith("  p2 [label=\"Vault\"];\n}\n")
+        rows = list(csv.reader(io.StringIO(table.getvalue())))
+        assert rows[1:] == [
+            ["0", "Hall", "1", "Cellar", "down", ""],
+            ["0", "Hall", "2", "Vault", "", "Key"],
+            ["1", "Cellar", "0", "Hall", "up", ""],
+        ]
+
+    def test_deep_worlds_and_event_chains_need_no_recursion(self):
+        # ARRANGE
+        depth = sys.getrecursionlimit() * 2
+        places = [Place(f"Room {n}") for n in range(depth)]
+        for here, there in zip(places, places[1:]):
+            here.add_transition(Transition(there))
+        events = [Event(1, f"Step {n}.", 1) for n in range(depth)]
+        for event, next_event in reversed(list(zip(events, events[1:]))):  # From the end, so no owners are told
+            event.chain(next_event)
+        out = io.StringIO()
+
+        # ACT
+        dump_csv(places[0], out)
+        dump_event(events[0], out=out)
+
+        # ASSERT
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 1 + (depth - 1) + depth
+        assert lines[-1] == "\t" * depth + f"Step {depth - 1}., Health: 1"
@@ -0,0 +1,135 @@
+from engine.game import Game
+from engine.place import Place
+from engine.event import Event
+from engine.inventory_item import InventoryItem
+from engine.player_attributes import PlayerAttributes
+from engine.command import QuitCommand
+from engine.view import View
+
+
+class RecordingView(View):
+    """A view that remembers the messages it is asked to render."""
+    def __init__(self):
+        self.messages = []
+
+    def render_scene(self, *args, **kwargs): pass
+    def render_player_state(self, *args, **kwargs): pass
+    def render_message(self, message):
+        self.messages.append(message)
+
+
+class TestEventProgram:
+
+    def setup_method(self):
+        self.view = RecordingView()
+        self.game = Game("Health", None, self.view)
+        self.game.attributes = PlayerAttributes({"Health": 100})
+
+    def test_program_follows_chains_and_else_events(self):
+        # ARRANGE
+        gem = InventoryItem("gem", "A glowing gem.")
+        found = Event(1, "You find a gem.", {"Luck": 1}, max_occurrences=1)
+        found.add_items(gem)
+        found.chain(Event(1, "It cuts you.", -5))
+        found.add_else_events(Event(1, "Nothing here now.", 0))
+        room = Place("Room", events=[found, QuitCommand(), Event(0, "Never.", -100)])
+
+        # ACT: The first event occurs once, then its "else" event takes over.
+        room.process_events(self.game)
+        room.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs == {"Health": 95, "Luck": 1}
+        assert self.game.inventory == [gem]
+        assert self.view.messages == [
+            "You find a gem.   Luck: +1",
+            "It cuts you.   Health: -5",
+            "Nothing here now.   Health: 0",
+        ]
+
+    def test_program_is_rebuilt_when_the_tree_changes(self):
+        # ARRANGE
+        event = Event(1, "Rain.", -1)
+        room = Place("Room", events=[event])
+        room.process_events(self.game)
+
+        # ACT: Chain an event after the place has already been processed.
+        event.chain(Event(1, "Thunder.", -2))
+        room.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs["Health"] == 100 - 1 - 1 - 2
+
+    def test_program_reads_event_fields_when_it_runs(self):
+        # ARRANGE
+        event = Event(0, "A lucky find.", 5)
+        room = Place("Room", events=[event])
+        room.process_events(self.game)
+
+        # ACT: Tune the event after the program was compiled.
+        event.probability = 1
+        room.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs["Health"] == 105
+
+    def test_only_the_changed_tree_is_rebuilt(self):
+        # ARRANGE
+        here, elsewhere = Event(1, "Here.", 0), Event(1, "Elsewhere.", 0)
+        room, other_room = Place("Room", events=[here]), Place("Other", events=[elsewhere])
+        room.process_events(self.game)
+        other_room.process_events(self.game)
+        program = room._event_program
+
+        # ACT
+        elsewhere.chain(Event(1, "Later.", 0))
+
+        # ASSERT
+        assert room._event_program is program
+        assert other_room._event_program is None
+
+    def test_unlikely_events_occur_as_often_when_scheduled(self):
+        # ARRANGE
+        rare = Event(0.05, "A rare find.", {"Luck": 1}, max_occurrences=10**9)
+        room = Place("Room", events=[rare])
+
+        # ACT
+        for _ in range(20000):
+            room.process_events(self.game)
+
+        # ASSERT: About 1000, to well within four standard deviations.
+        assert room._event_program.scheduled == [0]
+        assert 880 <= self.game.attributes.attribs["Luck"] <= 1120
+
+    def test_scheduled_events_run_in_order_and_use_up_occurrences(self):
+        # ARRANGE
+        first = Event(0.05, "First.", 0, max_occurrences=2)
+        first.chain(Event(1, "Chained.", 0))
+        room = Place("Room", events=[first, Event(1, "Second.", 0), Event(0.05, "Third.", 0, max_occurrences=1)])
+
+        # ACT
+        for _ in range(2000):
+            room.process_events(self.game)
+
+        # ASSERT
+        assert room._event_program.scheduled == [0, 3]
+        assert self.view.messages.count("First.   Health: 0") == 2
+        assert self.view.messages.count("Chained.   Health: 0") == 2
+        assert self.view.messages.count("Third.   Health: 0") == 1
+        turns = " ".join(self.view.messages).split("Second.   Health: 0")
+        assert all(turn.find("First") <= turn.find("Chained") for turn in turns)
+        assert all("Third" not in turn or turn.strip().startswith("Third") for turn in turns)
+
+    def test_scheduled_events_are_rescheduled_when_tuned(self):
+        # ARRANGE
+        event = Event(1e-9, "A lucky find.", 5, max_occurrences=10**9)
+        room = Place("Room", events=[event])
+        room.process_events(self.game)
+
+        # ACT: Once drawn, the schedule would not have it occur for ages.
+        event.probability = 0.09
+        for _ in range(500):
+            room.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs["Health"] > 100
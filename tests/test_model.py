@@ -0,0 +1,33 @@
+from engine.event import Event
+from engine.game import Game
+from engine.place import Place
+from engine.inventory_item import InventoryItem
+from engine.view import NullView
+
+
+class TestCompactModel:
+
+    def setup_method(self):
+        Game("Health", None, NullView())  # Sets the default attribute for events
+
+    def test_events_with_the_same_changes_share_them(self):
+        # ACT
+        first, second = Event(0.5, "Rain.", {"Luck": -1}), Event(0.1, "Hail.", {"Luck": -1})
+
+        # ASSERT
+        assert first.condition_change is second.condition_change
+        assert first.chained_events is second.else_events == ()
+        assert not hasattr(first, "__dict__")
+
+    def test_places_share_empty_parts_until_they_are_given_their_own(self):
+        # ARRANGE
+        hall, cellar = Place("Hall"), Place("Cellar")
+
+        # ACT
+        cellar.add_item(InventoryItem("coal", "A lump of coal."))
+
+        # ASSERT
+        assert hall.transitions == () and hall.events == ()
+        assert [i.name for i in cellar.inventory_items] == ["coal"]
+        assert hall.inventory_items == []
+        assert hall.description == "You are in Hall."
@@ -0,0 +1,76 @@
+from engine.event import Event
+from engine.game import Game
+from engine.place import Place
+from engine.player_attributes import AttributeSchema, PlayerAttributes
+from engine.view import NullView
+
+
+class OtherGame(Game):
+    pass
+
+
+class TestPlayerAttributes:
+
+    def setup_method(self):
+        self.game = Game("Health", None, NullView())
+        self.game.attributes = PlayerAttributes({"Luck": 0.5, "Health": 10})
+
+    def test_attributes_are_laid_out_by_the_games_schema(self):
+        # ARRANGE
+        other = OtherGame("Health", None, NullView())
+
+        # ACT
+        other.attributes = PlayerAttributes({"Courage": 3, "Health": 1})
+
+        # ASSERT
+        assert self.game.attribute_schema is Game("Health", None, NullView()).attribute_schema
+        assert other.attribute_schema is not self.game.attribute_schema
+        assert other.attribute_schema.names[:2] == ["Health", "Courage"]
+        assert other.attributes.values[:2] == [1, 3]
+        assert str(self.game.attributes) == "Health: 10, Luck: 0.5"
+
+    def test_names_still_work_for_games_own_commands(self):
+        # ARRANGE
+        attribs = self.game.attributes.attribs
+
+        # ACT
+        attribs["Health"] += 5
+        attribs["Gold"] = 2
+
+        # ASSERT
+        assert attribs == {"Health": 15, "Luck": 0.5, "Gold": 2}
+        assert self.game.attributes["Gold"] == 2
+        assert "Courage" not in attribs and attribs.get("Courage", 0) == 0
+
+    def test_merges_add_slot_by_slot_and_keep_the_target(self):
+        # ARRANGE
+        schema = AttributeSchema(["Health", "Luck"])
+        total = PlayerAttributes({"Health": 1}, schema)
+        change = PlayerAttributes({"Luck": 2, "Health": -1}, schema)
+
+        # ACT
+        result = total
+        result += change
+        result += PlayerAttributes()
+        result += {"Luck": 1}
+
+        # ASSERT
+        assert result is total
+        assert total.values == [0, 3]
+        assert change.layout(AttributeSchema(["Luck"])) == ((1, -1), (0, 2))
+
+    def test_programs_and_recursive_processing_agree(self):
+        # ARRANGE
+        event = Event(1, "A gust.", {"Luck": -1, "Wind": 2})
+        event.chain(Event(1, "Cold.", -1))
+        place = Place("Moor", events=[event])
+        processed = Game("Health", None, NullView())
+        processed.attributes = PlayerAttributes({"Health": 10, "Luck": 0.5})
+
+        # ACT
+        place.process_events(self.game)
+        processed.attributes += event.process(processed)
+
+        # ASSERT
+        assert self.game.attributes == processed.attributes
+        assert self.game.attributes.attribs == {"Health": 9, "Luck": -0.5, "Wind": 2}
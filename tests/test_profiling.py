@@ -0,0 +1,94 @@
+import json
+
+from engine.command import GoCommand, QuitCommand, TakeCommand
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.profiling import PHASES, TurnProfile
+from engine.simulator import simulate
+from engine.strategies import InputStrategy
+from engine.transition import Transition
+from engine.view import NullView
+
+
+class ScriptedStrategy(InputStrategy):
+    """Plays a fixed list of commands."""
+    def __init__(self, *commands):
+        self.commands = list(commands)
+
+    def get_action(self, game, view):
+        return self.commands.pop(0)
+
+
+class TinyGame(Game):
+    """A hall with a lamp in it, and a cellar below where it drips."""
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__("Health", input_strategy, view, rng)
+        self.attributes = PlayerAttributes({"Health": 30})
+
+        self.lamp = InventoryItem("lamp", "A lamp.")
+        hall = Place("Hall", "A hall.", inventory_items=[self.lamp])
+        self.cellar = Place("Cellar", "A damp cellar.", [Event(1, "Drip.", 0)])
+        hall.add_transitions(Transition(self.cellar, direction="down"), reverse=True)
+        self.location = hall
+
+
+class TestTurnProfile:
+
+    def test_profile_times_each_phase_and_counts_commands_and_events(self):
+        # ARRANGE
+        strategy = ScriptedStrategy()
+        game = TinyGame(strategy, NullView())
+        strategy.commands = [TakeCommand(game.lamp), GoCommand(game.location.transitions[0]), QuitCommand()]
+        game.profile = TurnProfile()
+
+        # ACT
+        game.play()
+
+        # ASSERT: The drip is heard on the turn the player quits in the cellar.
+        profile = game.profile
+        assert profile.turns == 3
+        assert all(profile.wall[phase] > 0 for phase in PHASES)
+        assert {name: stats.count for name, stats in profile.commands.items()} == {
+            "TakeCommand": 1, "GoCommand": 1, "QuitCommand": 1,
+        }
+        assert profile.events_fired == {"Cellar": 1}
+
+    def test_profile_exports_json_and_prometheus(self, tmp_path):
+        # ARRANGE
+        profile = TurnProfile()
+        timer = profile.timer()
+        timer.start()
+        timer.events_fired('The "Quoted" Room', 2)
+        timer.lap("events")
+        timer.command(QuitCommand())
+
+        # ACT
+        profile.write(str(tmp_path / "turns.json"))
+        profile.write(str(tmp_path / "turns.prom"))
+
+        # ASSERT
+        exported = json.loads((tmp_path / "turns.json").read_text())
+        assert exported["turns"] == 1
+        assert exported["commands"]["QuitCommand"]["count"] == 1
+        assert exported["commands"]["QuitCommand"]["buckets"]["+Inf"] == 1
+        assert exported["events_fired"] == {'The "Quoted" Room': 2}
+
+        lines = (tmp_path / "turns.prom").read_text().splitlines()
+        assert "game_turns_total 1" in lines
+        assert 'game_command_seconds_bucket{command="QuitCommand",le="+Inf"} 1' in lines
+        assert 'game_command_seconds_count{command="QuitCommand"} 1' in lines
+        assert r'game_events_fired_total{place="The \"Quoted\" Room"} 2' in lines
+        buckets = [int(line.split()[-1]) for line in lines if line.startswith("game_command_seconds_bucket")]
+        assert buckets == sorted(buckets)  # Cumulative, as Prometheus has them
+        assert not (tmp_path / "turns.prom.partial").exists()
+
+    def test_simulation_profiles_every_run(self):
+        # ACT
+        result = simulate(TinyGame, 6, max_turns=10, workers=1, seed=2, profile=True)
+
+        # ASSERT: Each run plays its ten turns, then quits in an eleventh.
+        assert result.profile.turns == sum(turns * runs for turns, runs in result.turns.items()) + 6
+        assert sum(stats.count for stats in result.profile.commands.values()) == result.profile.turns
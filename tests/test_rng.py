@@ -0,0 +1,84 @@
+import pytest
+
+from engine.rng import Rng
+
+
+class TestRng:
+
+    def test_same_seed_gives_same_stream(self):
+        # ARRANGE
+        first, second = Rng(42), Rng(42)
+
+        # ACT: Draw enough numbers to cross several pre-drawn chunks.
+        count = Rng.CHUNK_SIZE * 3 + 5
+        first_draws = [first.random() for _ in range(count)]
+        second_draws = [second.random() for _ in range(count)]
+
+        # ASSERT
+        assert first_draws == second_draws
+        assert all(0 <= x < 1 for x in first_draws)
+        assert first.position == count
+
+    def test_state_can_be_saved_and_restored(self):
+        # ARRANGE: Advance the stream to the middle of a chunk and save it.
+        rng = Rng(7)
+        for _ in range(Rng.CHUNK_SIZE + 10):
+            rng.random()
+        state = rng.getstate()
+        expected = [rng.random() for _ in range(20)]
+
+        # ACT
+        restored = Rng()
+        restored.setstate(state)
+
+        # ASSERT
+        assert [restored.random() for _ in range(20)] == expected
+
+    def test_children_are_reproducible_and_independent(self):
+        # ARRANGE
+        parent = Rng(1)
+
+        # ACT
+        first_child, second_child = parent.split(), parent.split()
+
+        # ASSERT
+        assert first_child.seed == Rng(1).child(0).seed
+        assert first_child.random() != second_child.random()
+
+    def test_randint_stays_within_bounds(self):
+        # ARRANGE
+        rng = Rng(3)
+
+        # ACT
+        values = {rng.randint(-10, 20) for _ in range(5000)}
+
+        # ASSERT
+        assert values == set(range(-10, 21))
+
+    def test_negative_seeds_are_rejected(self):
+        # ACT & ASSERT
+        with pytest.raises(ValueError):
+            Rng(-1)
+
+    def test_restored_state_does_not_repeat_child_streams(self):
+        # ARRANGE
+        rng = Rng(5)
+        used = rng.split()
+        state = rng.getstate()
+
+        # ACT
+        restored = Rng()
+        restored.setstate(state)
+
+        # ASSERT
+        assert restored.split().seed != used.seed
+
+    def test_nothing_is_drawn_until_a_number_is_asked_for(self):
+        # ACT
+        rng = Rng(9, position=Rng.CHUNK_SIZE + 3)
+
+        # ASSERT
+        assert rng._current is None
+        assert rng.position == Rng.CHUNK_SIZE + 3
+        assert rng.random() == Rng(9, position=Rng.CHUNK_SIZE + 3).random()
+        assert rng.position == Rng.CHUNK_SIZE + 4
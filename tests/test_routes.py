@@ -0,0 +1,125 @@
+from engine.command import TravelCommand
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.routes import routes_for
+from engine.strategies import CliInputStrategy
+from engine.transition import Transition
+from engine.view import View
+
+
+class RecordingView(View):
+    "Keeps what would be shown, and types the lines it is given."
+
+    def __init__(self, *lines: str):
+        self.lines = list(lines)
+        self.scenes = []
+        self.messages = []
+
+    def render_scene(self, description, exits, items):
+        self.scenes.append(description)
+
+    def render_player_state(self, *args): pass
+
+    def render_message(self, message):
+        self.messages.append(message)
+
+    def get_raw_command(self) -> str:
+        return self.lines.pop(0)
+
+
+class CastleGame(Game):
+    "A hall, with a long way and a short way round to a garden, and a locked vault."
+    gate_open = True
+    key = InventoryItem("Key", "A small key.")
+
+    def __init__(self, view=None):
+        super().__init__("Health", CliInputStrategy(), view or RecordingView())
+        self.attributes = PlayerAttributes({"Health": 10})
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        hall, gallery, tower, gate, garden, vault = (
+            Place(name, f"The {name.lower()}.") for name in ("Hall", "Gallery", "Tower", "Gate", "Garden", "Vault")
+        )
+        hall.add_transitions(gallery, tower, reverse=True)
+        gallery.add_transitions(garden, reverse=True)
+        tower.add_transitions(gate, reverse=True)
+        tower.add_transition(Transition(vault, key=self.key))
+        vault.add_transitions(tower)
+        gate.add_transition(Transition(garden, condition=lambda: CastleGame.gate_open))
+        return hall
+
+
+class TestRoutes:
+
+    def setup_method(self):
+        CastleGame.gate_open = True
+        if "_world" in CastleGame.__dict__:  # Each test changes its own world
+            del CastleGame._world
+        self.game = CastleGame()
+        self.routes = routes_for(self.game)
+
+    def test_routes_are_shortest_and_honour_keys_and_conditions(self):
+        # ARRANGE
+        vault, garden = self.routes.find("vault"), self.routes.find("GARD")
+
+        # ACT
+        locked = self.routes.route(self.game, vault)
+        self.game.inventory.append(CastleGame.key)
+        unlocked = self.routes.route(self.game, vault)
+        self.game.location = self.routes.find("gate")
+        through_gate = self.routes.route(self.game, garden)
+        CastleGame.gate_open = False
+        round_about = self.routes.route(self.game, garden)
+
+        # ASSERT
+        assert locked is None
+        assert [t.place.name for t in unlocked] == ["Tower", "Vault"]
+        assert [t.place.name for t in through_gate] == ["Garden"]
+        assert [t.place.name for t in round_about] == ["Tower", "Hall", "Gallery", "Garden"]
+
+    def test_tables_are_kept_until_the_map_changes(self):
+        # ARRANGE
+        garden = self.routes.find("Garden")
+        table = self.routes.next_exits(self.game, garden)
+
+        # ACT
+        again = self.routes.next_exits(self.game, garden)
+        self.game.location.add_transitions(Transition(garden, direction="down"))
+        rebuilt = self.routes.next_exits(self.game, garden)
+
+        # ASSERT
+        assert again is table
+        assert rebuilt is not table
+        assert [t.place.name for t in self.routes.route(self.game, garden)] == ["Garden"]
+
+    def test_travel_is_one_turn_with_one_render(self):
+        # ARRANGE
+        view = RecordingView("travel to garden")
+        game = CastleGame(view)
+
+        # ACT
+        command = game.input_strategy.get_action(game, view)
+        game._apply(command)
+
+        # ASSERT
+        assert isinstance(command, TravelCommand)
+        assert game.location.name == "Garden"
+        assert view.scenes == ["The garden."]
+        assert view.messages == ["You travel to Garden, 2 steps away."]
+
+    def test_unknown_and_unreachable_places_are_reported(self):
+        # ARRANGE
+        view = RecordingView("travel to moon", "travel vault")
+        game = CastleGame(view)
+
+        # ACT
+        command = game.input_strategy.get_action(game, view)
+        result = command.execute(game)
+
+        # ASSERT
+        assert view.messages == ["You don't know of a place called 'moon'."]
+        assert result.message == "You can't find a way to Vault from here."
+        assert game.location.name == "Hall"
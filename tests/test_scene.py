@@ -0,0 +1,85 @@
+from engine.command import DropCommand, GoCommand, TakeCommand
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.transition import Transition
+from engine.view import View
+
+
+class RecordingView(View):
+    "Keeps every scene and player panel it is given."
+
+    def __init__(self):
+        self.scenes = []
+        self.panels = []
+
+    def render_scene(self, description, exits, items):
+        self.scenes.append((description, exits, items))
+
+    def render_player_state(self, inventory, attributes):
+        self.panels.append((inventory, attributes))
+
+    def render_message(self, message): pass
+
+
+class TestSceneCache:
+
+    def setup_method(self):
+        self.lamp = InventoryItem("Lamp", "A brass lamp.")
+        self.cellar = Place("Cellar", "A damp cellar.")
+        self.hall = Place("Hall", "A hall.", inventory_items=[self.lamp])
+        self.hall.add_transitions(Transition(self.cellar, direction="down"), reverse=True)
+        self.view = RecordingView()
+        self.game = Game("Health", None, self.view)
+        self.game.attributes = PlayerAttributes({"Health": 10})
+        self.game.location = self.hall
+
+    def test_looking_again_reuses_everything(self):
+        # ARRANGE
+        self.game._render_full_scene()
+
+        # ACT
+        self.game._render_full_scene()
+
+        # ASSERT
+        (_, exits, items), (_, exits_again, items_again) = self.view.scenes
+        (inventory, attributes), (inventory_again, attributes_again) = self.view.panels
+        assert (exits, items, inventory, attributes) == (["Cellar (down)"], ["Lamp"], [], "Health: 10")
+        assert exits_again is exits and items_again is items
+        assert inventory_again is inventory and attributes_again is attributes
+
+    def test_only_the_changed_parts_are_rebuilt(self):
+        # ARRANGE
+        self.game._render_full_scene()
+        (_, exits, _), = self.view.scenes
+        (_, attributes), = self.view.panels
+
+        # ACT
+        TakeCommand(self.lamp).execute(self.game)
+        self.game._render_full_scene()
+        self.game.attributes.attribs["Health"] -= 1  # As games' own commands do
+        self.hall.add_transitions(Place("Garden"))
+        self.game._render_full_scene()
+
+        # ASSERT
+        assert self.view.scenes[1] == ("A hall.", ["Cellar (down)"], [])
+        assert self.view.scenes[1][1] is exits
+        assert self.view.panels[1] == (["Lamp"], "Health: 10")
+        assert self.view.panels[1][1] is attributes
+        assert self.view.scenes[2][1] == ["Cellar (down)", "Garden"]
+        assert self.view.panels[2][1] == "Health: 9"
+
+    def test_moving_and_dropping_show_the_new_room(self):
+        # ARRANGE
+        TakeCommand(self.lamp).execute(self.game)
+        self.game._render_full_scene()
+
+        # ACT
+        GoCommand(self.hall.transitions[0]).execute(self.game)
+        DropCommand(self.lamp).execute(self.game)
+        self.game._render_full_scene()
+
+        # ASSERT
+        assert self.view.scenes[-1] == ("A damp cellar.", ["Hall (up)"], ["Lamp"])
+        assert self.view.panels[-1] == ([], "Health: 10")
@@ -0,0 +1,112 @@
+import io
+import re
+
+from engine.rng import Rng
+from engine.screen import ScreenView
+from engine.strategies import RandomInputStrategy
+from ship_game import ShipGame
+
+
+class Terminal:
+    "Follows the few escape sequences ScreenView sends, keeping the characters on the screen."
+
+    SEQUENCE = re.compile(r"\x1b\[([\d;]*)([HJKmr])|(\n)|([^\x1b\n]+)")
+
+    def __init__(self, width: int, height: int):
+        self.width, self.height = width, height
+        self.rows = [[" "] * width for _ in range(height)]
+        self.row = self.column = 0
+        self.top, self.bottom = 0, height - 1
+
+    def feed(self, output: str):
+        for match in self.SEQUENCE.finditer(output):
+            arguments, command, newline, text = match.groups()
+            numbers = [int(n) for n in arguments.split(";") if n] if arguments else []
+            if text:
+                for char in text:
+                    self.rows[self.row][self.column] = char
+                    self.column = min(self.column + 1, self.width - 1)
+            elif newline:
+                if self.row == self.bottom:
+                    del self.rows[self.top]
+                    self.rows.insert(self.bottom, [" "] * self.width)
+                else:
+                    self.row += 1
+            elif command == "H":
+                self.row, self.column = numbers[0] - 1, numbers[1] - 1
+            elif command == "J":
+                self.rows = [[" "] * self.width for _ in range(self.height)]
+            elif command == "K":
+                start = 0 if numbers == [2] else self.column
+                self.rows[self.row][start:] = [" "] * (self.width - start)
+            elif command == "r":
+                self.top, self.bottom = (numbers[0] - 1, numbers[1] - 1) if numbers else (0, self.height - 1)
+                self.row = self.column = 0
+
+    def line(self, row: int) -> str:
+        return "".join(self.rows[row])
+
+
+class TestScreenView:
+
+    def setup_method(self):
+        self.out = io.StringIO()
+        self.view = ScreenView(self.out, size=(60, 20))
+        self.view.render_scene("A hall.", ["Cellar (down)"], ["Lamp"])
+        self.view.render_player_state([], "Health: 10")
+        self.view.flush()
+        self.out.seek(0)
+        self.out.truncate()
+
+    def test_only_changed_cells_are_sent(self):
+        # ARRANGE
+        items = []
+
+        # ACT
+        self.view.render_scene("A hall.", ["Cellar (down)"], ["Lamp"])
+        self.view.flush()
+        unchanged = self.out.getvalue()
+        self.view.render_scene("A hall.", ["Cellar (down)"], items)
+        self.view.render_player_state(["Lamp"], "Health: 10")
+        self.view.flush()
+
+        # ASSERT
+        assert unchanged == ""
+        assert "A hall." not in self.out.getvalue()
+        assert "Lamp" in self.out.getvalue()
+        assert len(self.out.getvalue()) < 80
+
+    def test_the_message_log_is_scrolled_not_written_again(self):
+        # ARRANGE
+        self.view.render_message("First.")
+        self.view.flush()
+
+        # ACT
+        self.view.render_message("Second.")
+        self.view.flush("> ")
+
+        # ASSERT
+        output = self.out.getvalue()
+        assert output.count("First.") == 1
+        assert "\x1b[15;18r" in output
+        assert output.endswith("\x1b[19;1H\x1b[2K\x1b[0;35;1m> ")
+
+    def test_the_terminal_shows_what_the_view_renders(self):
+        # ARRANGE
+        terminal = Terminal(80, 24)
+        out = io.StringIO()
+        view = ScreenView(out, size=(80, 24))
+        game = ShipGame(RandomInputStrategy(), view, rng=Rng(3))
+        game.attributes.attribs["Health"] = 10**9
+
+        # ACT
+        for _ in range(300):
+            game._process_events()
+            game._apply(game.input_strategy.get_action(game, view))
+            view.flush()
+            terminal.feed(out.getvalue())
+            out.seek(0)
+            out.truncate()
+
+            # ASSERT
+            assert [terminal.line(row) for row in range(len(view._lines))] == [text for text, _ in view._lines]
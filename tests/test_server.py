@@ -0,0 +1,80 @@
+import asyncio
+
+from engine.game import Game
+from engine.place import Place
+from engine.inventory_item import InventoryItem
+from engine.player_attributes import PlayerAttributes
+from engine.transition import Transition
+from engine.server import GameServer
+from engine.client import run_client, run_bots
+
+
+class TinyGame(Game):
+    """A hall with a lamp in it, and a cellar below."""
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__("Health", input_strategy, view, rng)
+        self.attributes = PlayerAttributes({"Health": 30})
+
+        hall = Place("Hall", "A hall.", inventory_items=[InventoryItem("lamp", "A lamp.")])
+        cellar = Place("Cellar", "A damp cellar.")
+        hall.add_transitions(Transition(cellar, direction="down"), reverse=True)
+        self.location = hall
+
+
+async def serve_while(game_server, client):
+    "Runs `client(port)` against a freshly started server, returning its result."
+    server = await game_server.start()
+    async with server:
+        return await client(server.sockets[0].getsockname()[1])
+
+
+class TestGameServer:
+
+    def test_each_connection_plays_its_own_game(self):
+        # ARRANGE
+        game_server = GameServer(TinyGame, seed=1)
+
+        async def two_players(port):
+            return await asyncio.gather(
+                run_client("127.0.0.1", port, ["take lamp", "i", "quit"]),
+                run_client("127.0.0.1", port, ["down", "i", "quit"]),
+            )
+
+        # ACT
+        taker, explorer = asyncio.run(serve_while(game_server, two_players))
+
+        # ASSERT: Taking the lamp in one game leaves it in the other.
+        assert "You are carrying: lamp" in taker
+        assert "A damp cellar." in explorer
+        assert "You aren't carrying anything." in explorer
+        assert taker.endswith("Goodbye!\n") and explorer.endswith("Goodbye!\n")
+
+    def test_many_concurrent_sessions_report_their_turn_latency(self):
+        # ARRANGE
+        game_server = GameServer(TinyGame, seed=2)
+
+        async def bots(port):
+            return await run_bots("127.0.0.1", port, 200, 5, ["look", "down", "up", "i"])
+
+        # ACT
+        client_latency = asyncio.run(serve_while(game_server, bots))
+
+        # ASSERT
+        assert len(client_latency.samples) == 200 * 5
+        assert game_server.active_sessions == 0
+        assert len(game_server.latency.samples) == 200 * 5
+
+    def test_menu_sessions_choose_by_number(self):
+        # ARRANGE
+        game_server = GameServer(TinyGame, menu=True, seed=3)
+
+        async def player(port):
+            return await run_client("127.0.0.1", port, ["9", "2"])
+
+        # ACT
+        transcript = asyncio.run(serve_while(game_server, player))
+
+        # ASSERT: The menu is "Go to Cellar", "Take lamp", "Quit game".
+        assert "2. Take lamp" in transcript
+        assert "Invalid choice." in transcript
+        assert "You take the lamp." in transcript
@@ -0,0 +1,59 @@
+from engine.game import Game
+from engine.place import Place
+from engine.event import Event
+from engine.inventory_item import InventoryItem
+from engine.player_attributes import PlayerAttributes
+from engine.command import TakeCommand
+from engine.view import NullView
+
+
+class SharedGame(Game):
+    """A game whose one room, holding a coin and a one-off gift, is shared by every session."""
+    def __init__(self, input_strategy=None, view=None, rng=None):
+        super().__init__("Health", input_strategy, view or NullView(), rng)
+        self.attributes = PlayerAttributes({"Health": 100})
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        coin = InventoryItem("coin", "A gold coin.")
+        return Place("Vault", inventory_items=[coin], events=[Event(1, "A gift!", 5, max_occurrences=1)])
+
+
+class TestSessionState:
+
+    def test_sessions_share_one_world(self):
+        # ACT
+        first, second = SharedGame(), SharedGame()
+
+        # ASSERT
+        assert first.location is second.location
+        assert first.state.items == {} and first.state.remaining == {}
+
+    def test_moved_items_are_seen_only_by_the_player_who_moved_them(self):
+        # ARRANGE
+        first, second = SharedGame(), SharedGame()
+        vault = first.location
+        coin = vault.inventory_items[0]
+
+        # ACT
+        TakeCommand(coin).execute(first)
+
+        # ASSERT
+        assert first.state.items_in(vault) == []
+        assert second.state.items_in(vault) == [coin]
+        assert vault.inventory_items == [coin]
+        assert list(first.state.items) == [vault] # Only the changed place is copied
+
+    def test_used_up_occurrences_are_counted_per_session(self):
+        # ARRANGE
+        first, second = SharedGame(), SharedGame()
+
+        # ACT: The gift may only be given once per player.
+        first.location.process_events(first)
+        first.location.process_events(first)
+        second.location.process_events(second)
+
+        # ASSERT
+        assert first.attributes.attribs["Health"] == 105
+        assert second.attributes.attribs["Health"] == 105
+        assert first.location.events[0].remaining_occurrences == 1
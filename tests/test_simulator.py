@@ -0,0 +1,49 @@
+from engine.game import Game
+from engine.place import Place
+from engine.event import Event
+from engine.player_attributes import PlayerAttributes
+from engine.transition import Transition
+from engine.simulator import simulate
+
+
+class TinyGame(Game):
+    """A two-room game where staying in the cellar is certain to hurt."""
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__("Health", input_strategy, view, rng)
+        self.attributes = PlayerAttributes({"Health": 30})
+
+        hall = Place("Hall", "A hall.")
+        cellar = Place("Cellar", "A damp cellar.", [Event(1, "You catch a cold.", -10)])
+        hall.add_transitions(Transition(cellar, direction="down"), reverse=True)
+        self.location = hall
+
+
+class TestSimulator:
+
+    def test_simulation_aggregates_every_run(self):
+        # ACT
+        result = simulate(TinyGame, 20, max_turns=50, workers=1, seed=7)
+
+        # ASSERT
+        assert result.runs == 20
+        assert sum(result.turns.values()) == 20
+        assert sum(result.attributes["Health"].values()) == 20
+        assert result.place_visits["Hall"] >= 20 # Every run starts in the hall
+
+    def test_events_can_end_a_simulated_game(self):
+        # ACT: With 50 turns, the random walker is sure to reach the cellar.
+        result = simulate(TinyGame, 10, max_turns=50, workers=1, seed=1)
+
+        # ASSERT: The cold eventually takes all of the player's health.
+        assert result.losses == 10
+        assert set(result.attributes["Health"]) == {0}
+        assert max(result.turns) < 50
+
+    def test_seeded_runs_do_not_depend_on_the_worker_count(self):
+        # ACT
+        in_process = simulate(TinyGame, 12, max_turns=20, workers=1, seed=3)
+        in_pool = simulate(TinyGame, 12, max_turns=20, workers=2, seed=3)
+
+        # ASSERT
+        assert in_process.runs == 12
+        assert in_process == in_pool
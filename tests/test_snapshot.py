@@ -0,0 +1,102 @@
+import pytest
+
+from engine.game import Game
+from engine.place import Place
+from engine.event import Event
+from engine.inventory_item import InventoryItem
+from engine.player_attributes import PlayerAttributes
+from engine.transition import Transition
+from engine.command import TakeCommand, GoCommand
+from engine.rng import Rng
+from engine.view import NullView
+from engine.snapshot import save_snapshot, load_snapshot
+
+
+class VaultGame(Game):
+    """A hall and a vault, with a coin to take and a one-off gift in the hall."""
+    snapshot_fields = ("visits", "title")
+
+    def __init__(self, input_strategy=None, view=None, rng=None):
+        super().__init__("Health", input_strategy, view or NullView(), rng)
+        self.attributes = PlayerAttributes({"Health": 100, "Luck": 0.5})
+        self.visits = 0
+        self.title = None
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        hall = Place("Hall", events=[Event(1, "A gift!", 5, max_occurrences=1), Event(0, "Never.", 1)])
+        vault = Place("Vault", inventory_items=[InventoryItem("coin", "A gold coin.")])
+        hall.add_transitions(Transition(vault, direction="down"), reverse=True)
+        return hall
+
+
+class OtherGame(VaultGame):
+    def _define_world(self) -> Place:
+        return Place("Elsewhere")
+
+
+def play_a_little(game: Game):
+    "Takes the coin from the vault, uses up the gift, and draws a few numbers."
+    hall = game.location
+    hall.process_events(game)
+    GoCommand(hall.transitions[0]).execute(game)
+    TakeCommand(game.location.inventory_items[0]).execute(game)
+    game.visits, game.title = 3, "Vault raider"
+    game.rng.random()
+
+
+class TestSnapshots:
+
+    def test_a_restored_session_matches_the_saved_one(self):
+        # ARRANGE
+        saved = VaultGame(rng=Rng(11))
+        play_a_little(saved)
+
+        # ACT
+        restored = VaultGame()
+        load_snapshot(restored, save_snapshot(saved))
+
+        # ASSERT
+        assert restored.location is saved.location
+        assert restored.inventory == saved.inventory
+        assert restored.attributes == saved.attributes
+        assert restored.state.items == saved.state.items
+        assert restored.state.remaining == saved.state.remaining
+        assert restored.rng.getstate() == saved.rng.getstate()
+        assert (restored.visits, restored.title) == (3, "Vault raider")
+
+    def test_deltas_hold_only_what_changed(self):
+        # ARRANGE
+        untouched, played = VaultGame(), VaultGame()
+        play_a_little(played)
+
+        # ACT
+        sizes = {
+            "untouched delta": len(save_snapshot(untouched)),
+            "played delta": len(save_snapshot(played)),
+            "played full": len(save_snapshot(played, delta=False)),
+        }
+
+        # ASSERT
+        assert sizes["untouched delta"] < sizes["played delta"] < sizes["played full"]
+
+    def test_full_snapshots_restore_to_the_same_state(self):
+        # ARRANGE
+        saved = VaultGame()
+        play_a_little(saved)
+
+        # ACT
+        restored = VaultGame()
+        load_snapshot(restored, save_snapshot(saved, delta=False))
+
+        # ASSERT: Places and events that are as defined are left out of the overlay.
+        assert restored.state.items == saved.state.items
+        assert restored.state.remaining == saved.state.remaining
+
+    def test_snapshots_only_load_into_their_own_world(self):
+        # ARRANGE
+        data = save_snapshot(VaultGame())
+
+        # ACT & ASSERT
+        with pytest.raises(ValueError):
+            load_snapshot(OtherGame(), data)
@@ -0,0 +1,36 @@
+from benchmarks.bench_startup import import_times
+
+# Loaded only by the games, views and tools that use them
+LAZY = ("asyncio", "colorama", "concurrent.futures", "hashlib", "json", "engine.colorama_view", "engine.screen")
+
+# The most the engine's own modules, and the game's, may take to import, in
+# microseconds: several times what they take on a slow machine
+IMPORT_BUDGET = 250_000
+
+
+class TestStartup:
+
+    def test_importing_a_game_leaves_optional_subsystems_unloaded(self):
+        # ACT
+        times = import_times("ship_game")
+
+        # ASSERT
+        names = {name for _, _, name in times}
+        assert "engine.game" in names
+        assert [name for name in names if name.startswith(LAZY)] == []
+
+    def test_the_engine_imports_within_its_budget(self):
+        # ACT
+        times = import_times("ship_game")
+
+        # ASSERT
+        own = sum(own for own, _, name in times if name.startswith("engine") or name == "ship_game")
+        assert own < IMPORT_BUDGET
+
+    def test_a_view_loaded_on_demand_is_found_where_it_always_was(self):
+        # ACT
+        from engine.view import ColoramaView
+        from engine.colorama_view import ColoramaView as loaded
+
+        # ASSERT
+        assert ColoramaView is loaded
@@ -7,10 +7,10 @@ from engine.player_attributes import PlayerAttributes
 from engine.transition import Transition
 
 # We are testing the strategy, so we need to import it.
-from engine.strategies import CliInputStrategy
+from engine.strategies import CliInputStrategy, MenuInputStrategy
 
 # We are checking the command objects it returns.
-from engine.command import TakeCommand, GoCommand, InventoryCommand
+from engine.command import TakeCommand, DropCommand, GoCommand, InventoryCommand
 
 # We need a mock view that we can program with fake user input.
 from engine.view import View
@@ -99,4 +99,124 @@ class TestCliInputStrategy:
         result_command = self.strategy.get_action(self.game, self.mock_view)
 
         # ASSERT
-        assert isinstance(result_command, InventoryCommand)
\ No newline at end of file
+        assert isinstance(result_command, InventoryCommand)
+
+    def test_parser_handles_go_by_place_name_among_many_exits(self):
+        """
+        Tests if typing "go <place>" finds the right exit in a crowded room.
+        """
+        # ARRANGE: Add lots of other exits, before and after the index is first used.
+        self.start_room.add_transitions(*(Place(f"Closet {n}") for n in range(500)))
+        self.mock_view.set_next_command("go closet 250")
+        self.strategy.get_action(self.game, self.mock_view)
+        self.start_room.add_transitions(Place("Secret Garden"))
+        self.mock_view.set_next_command("go secret garden")
+
+        # ACT
+        result_command = self.strategy.get_action(self.game, self.mock_view)
+
+        # ASSERT
+        assert isinstance(result_command, GoCommand)
+        assert result_command.transition.place.name == "Secret Garden"
+
+    def test_parser_sees_items_moved_by_commands(self):
+        """
+        Tests if the parser's item lookup follows items being taken and dropped.
+        """
+        # ARRANGE: Take the key, so it is no longer in the room.
+        self.mock_view.set_next_command("take key")
+        self.strategy.get_action(self.game, self.mock_view).execute(self.game)
+
+        # ACT & ASSERT: It can't be taken again...
+        assert self.strategy.get_action(self.game, self.mock_view) is None
+
+        # ...until it has been dropped.
+        DropCommand(self.key).execute(self.game)
+        result_command = self.strategy.get_action(self.game, self.mock_view)
+        assert isinstance(result_command, TakeCommand)
+        assert result_command.item == self.key
+
+    def test_parser_picks_the_first_exit_whose_name_matches(self):
+        """
+        Tests if a partial name matching several exits picks the one added first.
+        """
+        # ARRANGE
+        self.start_room.add_transitions(Place("Bedroom"), Place("Dorm Room"))
+        self.mock_view.set_next_command("go room")
+
+        # ACT
+        result_command = self.strategy.get_action(self.game, self.mock_view)
+
+        # ASSERT: "North Room" was added in setup, before both of the others.
+        assert result_command.transition.place == self.north_room
+
+        # ...and a piece of a word matches too, just like a plain scan.
+        self.mock_view.set_next_command("go edro")
+        assert self.strategy.get_action(self.game, self.mock_view).transition.place.name == "Bedroom"
+
+    def test_parser_handles_drop_from_indexed_inventory(self):
+        """
+        Tests if typing "drop <item>" finds items however they got into the inventory.
+        """
+        # ARRANGE: One item is given at the start, and one is appended later.
+        lamp = InventoryItem("brass lamp", "A dented lamp.")
+        self.game.inventory = [lamp]
+        self.mock_view.set_next_command("drop lamp")
+        assert self.strategy.get_action(self.game, self.mock_view).item == lamp
+        self.game.inventory.append(self.key)
+        self.mock_view.set_next_command("drop key")
+
+        # ACT
+        result_command = self.strategy.get_action(self.game, self.mock_view)
+
+        # ASSERT
+        assert isinstance(result_command, DropCommand)
+        assert result_command.item == self.key
+
+
+class TestMenuInputStrategy:
+
+    def setup_method(self):
+        self.strategy = MenuInputStrategy()
+        self.game = Game("Health", None, ControllableMockView())
+        self.game.attributes = PlayerAttributes({'Health': 100})
+
+        self.key = InventoryItem("key", "A rusty key.")
+        self.start_room = Place("Start Room", "A room.", inventory_items=[self.key])
+        self.start_room.add_transitions(Place("North Room"))
+        self.game.location = self.start_room
+
+    def test_menu_is_reused_while_nothing_changes(self):
+        # ARRANGE
+        first_menu = self.strategy.possible_commands(self.game)
+
+        # ACT
+        second_menu = self.strategy.possible_commands(self.game)
+
+        # ASSERT
+        assert second_menu is first_menu
+        assert [c.description for c in first_menu] == ["Go to North Room", "Take key", "Quit game"]
+
+    def test_menu_is_rebuilt_from_shared_commands_when_items_move(self):
+        # ARRANGE
+        first_menu = self.strategy.possible_commands(self.game)
+        go_north = first_menu[0]
+
+        # ACT: Taking the key changes both the room and the inventory.
+        first_menu[1].execute(self.game)
+        second_menu = self.strategy.possible_commands(self.game)
+
+        # ASSERT
+        assert [c.description for c in second_menu] == ["Go to North Room", "Drop key", "Quit game"]
+        assert second_menu[0] is go_north
+
+    def test_menu_follows_a_replaced_inventory(self):
+        # ARRANGE
+        self.strategy.possible_commands(self.game)
+
+        # ACT
+        self.game.inventory = [InventoryItem("lamp", "A brass lamp.")]
+        menu = self.strategy.possible_commands(self.game)
+
+        # ASSERT
+        assert "Drop lamp" in [c.description for c in menu]
@@ -0,0 +1,125 @@
+import io
+
+import pytest
+
+from engine.event import Event
+from engine.game import Game
+from engine.inventory_item import InventoryItem
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.rng import Rng
+from engine.strategies import CliInputStrategy, MenuInputStrategy
+from engine.transition import Transition
+from engine.turn_log import ReplayDivergence, TurnLog, TurnRecord, read_turn_log, replay
+from engine.view import NullView
+
+
+class LogGame(Game):
+    """A hall with a coin in it and a draughty cellar below."""
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__("Health", input_strategy, view, rng)
+        self.attributes = PlayerAttributes({"Health": 100})
+        self.location = self.shared_world()
+
+    def _define_world(self) -> Place:
+        hall = Place("Hall", inventory_items=[InventoryItem("coin", "A gold coin.")])
+        cellar = Place("Cellar", events=[Event(0.5, "A draught.", -1), Event(0.05, "A rat!", -10)])
+        hall.add_transitions(Transition(cellar, direction="down"), reverse=True)
+        return hall
+
+
+class ColderGame(LogGame):
+    """The same world, but with a colder cellar."""
+    def _define_world(self) -> Place:
+        hall = super()._define_world()
+        hall.transitions[0].place.events[0].probability = 0.9
+        return hall
+
+
+class TypingView(NullView):
+    """A view the player types the given lines into."""
+    def __init__(self, lines):
+        self.lines = iter(lines)
+
+    def get_raw_command(self):
+        return next(self.lines)
+
+
+class ChoosingView(NullView):
+    """A view the player makes the given menu choices in."""
+    def __init__(self, choices):
+        self.choices = iter(choices)
+
+    def get_menu_choice(self, choices):
+        return choices[next(self.choices)]
+
+
+def play_logged(game: Game) -> bytes:
+    out = io.BytesIO()
+    game.turn_log = TurnLog(out)
+    game.play()
+    return out.getvalue()
+
+
+TYPED = ["take coin", "fly", "down", "up", "down", "look", "down", "quit"]
+
+
+class TestTurnLog:
+
+    def test_typed_turns_are_logged(self):
+        # ARRANGE
+        game = LogGame(CliInputStrategy(), TypingView(TYPED), Rng(5))
+
+        # ACT
+        strategy, _, records = read_turn_log(play_logged(game))
+
+        # ASSERT: "fly" names nothing, and there's no way down from the
+        # cellar, so the line after the last "down" is read in the same turn.
+        turns = [TurnRecord.decode(record) for record in records]
+        assert strategy == "engine.strategies:CliInputStrategy"
+        assert [turn.lines for turn in turns] == [
+            ["take coin"], ["fly"], ["down"], ["up"], ["down"], ["look"], ["down", "quit"],
+        ]
+        assert [turn.command for turn in turns] == [
+            "TakeCommand", "", "GoCommand", "GoCommand", "GoCommand", "LookCommand", "QuitCommand",
+        ]
+        assert turns[-1].running is False
+        assert turns[0].rng_position == 0
+        assert sum(turn.changes.get("Health", 0) for turn in turns) == game.attributes["Health"] - 100
+
+    def test_a_logged_session_replays_turn_for_turn(self):
+        # ARRANGE
+        typed = play_logged(LogGame(CliInputStrategy(), TypingView(TYPED), Rng(5)))
+        chosen = play_logged(LogGame(MenuInputStrategy(), ChoosingView([1, 0, 0, 0, 2]), Rng(6)))
+
+        # ACT
+        typed_replay = replay(LogGame, typed)
+        chosen_replay = replay(LogGame, chosen)
+
+        # ASSERT
+        assert typed_replay.turns == 7
+        assert chosen_replay.turns == 5
+        assert [TurnRecord.decode(r).choice for r in read_turn_log(chosen)[2]] == [1, 0, 0, 0, 2]
+
+    def test_replay_stops_at_the_first_turn_that_differs(self):
+        # ARRANGE: Down into the cellar and wait there.
+        lines = ["down"] + ["look"] * 40 + ["quit"]
+        data = play_logged(LogGame(CliInputStrategy(), TypingView(lines), Rng(7)))
+
+        # ACT
+        with pytest.raises(ReplayDivergence) as divergence:
+            replay(ColderGame, data)
+
+        # ASSERT
+        assert 1 < divergence.value.turn <= 42
+        assert "events" in str(divergence.value) or "changes" in str(divergence.value)
+
+    def test_a_log_cut_off_mid_turn_replays_up_to_its_last_whole_turn(self):
+        # ARRANGE
+        data = play_logged(LogGame(CliInputStrategy(), TypingView(TYPED), Rng(5)))
+
+        # ACT
+        result = replay(LogGame, data[:-3])
+
+        # ASSERT
+        assert result.turns == 6
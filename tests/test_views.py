@@ -0,0 +1,70 @@
+import io
+import sys
+
+from benchmarks.bench_views import CountingSink
+from engine.event import Event
+from engine.game import Game
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.view import CliView, ColoramaView, NullView
+
+
+class Recorder(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class TestBufferedViews:
+
+    def test_a_turn_is_written_once_with_the_prompt(self, monkeypatch):
+        # ARRANGE
+        out = Recorder()
+        view = CliView(out)
+        monkeypatch.setattr("builtins.input", lambda: "look")
+
+        # ACT
+        view.render_scene("A hall.", ["Cellar"], ["Key"])
+        view.render_player_state([], "Health: 10")
+        view.render_message("A draft.")
+        line = view.get_raw_command()
+        view.flush()  # Nothing is left to write
+
+        # ASSERT
+        assert line == "look"
+        assert out.writes == 1
+        assert out.getvalue() == (
+            "\n" + "#" * 40 + "\nA hall.\nYou see: Key\nObvious exits are: Cellar\n" + "#" * 40 + "\n"
+            "Attributes: Health: 10\nA draft.\n\n> "
+        )
+
+    def test_colorama_view_leaves_stdout_alone(self):
+        # ARRANGE
+        stdout = sys.stdout
+        sink = CountingSink()
+
+        # ACT
+        view = ColoramaView(sink)
+        view.render_message("Hello.")
+        view.flush()
+
+        # ASSERT
+        assert sys.stdout is stdout
+        assert sink.writes == 1
+
+    def test_null_view_makes_events_skip_their_messages(self, monkeypatch):
+        # ARRANGE
+        game = Game("Health", None, NullView())
+        game.attributes = PlayerAttributes({"Health": 10})
+        game.location = Place("Hall", events=[Event(1, "A draft.", -1)])
+        monkeypatch.setattr(Event, "impact_messages", lambda self: 1 / 0)
+
+        # ACT
+        game.location.process_events(game)
+
+        # ASSERT
+        assert game.attributes.attribs == {"Health": 9}
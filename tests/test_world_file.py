@@ -0,0 +1,114 @@
+from pathlib import Path
+import pytest
+
+from engine.game import Game
+from engine.place import Place
+from engine.command import GoCommand, HelpCommand
+from engine.player_attributes import PlayerAttributes
+from engine.view import NullView
+from engine.world_file import load_world
+from ship_game import ShipGame
+
+WORLD = {
+    "start": "Hall",
+    "attribute": "Health",
+    "items": {"key": {"name": "Iron key", "description": "A heavy key."}},
+    "places": {
+        "Hall": {
+            "events": [
+                {"probability": 1, "message": "A draft.", "change": -1, "max_occurrences": 1,
+                 "chain": [{"probability": 1, "message": "You shiver.", "change": {"Luck": -1}}],
+                 "else": [{"probability": 1, "message": "All is still.", "change": 0}]},
+                {"command": "engine.command:HelpCommand"},
+            ],
+            "exits": [
+                {"to": "Cellar", "direction": "down", "reverse": True},
+                {"to": "Vault", "key": "key"},
+            ],
+        },
+        "Cellar": {"description": "A damp cellar.", "items": ["key"]},
+        "Vault": {"description": "Gold everywhere."},
+    },
+}
+
+
+class TestWorldFile:
+
+    def setup_method(self):
+        self.game = Game("Health", None, NullView())
+        self.game.attributes = PlayerAttributes({"Health": 10})
+
+    def test_places_are_built_when_first_used(self):
+        # ARRANGE
+        hall = load_world(WORLD)
+        cellar = hall.transitions[0].place
+
+        # ACT: Listing the exits needs only their names.
+        names = [t.place.name for t in hall.transitions]
+
+        # ASSERT
+        assert names == ["Cellar", "Vault"]
+        assert not cellar.is_loaded
+        assert cellar.description == "A damp cellar."
+        assert cellar.is_loaded
+
+    def test_exits_lead_back_and_can_need_keys(self):
+        # ARRANGE
+        hall = load_world(WORLD)
+        cellar, vault = (t.place for t in hall.transitions)
+
+        # ACT
+        way_back = cellar.transitions[0]
+
+        # ASSERT
+        assert (way_back.place, way_back.direction) == (hall, "up")
+        assert vault.transitions == ()
+        assert hall.transitions[1].key is cellar.inventory_items[0]
+
+    def test_events_chain_and_branch_and_commands_are_built(self):
+        # ARRANGE
+        hall = load_world(WORLD)
+        self.game.location = hall
+
+        # ACT: The draft happens once; then its "else" event runs.
+        hall.process_events(self.game)
+        hall.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs == {"Health": 9, "Luck": -1}
+        assert isinstance(hall.events[1], HelpCommand)
+
+    def test_unknown_places_are_reported(self):
+        # ARRANGE
+        world = {"start": "Hall", "places": {"Hall": {"exits": ["Nowhere"]}}}
+
+        # ACT & ASSERT
+        with pytest.raises(ValueError, match="Nowhere"):
+            load_world(world)
+
+    def test_the_ship_world_file_matches_the_ship_game(self):
+        # ARRANGE
+        from_code = ShipGame(None, NullView()).location
+
+        # ACT
+        from_file = load_world(Path(__file__).parent.parent / "worlds" / "ship.json")
+
+        # ASSERT: The same places, exits and events, reached the same way.
+        assert describe(from_file) == describe(from_code)
+
+
+def describe(start: Place) -> dict:
+    "Each place's description, events and exits, sorted so the order exits were added doesn't matter."
+    seen, places = {}, [start]
+    for place in places:
+        if place.name in seen:
+            continue
+        seen[place.name] = (
+            place.description,
+            [(e.message, e.probability, dict(e.condition_change.attribs), e.max_occurrences)
+             if hasattr(e, "message") else type(e).__name__ for e in place.events],
+            [i.name for i in place.inventory_items],
+            sorted((t.place.name, t.direction or "", t.key.name if t.key else "") for t in place.transitions),
+        )
+        places.extend(t.place for t in place.transitions)
+    return seen
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from engine.analysis import analyze
+from engine.simulator import simulate
+from engine.world_generator import GeneratedGame, WorldSpec, generate_world, generated_game
+
+
+def describe(places):
+    "Everything about a world that depends on how it was generated."
+    return [
+        (
+            place.name,
+            [item.name for item in place.inventory_items],
+            [(t.place.name, t.direction, t.key and t.key.name) for t in place.transitions],
+            [(e.probability, e.message, len(e.chained_events), len(e.else_events)) for e in place.events],
+        )
+        for place in places
+    ]
+
+
+class TestWorldGenerator:
+
+    def test_the_same_spec_makes_the_same_world(self):
+        # ARRANGE
+        spec = WorldSpec(places=200, seed=3)
+
+        # ACT
+        first, second = generate_world(spec), generate_world(spec)
+        other = generate_world(WorldSpec(places=200, seed=4))
+
+        # ASSERT
+        assert describe(first) == describe(second)
+        assert describe(first) != describe(other)
+
+    def test_a_world_has_the_shape_its_spec_gives_and_can_be_finished(self):
+        # ARRANGE
+        spec = WorldSpec(
+            places=2000, branching=3, directional=0.7, locked=0.2,
+            events_per_place=2, chain_depth=3, else_depth=2, item_density=0.5, seed=1,
+        )
+
+        # ACT
+        places = generate_world(spec)
+
+        # ASSERT: Each place adds about three exits, and each leads back.
+        exits = [t for place in places for t in place.transitions]
+        assert len(places) == 2000
+        assert 2 * 2.9 * 2000 < len(exits) <= 2 * 3 * 2000
+        assert 0.65 < sum(t.direction is not None for t in exits) / len(exits) < 0.75
+        assert 0.1 < sum(t.key is not None for t in exits) / len(exits) < 0.15  # Of the two in three that may be locked
+        for place in places:
+            directions = [t.direction for t in place.transitions if t.direction]
+            assert len(directions) == len(set(directions))
+
+        first = places[0].events[0]
+        assert [len(place.events) for place in places] == [2] * 2000
+        assert first.chained_events[0].chained_events[0].chained_events[0].chained_events == ()
+        assert first.else_events[0].else_events[0].else_events == ()
+
+        # Locked exits are never the only way in, and their keys lie somewhere in the world
+        assert analyze(places[0], places).problems == []
+
+    def test_a_spec_with_fractions_out_of_range_is_refused(self):
+        with pytest.raises(ValueError, match="locked"):
+            WorldSpec(locked=1.5)
+
+    def test_generated_games_can_be_simulated_in_worker_processes(self):
+        # ARRANGE
+        game_class = generated_game(WorldSpec(places=50, seed=2))
+
+        # ACT
+        alone = simulate(game_class, 8, max_turns=30, workers=1, seed=5)
+        in_workers = simulate(game_class, 8, max_turns=30, workers=2, seed=5)
+
+        # ASSERT
+        assert pickle.loads(pickle.dumps(game_class)) is game_class
+        assert generated_game(WorldSpec()) is GeneratedGame
+        assert in_workers == alone
+        assert alone.runs == 8
@@ -0,0 +1,88 @@
+import pytest
+
+from engine.event import Event
+from engine.game import Game
+from engine.command import HelpCommand
+from engine.place import Place
+from engine.player_attributes import PlayerAttributes
+from engine.transition import Transition
+from engine.view import NullView
+from engine.world_file import load_world
+from engine.world_image import compile_world, open_world
+from ship_game import ShipGame
+from tests.test_world_file import WORLD, describe
+
+
+class TestWorldImage:
+
+    def setup_method(self):
+        self.game = Game("Health", None, NullView())
+        self.game.attributes = PlayerAttributes({"Health": 10})
+
+    def test_the_ship_world_survives_compiling(self, tmp_path):
+        # ARRANGE
+        from_code = ShipGame(None, NullView()).location
+        path = tmp_path / "ship.img"
+
+        # ACT
+        compile_world(from_code, path)
+        from_image = open_world(path)
+
+        # ASSERT
+        assert describe(from_image) == describe(from_code)
+
+    def test_places_are_built_when_first_used(self, tmp_path):
+        # ARRANGE
+        compile_world(load_world(WORLD), tmp_path / "world.img")
+        hall = open_world(tmp_path / "world.img")
+
+        # ACT
+        cellar, vault = (t.place for t in hall.transitions)
+
+        # ASSERT
+        assert hall.is_loaded
+        assert (cellar.name, cellar.is_loaded) == ("Cellar", False)
+        assert cellar.transitions[0].place is hall
+        assert hall.transitions[1].key is cellar.inventory_items[0]
+        assert not vault.is_loaded
+
+    def test_events_keep_their_chains_values_and_commands(self, tmp_path):
+        # ARRANGE
+        shared = Event(1, "Shared.", {"Luck": 0.5, "Gold": 2**40})
+        hall, attic = Place("Hall", events=[shared, HelpCommand()]), Place("Attic", events=[shared])
+        hall.add_transitions(attic, reverse=True)
+        compile_world(hall, tmp_path / "world.img")
+
+        # ACT
+        hall = open_world(tmp_path / "world.img")
+        attic = hall.transitions[0].place
+
+        # ASSERT
+        assert attic.events[0] is hall.events[0]
+        assert hall.events[0].condition_change.attribs == {"Luck": 0.5, "Gold": 2**40}
+        assert isinstance(hall.events[1], HelpCommand)
+
+    def test_chained_and_else_events_run(self, tmp_path):
+        # ARRANGE
+        compile_world(load_world(WORLD), tmp_path / "world.img")
+        hall = open_world(tmp_path / "world.img")
+        self.game.location = hall
+
+        # ACT: The draft happens once; then its "else" event runs.
+        hall.process_events(self.game)
+        hall.process_events(self.game)
+
+        # ASSERT
+        assert self.game.attributes.attribs == {"Health": 9, "Luck": -1}
+
+    def test_conditions_and_other_files_are_refused(self, tmp_path):
+        # ARRANGE
+        hall = Place("Hall")
+        hall.add_transition(Transition(Place("Vault"), condition=lambda: False))
+        (tmp_path / "other.img").write_bytes(b"not an image" * 10)
+
+        # ACT & ASSERT
+        with pytest.raises(ValueError, match="condition"):
+            compile_world(hall, tmp_path / "world.img")
+        with pytest.raises(ValueError, match="not a world image"):
+            open_world(tmp_path / "other.img")
@@ -14,15 +14,15 @@ from engine.strategies import MenuInputStrategy, CliInputStrategy
 
 class VerySimple(Game):
     # CHANGED: The constructor now accepts the strategy and view from the launcher.
-    def __init__(self, input_strategy, view):
+    def __init__(self, input_strategy, view, rng=None):
         # CHANGED: Pass all required arguments to the parent Game class.
         # Even though this game doesn't use attributes, the engine needs a default.
         # We'll use 'Health' and just set it to a value that won't end the game.
-        super().__init__('Health', input_strategy, view)
+        super().__init__('Health', input_strategy, view, rng)
         
         # This will be set by the _define_world method.
         self.attributes = PlayerAttributes({'Health': 100})
-        self.location = self._define_world()
+        self.location = self.shared_world()
 
     def _define_world(self) -> Place:
         """Creates and connects all the places in the game."""
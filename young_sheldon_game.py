@@ -1,4 +1,3 @@
-from random import randint
 from time import sleep
 
 from engine.game import Game
@@ -9,7 +8,7 @@ from engine.player_attributes import PlayerAttributes
 from engine.transition import Transition
 from engine.strategies import MenuInputStrategy, CliInputStrategy
 from engine.command import Command, CommandResult
-from engine.view import CliView, MenuView, ColoramaView
+from engine.view import CliView, MenuView
 
 
 class PlayVideoGamesCommand(Command):
@@ -19,7 +18,7 @@ class PlayVideoGamesCommand(Command):
 
     def execute(self, game: "Game") -> CommandResult:
         gaming_skill_change = 5
-        happiness_change = randint(-10, 20)
+        happiness_change = game.rng.randint(-10, 20)
 
         game.attributes.attribs["Gaming Skill"] += gaming_skill_change
         game.attributes.attribs["Happiness"] += happiness_change
@@ -46,8 +45,8 @@ class YoungSheldon(Game):
     introduction: str
     attributes: PlayerAttributes
 
-    def __init__(self, input_strategy, view):
-        super().__init__("Happiness", input_strategy, view)
+    def __init__(self, input_strategy, view, rng=None):
+        super().__init__("Happiness", input_strategy, view, rng)
         self.introduction = "Welcome to Young Sheldon Adventure"
         self.attributes = PlayerAttributes(
             {
@@ -58,10 +57,10 @@ class YoungSheldon(Game):
             }
         )
 
-        home: Place = self._define_game()
+        home: Place = self.shared_world()
         self.location = home
 
-    def _define_game(self) -> Place:
+    def _define_world(self) -> Place:
         home = Place("Home", "You are at home.")
         relaxation_event = Event(0.75, "You play with your trains.", 5)
         relaxation_event.add_else_events(Event(1, "Missy plays loud sad music.", -20))
@@ -148,7 +147,9 @@ if __name__ == "__main__":
     else:  # mode == "2"
         strategy = CliInputStrategy()
         # view = CliView()
-        view = ColoramaView()  # Assuming ColorCliView is defined in engine/view.py
+        from engine.colorama_view import ColoramaView  # Loads colorama only when chosen
+
+        view = ColoramaView()
 
     # Create the game instance with the chosen pair
     game = YoungSheldon(input_strategy=strategy, view=view)